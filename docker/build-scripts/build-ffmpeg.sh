@@ -12,6 +12,11 @@
 #   - 코덱 라이브러리가 이미 빌드되어 있어야 함 (build-codecs.sh)
 #   - CUDA가 설치되어 있어야 함
 #   - 환경 변수 설정: THIRD_PARTY_PATH, FFMPEG_VERSION
+#
+# 최적화 프로파일 (선택, 프리셋 optimization 섹션에서 전달):
+#   - OPT_CFLAGS / OPT_LDFLAGS: 추가 컴파일/링크 플래그
+#   - OPT_LTO=1: --enable-lto
+#   - OPT_PGO=1: 디코드 경로 PGO (계측 빌드 → 학습 디코드 → 재빌드)
 
 set -e  # 에러 발생시 즉시 종료
 
@@ -63,32 +68,85 @@ cd ffmpeg-${FFMPEG_VERSION}
 # -----------------------------------------------------------------------------
 # FFmpeg 빌드 설정
 # -----------------------------------------------------------------------------
+OPT_CFLAGS="${OPT_CFLAGS:-}"
+OPT_LDFLAGS="${OPT_LDFLAGS:-}"
+OPT_LTO="${OPT_LTO:-0}"
+OPT_PGO="${OPT_PGO:-0}"
+
+EXTRA_CONFIGURE_FLAGS=""
+if [ "${OPT_LTO}" = "1" ]; then
+    EXTRA_CONFIGURE_FLAGS="--enable-lto"
+fi
+
+# configure_ffmpeg <추가 CFLAGS> <추가 LDFLAGS>
+configure_ffmpeg() {
+    PATH="${THIRD_PARTY_PATH}/ffmpeg:$PATH" ./configure \
+      --prefix="${THIRD_PARTY_PATH}/ffmpeg_build" \
+      --pkg-config-flags="--static" \
+      --extra-libs="-lpthread -lm" \
+      --ld="g++" \
+      --bindir="${THIRD_PARTY_PATH}/ffmpeg" \
+      --disable-shared \
+      --enable-static \
+      --enable-gpl \
+      --enable-libfdk-aac \
+      --enable-libvpx \
+      --enable-libfreetype \
+      --enable-libmp3lame \
+      --enable-libopus \
+      --enable-libx264 \
+      --enable-libx265 \
+      --enable-cuda \
+      --enable-cuvid \
+      --extra-cflags="-I/usr/local/cuda/include -static ${OPT_CFLAGS} $1" \
+      --extra-ldflags="-L/usr/local/cuda/lib64 -static ${OPT_LDFLAGS} $2" \
+      --enable-nonfree \
+      ${EXTRA_CONFIGURE_FLAGS}
+}
+
 log_info "Configuring FFmpeg build..."
 log_info "  - Static libraries only"
 log_info "  - CUDA/CUVID hardware acceleration"
 log_info "  - Codecs: x264, x265, VP9, AAC, Opus"
+log_info "  - Optimization profile: ${OPT_PROFILE:-baseline} (LTO=${OPT_LTO}, PGO=${OPT_PGO})"
 
-PATH="${THIRD_PARTY_PATH}/ffmpeg:$PATH" ./configure \
-  --prefix="${THIRD_PARTY_PATH}/ffmpeg_build" \
-  --pkg-config-flags="--static" \
-  --extra-libs="-lpthread -lm" \
-  --ld="g++" \
-  --bindir="${THIRD_PARTY_PATH}/ffmpeg" \
-  --disable-shared \
-  --enable-static \
-  --enable-gpl \
-  --enable-libfdk-aac \
-  --enable-libvpx \
-  --enable-libfreetype \
-  --enable-libmp3lame \
-  --enable-libopus \
-  --enable-libx264 \
-  --enable-libx265 \
-  --enable-cuda \
-  --enable-cuvid \
-  --extra-cflags='-I/usr/local/cuda/include -static' \
-  --extra-ldflags='-L/usr/local/cuda/lib64 -static' \
-  --enable-nonfree
+# -----------------------------------------------------------------------------
+# PGO: 계측 빌드 및 디코드 경로 학습
+# -----------------------------------------------------------------------------
+if [ "${OPT_PGO}" = "1" ]; then
+    PGO_DIR="/root/ffmpeg_pgo"
+    PGO_SAMPLES="/root/ffmpeg_pgo_samples"
+    mkdir -p "${PGO_DIR}" "${PGO_SAMPLES}"
+
+    log_info "PGO: building instrumented FFmpeg..."
+    configure_ffmpeg "-fprofile-generate -fprofile-dir=${PGO_DIR} -fprofile-update=atomic" "-fprofile-generate"
+    PATH="${THIRD_PARTY_PATH}/ffmpeg:$PATH" make -j$(nproc) ffmpeg
+
+    # 학습용 샘플 생성 (H.264, HEVC, VP9 - 1080p)
+    log_info "PGO: generating training samples..."
+    ./ffmpeg -hide_banner -loglevel error -f lavfi -i testsrc2=size=1920x1080:rate=30 -t 10 \
+        -c:v libx264 -pix_fmt yuv420p "${PGO_SAMPLES}/sample_h264.mp4"
+    ./ffmpeg -hide_banner -loglevel error -f lavfi -i testsrc2=size=1920x1080:rate=30 -t 10 \
+        -c:v libx265 -pix_fmt yuv420p "${PGO_SAMPLES}/sample_hevc.mp4"
+    ./ffmpeg -hide_banner -loglevel error -f lavfi -i testsrc2=size=1920x1080:rate=30 -t 5 \
+        -c:v libvpx-vp9 -deadline realtime -pix_fmt yuv420p "${PGO_SAMPLES}/sample_vp9.webm"
+
+    # 인코딩 프로파일은 버리고 디코드 경로만 학습
+    find "${PGO_DIR}" -name '*.gcda' -delete
+
+    log_info "PGO: running decode training workload..."
+    for sample in "${PGO_SAMPLES}"/*; do
+        ./ffmpeg -hide_banner -loglevel error -i "${sample}" -f null -
+        ./ffmpeg -hide_banner -loglevel error -i "${sample}" -vf scale=640:360 -pix_fmt bgr24 -f null -
+    done
+
+    log_info "PGO: rebuilding FFmpeg with collected profile..."
+    make distclean
+    configure_ffmpeg "-fprofile-use -fprofile-dir=${PGO_DIR} -fprofile-correction -Wno-missing-profile" ""
+    rm -rf "${PGO_SAMPLES}"
+else
+    configure_ffmpeg "" ""
+fi
 
 # -----------------------------------------------------------------------------
 # FFmpeg 빌드
@@ -128,6 +186,7 @@ ldconfig
 log_info "Cleaning up..."
 cd /root
 rm -rf ~/ffmpeg_sources
+rm -rf /root/ffmpeg_pgo
 
 # -----------------------------------------------------------------------------
 # 설치 확인
@@ -14,6 +14,15 @@
 #   - CUDA/cuDNN이 설치되어 있어야 함
 #   - Python이 설치되어 있어야 함
 #   - 환경 변수 설정: OPENCV_VERSION, CUDA_ARCH
+#
+# 최적화 프로파일 (선택, 프리셋 optimization 섹션에서 전달):
+#   - OPT_CFLAGS / OPT_LDFLAGS: 추가 컴파일/링크 플래그
+#   - OPT_LTO=1: ENABLE_LTO=ON
+#
+# CMake 빌드 시스템 (선택, 프리셋 cmake 섹션에서 전달 - cmake-build-helpers.sh 참고):
+#   - BUILD_GENERATOR: "Unix Makefiles" 또는 "Ninja"
+#   - UNITY_BUILD=1: CMAKE_UNITY_BUILD=ON (실험적, OpenCV 는 공식 지원하지 않음)
+#   - 빌드 시간 및 .ninja_log 를 /usr/local/xaiva_media/build-reports/opencv/ 에 기록
 
 set -e  # 에러 발생시 즉시 종료
 
@@ -41,6 +50,9 @@ log_debug() {
     echo -e "${BLUE}[DEBUG]${NC} $1"
 }
 
+# CMake generator/unity build 설정 및 빌드 시간 기록 함수
+source "$(dirname "$0")/cmake-build-helpers.sh"
+
 # 환경 변수 확인
 if [ -z "${OPENCV_VERSION}" ]; then
     log_error "OPENCV_VERSION is not set"
@@ -68,7 +80,22 @@ log_info "Python library: ${PYTHON_LIB_PATH}"
 log_info "Python include: ${PYTHON_INCLUDE_PATH}"
 log_info "Python packages: ${PYTHON_PACKAGE_PATH}"
 log_info "CUDA toolkit: ${CUDA_TOOLKIT_PATH}"
-log_info "CUDA architecture: ${CUDA_ARCH}"
+
+# CUDA 아키텍처 (CUDA_ARCH: "86" 또는 다중 아키텍처 "70;86")
+#   - CUDA_ARCH_BIN: 모든 아키텍처의 SASS
+#   - CUDA_ARCH_PTX: 최상위 아키텍처의 PTX (신규 GPU 대응 JIT)
+CUDA_ARCH_BIN="$(echo "${CUDA_ARCH}" | tr ';,' '  ' | xargs -n1 | sort -n | xargs)"
+CUDA_ARCH_PTX="$(echo "${CUDA_ARCH_BIN}" | xargs -n1 | tail -n 1)"
+log_info "CUDA architecture: ${CUDA_ARCH_BIN} (PTX: ${CUDA_ARCH_PTX})"
+
+OPT_CFLAGS="${OPT_CFLAGS:-}"
+OPT_LDFLAGS="${OPT_LDFLAGS:-}"
+OPT_ENABLE_LTO=OFF
+if [ "${OPT_LTO:-0}" = "1" ]; then
+    OPT_ENABLE_LTO=ON
+fi
+log_info "Optimization profile: ${OPT_PROFILE:-baseline} (CFLAGS='${OPT_CFLAGS}', LTO=${OPT_ENABLE_LTO})"
+log_info "CMake generator: ${BUILD_GENERATOR} (unity build: ${UNITY_BUILD}, batch size: ${UNITY_BATCH_SIZE})"
 
 # -----------------------------------------------------------------------------
 # OpenCV 다운로드
@@ -99,8 +126,12 @@ mkdir build && cd build
 #   - OPENCV_DNN_CUDA=ON: DNN 모듈에서 CUDA 사용
 #   - BUILD_SHARED_LIBS=OFF: 정적 라이브러리 빌드
 #   - CMAKE_CXX_FLAGS='-D_GLIBCXX_USE_CXX11_ABI=0': PyTorch 호환성
+#   - CMAKE_C(XX)_FLAGS, ENABLE_LTO: 최적화 프로파일 (OPT_*)
+#   - CMAKE_BUILD_SYSTEM_ARGS: generator (-G), unity build
 
-cmake -D CMAKE_BUILD_TYPE=RELEASE \
+CONFIGURE_START=$(now_sec)
+cmake "${CMAKE_BUILD_SYSTEM_ARGS[@]}" \
+  -D CMAKE_BUILD_TYPE=RELEASE \
   -D CMAKE_INSTALL_PREFIX=/usr/local \
   -D WITH_MKL=ON \
   -D WITH_IPP=OFF \
@@ -133,7 +164,11 @@ cmake -D CMAKE_BUILD_TYPE=RELEASE \
   -D PYTHON3_PACKAGES_PATH=${PYTHON_PACKAGE_PATH} \
   -D BUILD_NEW_PYTHON_SUPPORT=ON \
   -D OPENCV_GENERATE_PKGCONFIG=ON \
-  -D CMAKE_CXX_FLAGS='-D_GLIBCXX_USE_CXX11_ABI=0' \
+  -D CMAKE_C_FLAGS="${OPT_CFLAGS}" \
+  -D CMAKE_CXX_FLAGS="-D_GLIBCXX_USE_CXX11_ABI=0 ${OPT_CFLAGS}" \
+  -D CMAKE_EXE_LINKER_FLAGS="${OPT_LDFLAGS}" \
+  -D CMAKE_SHARED_LINKER_FLAGS="${OPT_LDFLAGS}" \
+  -D ENABLE_LTO=${OPT_ENABLE_LTO} \
   -D CUDA_TOOLKIT_ROOT_DIR=${CUDA_TOOLKIT_PATH} \
   -D ENABLE_FAST_MATH=1 \
   -D CUDA_FAST_MATH=1 \
@@ -144,21 +179,27 @@ cmake -D CMAKE_BUILD_TYPE=RELEASE \
   -D CUDA_USE_STATIC_CUDA_RUNTIME=OFF \
   -D OPENCV_DNN_CUDA=ON \
   -D WITH_NVCUVID=ON \
-  -D CUDA_ARCH_BIN=${CUDA_ARCH} \
-  -D CUDA_ARCH_PTX=${CUDA_ARCH} \
+  -D CUDA_ARCH_BIN="${CUDA_ARCH_BIN}" \
+  -D CUDA_ARCH_PTX="${CUDA_ARCH_PTX}" \
   -D BUILD_SHARED_LIBS=OFF ../
+CONFIGURE_SEC=$(elapsed_sec "${CONFIGURE_START}")
 
 # -----------------------------------------------------------------------------
 # OpenCV 빌드
 # -----------------------------------------------------------------------------
 log_info "Building OpenCV (this may take a while)..."
-make -j$(nproc)
+BUILD_START=$(now_sec)
+cmake --build . --parallel "${BUILD_JOBS}"
+BUILD_SEC=$(elapsed_sec "${BUILD_START}")
+
+# 빌드 시간 및 .ninja_log 기록 (incremental 측정: imgproc 소스 1개 수정)
+write_build_report opencv "$(pwd)" "${CONFIGURE_SEC}" "${BUILD_SEC}" ../modules/imgproc/src/resize.cpp
 
 # -----------------------------------------------------------------------------
 # OpenCV 설치
 # -----------------------------------------------------------------------------
 log_info "Installing OpenCV..."
-make install
+cmake --install .
 ldconfig
 
 # -----------------------------------------------------------------------------
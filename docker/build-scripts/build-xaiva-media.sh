@@ -16,6 +16,15 @@
 #   - FFmpeg가 빌드되어 있어야 함
 #   - OpenCV가 빌드되어 있어야 함
 #   - 환경 변수 설정: CUDA_ARCH, XAIVA_SOURCE_PATH
+#
+# 최적화 프로파일 (선택, 프리셋 optimization 섹션에서 전달):
+#   - OPT_CFLAGS / OPT_LDFLAGS: 추가 컴파일/링크 플래그
+#   - OPT_LTO=1: CMAKE_INTERPROCEDURAL_OPTIMIZATION=ON
+#
+# CMake 빌드 시스템 (선택, 프리셋 cmake 섹션에서 전달 - cmake-build-helpers.sh 참고):
+#   - BUILD_GENERATOR: "Unix Makefiles" 또는 "Ninja"
+#   - UNITY_BUILD=1: CMAKE_UNITY_BUILD=ON
+#   - 빌드 시간 및 .ninja_log 를 /usr/local/xaiva_media/build-reports/xaiva/ 에 기록
 
 set -e  # 에러 발생시 즉시 종료
 
@@ -43,6 +52,9 @@ log_debug() {
     echo -e "${BLUE}[DEBUG]${NC} $1"
 }
 
+# CMake generator/unity build 설정 및 빌드 시간 기록 함수
+source "$(dirname "$0")/cmake-build-helpers.sh"
+
 # 환경 변수 확인
 if [ -z "${CUDA_ARCH}" ]; then
     log_error "CUDA_ARCH is not set"
@@ -60,9 +72,31 @@ export CUDA_PATH=/usr/local/cuda
 export CUDA_TOOLKIT_ROOT_DIR=/usr/local/cuda
 
 log_info "Building Xaiva Media Library..."
-log_info "CUDA Architecture: ${CUDA_ARCH}"
+
+# CUDA 아키텍처 (CUDA_ARCH: "86" 또는 다중 아키텍처 "70;86")
+# CMAKE_CUDA_ARCHITECTURES: 하위 아키텍처는 SASS만("-real"), 최상위는 SASS+PTX
+CUDA_ARCH_LIST="$(echo "${CUDA_ARCH}" | tr ';,' '  ' | xargs -n1 | sort -n | xargs)"
+CUDA_ARCH_PTX="$(echo "${CUDA_ARCH_LIST}" | xargs -n1 | tail -n 1)"
+CUDA_ARCHITECTURES=""
+for arch in ${CUDA_ARCH_LIST}; do
+    if [ "${arch}" = "${CUDA_ARCH_PTX}" ]; then
+        CUDA_ARCHITECTURES="${CUDA_ARCHITECTURES}${arch}"
+    else
+        CUDA_ARCHITECTURES="${CUDA_ARCHITECTURES}${arch}-real;"
+    fi
+done
+log_info "CUDA Architecture: ${CUDA_ARCH_LIST} (CMAKE_CUDA_ARCHITECTURES=${CUDA_ARCHITECTURES})"
 log_info "Source path: ${XAIVA_SOURCE_PATH}"
 
+OPT_CFLAGS="${OPT_CFLAGS:-}"
+OPT_LDFLAGS="${OPT_LDFLAGS:-}"
+OPT_IPO=OFF
+if [ "${OPT_LTO:-0}" = "1" ]; then
+    OPT_IPO=ON
+fi
+log_info "Optimization profile: ${OPT_PROFILE:-baseline} (CFLAGS='${OPT_CFLAGS}', LTO=${OPT_IPO})"
+log_info "CMake generator: ${BUILD_GENERATOR} (unity build: ${UNITY_BUILD}, batch size: ${UNITY_BATCH_SIZE})"
+
 # -----------------------------------------------------------------------------
 # 소스 코드 확인
 # -----------------------------------------------------------------------------
@@ -84,18 +118,37 @@ cd build
 # 주요 옵션:
 #   - CMAKE_POSITION_INDEPENDENT_CODE: Python 바인딩을 위한 PIC
 #   - CMAKE_BUILD_TYPE=Release: 최적화된 릴리즈 빌드
-#   - CUDA_ARCH: 타겟 GPU 아키텍처
-cmake -DCMAKE_POSITION_INDEPENDENT_CODE:BOOL=true \
+#   - CUDA_ARCH: 타겟 GPU 아키텍처 (CMake 리스트, 예: "70;86")
+#   - CMAKE_CUDA_ARCHITECTURES: 아키텍처별 SASS + 최상위 PTX
+#   - CMAKE_C(XX)_FLAGS, CMAKE_INTERPROCEDURAL_OPTIMIZATION: 최적화 프로파일 (OPT_*)
+#   - CMAKE_BUILD_SYSTEM_ARGS: generator (-G), unity build
+CONFIGURE_START=$(now_sec)
+cmake "${CMAKE_BUILD_SYSTEM_ARGS[@]}" \
+      -DCMAKE_POSITION_INDEPENDENT_CODE:BOOL=true \
       -DCMAKE_VERBOSE_MAKEFILE=ON \
       -DCMAKE_BUILD_TYPE=Release \
-      -DCUDA_ARCH=${CUDA_ARCH} ..
+      -DCMAKE_C_FLAGS="${OPT_CFLAGS}" \
+      -DCMAKE_CXX_FLAGS="${OPT_CFLAGS}" \
+      -DCMAKE_SHARED_LINKER_FLAGS="${OPT_LDFLAGS}" \
+      -DCMAKE_INTERPROCEDURAL_OPTIMIZATION=${OPT_IPO} \
+      -DCUDA_ARCH="${CUDA_ARCH}" \
+      -DCMAKE_CUDA_ARCHITECTURES="${CUDA_ARCHITECTURES}" ..
+CONFIGURE_SEC=$(elapsed_sec "${CONFIGURE_START}")
 
 # -----------------------------------------------------------------------------
 # 빌드 실행
 # -----------------------------------------------------------------------------
 log_info "Building Xaiva Media (this may take a while)..."
 BUILD_LOG="build_log_$(date +%Y%m%d_%H%M%S).log"
-make -j$(nproc) 2>&1 | tee "${BUILD_LOG}"
+BUILD_START=$(now_sec)
+# 파이프라인 종료 코드는 tee 의 것이므로 cmake 종료 코드를 따로 확인
+cmake --build . --parallel "${BUILD_JOBS}" 2>&1 | tee "${BUILD_LOG}"
+BUILD_STATUS=${PIPESTATUS[0]}
+if [ "${BUILD_STATUS}" -ne 0 ]; then
+    log_error "Build failed with exit code ${BUILD_STATUS} (log: ${BUILD_LOG})"
+    exit "${BUILD_STATUS}"
+fi
+BUILD_SEC=$(elapsed_sec "${BUILD_START}")
 
 # -----------------------------------------------------------------------------
 # 빌드 결과 확인
@@ -109,6 +162,10 @@ fi
 
 ls -la /tmp/xaiva-media/lib/
 
+# 빌드 시간 및 .ninja_log 기록 (incremental 측정: 빌드 디렉터리 외 첫 번째 .cpp 수정)
+TOUCH_SOURCE=$(find "${XAIVA_SOURCE_PATH}" -path "${XAIVA_SOURCE_PATH}/build" -prune -o -name '*.cpp' -print | sort | head -n 1)
+write_build_report xaiva "$(pwd)" "${CONFIGURE_SEC}" "${BUILD_SEC}" "${TOUCH_SOURCE}"
+
 # -----------------------------------------------------------------------------
 # Python site-packages 경로 가져오기
 # -----------------------------------------------------------------------------
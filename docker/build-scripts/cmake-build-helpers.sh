@@ -0,0 +1,104 @@
+#!/bin/bash
+# cmake-build-helpers.sh - CMake 빌드 공통 설정 및 빌드 시간 기록
+#
+# build-opencv.sh, build-xaiva-media.sh 에서 source 하여 사용합니다.
+# (log_info 함수가 먼저 정의되어 있어야 함)
+#
+# 환경 변수 (프리셋 cmake 섹션에서 전달):
+#   - BUILD_GENERATOR: cmake -G 값 ("Unix Makefiles" 또는 "Ninja")
+#   - UNITY_BUILD=1: CMAKE_UNITY_BUILD=ON
+#   - UNITY_BATCH_SIZE: CMAKE_UNITY_BUILD_BATCH_SIZE (기본: 8)
+#   - MEASURE_REBUILDS=1: 빌드 후 no-op/incremental 재빌드 시간 측정 (기본: 0, 측정용 빌드에서만 사용)
+#   - BUILD_REPORTS_DIR: 빌드 리포트 디렉터리 (기본: /usr/local/xaiva_media/build-reports)
+#
+# 제공:
+#   - CMAKE_BUILD_SYSTEM_ARGS: cmake 설정 단계에 추가할 인자 배열
+#   - BUILD_JOBS: 병렬 빌드 작업 수
+#   - now_sec, elapsed_sec <start>: 시간 측정
+#   - write_build_report <component> <build_dir> <configure_sec> <build_sec> [<touch_file>]
+
+BUILD_GENERATOR="${BUILD_GENERATOR:-Unix Makefiles}"
+UNITY_BUILD="${UNITY_BUILD:-0}"
+UNITY_BATCH_SIZE="${UNITY_BATCH_SIZE:-8}"
+MEASURE_REBUILDS="${MEASURE_REBUILDS:-0}"
+BUILD_REPORTS_DIR="${BUILD_REPORTS_DIR:-/usr/local/xaiva_media/build-reports}"
+BUILD_JOBS="$(nproc)"
+
+CMAKE_BUILD_SYSTEM_ARGS=(-G "${BUILD_GENERATOR}")
+if [ "${UNITY_BUILD}" = "1" ]; then
+    CMAKE_BUILD_SYSTEM_ARGS+=(-DCMAKE_UNITY_BUILD=ON -DCMAKE_UNITY_BUILD_BATCH_SIZE="${UNITY_BATCH_SIZE}")
+fi
+
+now_sec() {
+    date +%s.%N
+}
+
+elapsed_sec() {
+    python3 -B -c "print(round($(now_sec) - $1, 1))"
+}
+
+# 빌드 시간 기록
+#   1. 전체 빌드의 .ninja_log 보존 (재빌드 측정 전에 복사하여 전체 빌드 기록만 남김)
+#   2. no-op 재빌드: 변경 없이 다시 빌드 (의존성 검사 비용)
+#   3. incremental 재빌드: 소스 하나를 touch 후 다시 빌드 (unity build 시 배치 전체 재컴파일)
+#   4. <component>/build-times.json 기록
+write_build_report() {
+    local component="$1"
+    local build_dir="$2"
+    local configure_sec="$3"
+    local build_sec="$4"
+    local touch_file="${5:-}"
+    local report_dir="${BUILD_REPORTS_DIR}/${component}"
+    local noop_sec=""
+    local incremental_sec=""
+    local started
+
+    mkdir -p "${report_dir}"
+    rm -f "${report_dir}/ninja_log"
+    if [ -f "${build_dir}/.ninja_log" ]; then
+        cp "${build_dir}/.ninja_log" "${report_dir}/ninja_log"
+    fi
+
+    if [ "${MEASURE_REBUILDS}" = "1" ]; then
+        log_info "Measuring no-op rebuild..."
+        started=$(now_sec)
+        cmake --build "${build_dir}" --parallel "${BUILD_JOBS}" > /dev/null
+        noop_sec=$(elapsed_sec "${started}")
+
+        if [ -n "${touch_file}" ] && [ -f "${touch_file}" ]; then
+            log_info "Measuring incremental rebuild (touch ${touch_file})..."
+            touch "${touch_file}"
+            started=$(now_sec)
+            cmake --build "${build_dir}" --parallel "${BUILD_JOBS}" > /dev/null
+            incremental_sec=$(elapsed_sec "${started}")
+        fi
+    fi
+
+    python3 -B - "${report_dir}/build-times.json" "${component}" "${BUILD_GENERATOR}" "${UNITY_BUILD}" \
+        "${UNITY_BATCH_SIZE}" "${BUILD_JOBS}" "${configure_sec}" "${build_sec}" \
+        "${noop_sec}" "${incremental_sec}" "${touch_file}" <<'EOF'
+import json
+import sys
+
+path, component, generator, unity, batch, jobs, configure, build, noop, incremental, touched = sys.argv[1:]
+seconds = lambda value: float(value) if value else None
+
+with open(path, "w", encoding="utf-8") as f:
+    json.dump({
+        "component": component,
+        "generator": generator,
+        "unity_build": unity == "1",
+        "unity_batch_size": int(batch),
+        "jobs": int(jobs),
+        "configure_sec": seconds(configure),
+        "build_sec": seconds(build),
+        "noop_sec": seconds(noop),
+        "incremental_sec": seconds(incremental),
+        "incremental_file": touched or None,
+    }, f, indent=2)
+EOF
+
+    noop_sec="${noop_sec:+${noop_sec}s}"
+    incremental_sec="${incremental_sec:+${incremental_sec}s}"
+    log_info "Build times (${component}): configure ${configure_sec}s, build ${build_sec}s, no-op ${noop_sec:-n/a}, incremental ${incremental_sec:-n/a}"
+}
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+measure-startup.py - Python 인터프리터 시작 및 모듈 임포트 시간 측정 스크립트
+
+각 모듈을 새 인터프리터 프로세스에서 `python3 -X importtime -c "import <module>"` 로
+반복 실행하여 wall time 과 임포트 누적 시간을 측정하고, 시작 시간 매니페스트(JSON)에
+phase(before/after) 별로 기록합니다.
+
+측정 중 .pyc 가 생성되어 before 측정값이 오염되지 않도록
+PYTHONDONTWRITEBYTECODE=1 환경에서 실행합니다.
+
+사용법:
+    measure-startup.py measure --manifest <path> --phase before torch cv2 XaivaDecoder
+    measure-startup.py record --manifest <path> bytecode.files=1234 ldconfig.entries=567
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+
+def parse_importtime(stderr, module):
+    """
+    -X importtime 출력을 파싱합니다.
+
+    Returns:
+        (대상 모듈의 누적 임포트 시간 [us], 임포트된 모듈 수)
+    """
+    cumulative = None
+    count = 0
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+
+        count += 1
+        if module and fields[2].strip() == module:
+            cumulative = int(fields[1].strip())
+
+    return cumulative, count
+
+
+def measure(module, repeat):
+    """
+    모듈 임포트 시간을 측정합니다 (module 이 None 이면 인터프리터 시작 시간).
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    code = f"import {module}" if module else "pass"
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+
+    wall_ms = []
+    import_us = []
+    modules = 0
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=env
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+
+        cumulative, modules = parse_importtime(result.stderr, module)
+        wall_ms.append(round(elapsed, 1))
+        if cumulative is not None:
+            import_us.append(cumulative)
+
+    entry = {
+        "wall_ms": statistics.median(wall_ms),
+        "runs_ms": wall_ms,
+        "modules_imported": modules,
+    }
+    if import_us:
+        entry["import_us"] = int(statistics.median(import_us))
+
+    return entry
+
+
+def load_manifest(path):
+    """매니페스트 로드 (없으면 빈 매니페스트)"""
+    if os.path.isfile(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    return {
+        "python": platform.python_version(),
+        "phases": {},
+    }
+
+
+def save_manifest(path, manifest):
+    """매니페스트 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def parse_value(value):
+    """record 값 변환 (정수/실수/문자열)"""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Python startup and import times")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    measure_parser = subparsers.add_parser("measure", help="Measure import times for a phase")
+    measure_parser.add_argument("--manifest", required=True)
+    measure_parser.add_argument("--phase", required=True)
+    measure_parser.add_argument("--repeat", type=int, default=3)
+    measure_parser.add_argument("modules", nargs="*")
+
+    record_parser = subparsers.add_parser("record", help="Record SECTION.KEY=VALUE entries")
+    record_parser.add_argument("--manifest", required=True)
+    record_parser.add_argument("entries", nargs="+")
+
+    args = parser.parse_args()
+    manifest = load_manifest(args.manifest)
+
+    if args.command == "measure":
+        phase = {
+            "measured_at": datetime.now().isoformat(timespec="seconds"),
+            "interpreter": measure(None, args.repeat),
+            "modules": {},
+        }
+        print(f"[{args.phase}] python startup: {phase['interpreter'].get('wall_ms')} ms")
+
+        for module in args.modules:
+            entry = measure(module, args.repeat)
+            phase["modules"][module] = entry
+            if "error" in entry:
+                print(f"[{args.phase}] {module}: failed ({entry['error']})")
+            else:
+                print(f"[{args.phase}] {module}: {entry['wall_ms']} ms")
+
+        manifest["phases"][args.phase] = phase
+
+    else:
+        for item in args.entries:
+            key, _, value = item.partition("=")
+            section, _, name = key.partition(".")
+            manifest.setdefault(section, {})[name] = parse_value(value)
+
+    save_manifest(args.manifest, manifest)
+
+
+if __name__ == "__main__":
+    main()
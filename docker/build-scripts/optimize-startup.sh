@@ -0,0 +1,93 @@
+#!/bin/bash
+# optimize-startup.sh - 컨테이너 시작 시간 최적화 스크립트
+#
+# 이 스크립트는 dev 이미지 위에서 다음 작업을 수행합니다.
+#   1. site-packages 및 표준 라이브러리 바이트코드 사전 컴파일
+#      (--invalidation-mode unchecked-hash: 소스 mtime 과 무관한 결정적 .pyc,
+#       임포트 시 소스 파일 stat/해시 검증 생략)
+#   2. 모든 라이브러리 설치 후 ld.so.cache 재생성
+#
+# 최적화 내역은 시작 시간 매니페스트(JSON)에 기록됩니다.
+# 시작/임포트 시간은 GPU 가 없는 빌드 컨테이너가 아니라 실행 환경에서 측정해야 하므로
+# 여기서 측정하지 않고, 빌드 드라이버(scripts/builder/startup.py)가 빌드 완료 후
+# dev 이미지(before)와 startup 이미지(after)의 새 컨테이너에서 측정합니다.
+# measure-startup.py 는 이미지에 남아 있어 런타임에 직접 다시 측정할 수 있습니다.
+#
+# 환경 변수:
+#   - STARTUP_MANIFEST_PATH: 매니페스트 경로 (기본: /usr/local/xaiva_media/startup-manifest.json)
+#   - MEASURE_SCRIPT: measure-startup.py 경로 (기본: /opt/xaiva-kit/measure-startup.py)
+#
+# 주의:
+#   - unchecked-hash .pyc 는 소스가 바뀌어도 자동으로 재컴파일되지 않습니다.
+#     이미지 안에서 site-packages 소스를 직접 수정한 경우 해당 .pyc 를 삭제하세요.
+#     (pip install/uninstall 은 .pyc 를 함께 교체/삭제함)
+
+set -e  # 에러 발생시 즉시 종료
+
+# 색상 정의
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+# 로깅 함수
+log_info() {
+    echo -e "${GREEN}[INFO]${NC} $1"
+}
+
+log_warn() {
+    echo -e "${YELLOW}[WARN]${NC} $1"
+}
+
+MANIFEST_PATH="${STARTUP_MANIFEST_PATH:-/usr/local/xaiva_media/startup-manifest.json}"
+MEASURE_SCRIPT="${MEASURE_SCRIPT:-/opt/xaiva-kit/measure-startup.py}"
+
+rm -f "${MANIFEST_PATH}"
+
+# -----------------------------------------------------------------------------
+# 바이트코드 사전 컴파일
+# -----------------------------------------------------------------------------
+# sys.path 의 모든 디렉터리 (표준 라이브러리, dist-packages, site-packages)
+PYTHON_PATHS=$(python3 -B -c "import os, sys; print(' '.join(p for p in sys.path if p and os.path.isdir(p)))")
+log_info "Compiling bytecode: ${PYTHON_PATHS}"
+
+COMPILE_START=$(date +%s.%N)
+# 일부 패키지의 테스트/템플릿 파일은 문법 오류로 컴파일되지 않으므로 실패는 경고로 처리
+COMPILE_STATUS=0
+python3 -m compileall -q -f -j 0 --invalidation-mode unchecked-hash ${PYTHON_PATHS} > /tmp/compileall.log 2>&1 || COMPILE_STATUS=$?
+COMPILE_END=$(date +%s.%N)
+
+COMPILE_ERRORS=$(grep -c '^\*\*\*' /tmp/compileall.log || true)
+if [ "${COMPILE_STATUS}" != "0" ]; then
+    log_warn "compileall reported ${COMPILE_ERRORS} file(s) that could not be compiled (ignored)"
+fi
+rm -f /tmp/compileall.log
+
+PYC_COUNT=$(find ${PYTHON_PATHS} -name '*.pyc' 2>/dev/null | wc -l)
+COMPILE_SECONDS=$(python3 -B -c "print(round(${COMPILE_END} - ${COMPILE_START}, 1))")
+log_info "Compiled bytecode: ${PYC_COUNT} .pyc file(s) in ${COMPILE_SECONDS}s"
+
+python3 -B "${MEASURE_SCRIPT}" record --manifest "${MANIFEST_PATH}" \
+    "bytecode.invalidation_mode=unchecked-hash" \
+    "bytecode.pyc_files=${PYC_COUNT}" \
+    "bytecode.compile_errors=${COMPILE_ERRORS}" \
+    "bytecode.seconds=${COMPILE_SECONDS}"
+
+# -----------------------------------------------------------------------------
+# 동적 링커 캐시 재생성
+# -----------------------------------------------------------------------------
+# LD_LIBRARY_PATH 디렉터리를 ld.so.conf 에도 등록하여 캐시에서 바로 찾도록 함
+log_info "Regenerating ld.so.cache..."
+cat > /etc/ld.so.conf.d/xaiva-kit.conf <<EOF
+/usr/local/lib
+/usr/local/cuda/lib64
+/usr/local/cuda/extras/CUPTI/lib64
+EOF
+ldconfig
+
+LDCONFIG_ENTRIES=$(ldconfig -p | head -n 1 | awk '{print $1}')
+log_info "ld.so.cache entries: ${LDCONFIG_ENTRIES}"
+
+python3 -B "${MEASURE_SCRIPT}" record --manifest "${MANIFEST_PATH}" \
+    "ldconfig.entries=${LDCONFIG_ENTRIES}"
+
+log_info "Startup manifest: ${MANIFEST_PATH}"
@@ -0,0 +1,92 @@
+#!/bin/bash
+# report-cuda-fatbin.sh - CUDA fat binary 구성 리포트 생성 스크립트
+#
+# 이 스크립트는 설치된 OpenCV / Xaiva Media 라이브러리에 포함된
+# CUDA 디바이스 코드(SASS/PTX)를 아키텍처별로 집계합니다.
+#
+# 리포트 형식 (TSV): kind<TAB>arch<TAB>bytes
+#   - kind: sass 또는 ptx
+#   - arch: Compute Capability (예: 86)
+#
+# 빌드 드라이버(scripts/builder/docker.py)가 빌드 완료 후 이 리포트를 읽어
+# 다중 아키텍처 빌드의 크기 오버헤드를 출력합니다.
+#
+# 전제 조건:
+#   - CUDA toolkit (cuobjdump)
+#   - OpenCV, Xaiva Media가 설치되어 있어야 함
+
+set -e  # 에러 발생시 즉시 종료
+
+# 색상 정의
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+# 로깅 함수
+log_info() {
+    echo -e "${GREEN}[INFO]${NC} $1"
+}
+
+log_warn() {
+    echo -e "${YELLOW}[WARN]${NC} $1"
+}
+
+REPORT_PATH="${FATBIN_REPORT_PATH:-/usr/local/xaiva_media/cuda-fatbin-report.tsv}"
+CUOBJDUMP=/usr/local/cuda/bin/cuobjdump
+WORK_DIR="$(mktemp -d)"
+
+mkdir -p "$(dirname "${REPORT_PATH}")"
+printf 'kind\tarch\tbytes\n' > "${REPORT_PATH}"
+
+if [ ! -x "${CUOBJDUMP}" ]; then
+    log_warn "cuobjdump not found, writing empty report"
+    exit 0
+fi
+
+PYTHON_PACKAGES_PATH=$(python3 -c "import site; print(site.getsitepackages()[0])")
+
+# -----------------------------------------------------------------------------
+# 디바이스 코드 추출 (라이브러리별 디렉터리에 추출하여 이름 충돌 방지)
+# -----------------------------------------------------------------------------
+# Xaiva Media 모듈은 /usr/local/lib 과 site-packages 에 모두 설치되므로
+# (심볼릭 링크 또는 복사본) 실제 경로와 내용 해시로 중복을 제거하여 한 번만 집계
+log_info "Extracting CUDA device code..."
+declare -A SEEN_LIBS
+idx=0
+for lib in /usr/local/lib/libopencv_*.a /usr/local/lib/*.so "${PYTHON_PACKAGES_PATH}"/Xaiva*.so; do
+    [ -f "${lib}" ] || continue
+    lib_hash=$(sha256sum "$(readlink -f "${lib}")" | cut -d' ' -f1)
+    if [ -n "${SEEN_LIBS[${lib_hash}]}" ]; then
+        log_info "Skipping duplicate: ${lib} (same as ${SEEN_LIBS[${lib_hash}]})"
+        continue
+    fi
+    SEEN_LIBS[${lib_hash}]="${lib}"
+    idx=$((idx + 1))
+    mkdir -p "${WORK_DIR}/${idx}"
+    (cd "${WORK_DIR}/${idx}" && \
+        "${CUOBJDUMP}" -xelf all "${lib}" > /dev/null 2>&1 || true; \
+        "${CUOBJDUMP}" -xptx all "${lib}" > /dev/null 2>&1 || true)
+done
+
+# -----------------------------------------------------------------------------
+# 아키텍처별 집계
+# -----------------------------------------------------------------------------
+find "${WORK_DIR}" -type f \( -name '*.cubin' -o -name '*.ptx' \) -printf '%f\t%s\n' | \
+awk -F'\t' '
+{
+    kind = ($1 ~ /\.ptx$/) ? "ptx" : "sass"
+    arch = "unknown"
+    if (match($1, /(sm|compute)_[0-9]+/)) {
+        arch = substr($1, RSTART, RLENGTH)
+        sub(/^(sm|compute)_/, "", arch)
+    }
+    bytes[kind "\t" arch] += $2
+}
+END {
+    for (key in bytes) print key "\t" bytes[key]
+}' | sort >> "${REPORT_PATH}"
+
+rm -rf "${WORK_DIR}"
+
+log_info "CUDA fat binary report: ${REPORT_PATH}"
+cat "${REPORT_PATH}"
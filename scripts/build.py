@@ -23,10 +23,24 @@ from builder import (
     # preset
     load_presets,
     validate_preset,
-    check_preset_artifacts,
     # docker
     build_docker_image,
     generate_image_tag,
+    # apt
+    mirror_debs,
+    check_deb_cache,
+    # output
+    OUTPUT_FORMATS,
+    check_output_format,
+    # preflight
+    run_preflight,
+    resolve_xaiva_source,
+    PreflightError,
+    # gc
+    run_gc,
+    parse_size,
+    acquire_build_lock,
+    record_usage,
     # ui
     select_preset,
     confirm_build,
@@ -94,30 +108,16 @@ def check_and_switch_xaiva_branch(preset: dict, preset_name: str, non_interactiv
     Returns:
         성공 여부
     """
-    # Xaiva Media 소스 설정 확인
-    build_options = preset.get("build_options", {})
-    xaiva_source = build_options.get("xaiva_media_source", {})
+    # Xaiva Media 소스 설정 확인 (브랜치: CLI 오버라이드 > 프리셋 설정 > 기본값)
+    source = resolve_xaiva_source(preset, override_branch)
     
-    if not xaiva_source:
+    if source is None:
         print_warning("No xaiva_media_source configuration found in preset")
         return True
     
-    # 브랜치 결정 (CLI 오버라이드 > 프리셋 설정 > 기본값)
+    xaiva_path, target_branch = source
     if override_branch:
-        target_branch = override_branch
         print_info(f"Using CLI override branch: {target_branch}")
-    else:
-        target_branch = xaiva_source.get("branch", "main")
-    
-    source_path = xaiva_source.get("path", "xaiva-media")
-    
-    # 절대 경로와 상대 경로 처리
-    if source_path.startswith("/"):
-        # 절대 경로
-        xaiva_path = Path(source_path)
-    else:
-        # 상대 경로 (프로젝트 루트 기준)
-        xaiva_path = PROJECT_ROOT / source_path
     
     print_section(f"Xaiva Media Branch Check")
     print(f"  Source path: {xaiva_path}")
@@ -269,6 +269,153 @@ def load_env_file() -> dict:
     return env_vars
 
 
+def run_gc_command(args: argparse.Namespace) -> int:
+    """
+    gc 서브커맨드 실행
+    
+    예산/보호 프리셋은 CLI 인자가 우선하며, 없으면 .env 의 GC_BUDGET / GC_PROTECT 사용
+    
+    Args:
+        args: 파싱된 인자
+    
+    Returns:
+        Exit code (0 = success)
+    """
+    env_vars = load_env_file()
+    
+    budget_text = args.budget or env_vars.get("GC_BUDGET")
+    if not budget_text:
+        print_error("Disk budget is required (--budget 200G or GC_BUDGET in .env)")
+        return 1
+    
+    try:
+        budget = parse_size(budget_text)
+    except ValueError as e:
+        print_error(str(e))
+        return 1
+    
+    protect = list(args.protect)
+    protect.extend(p.strip() for p in env_vars.get("GC_PROTECT", "").split(",") if p.strip())
+    
+    return run_gc(budget, protect=protect, dry_run=args.dry_run)
+
+
+def run_build(args: argparse.Namespace, preset: dict, preset_name: str, env_vars: dict) -> int:
+    """
+    사전 점검부터 이미지 빌드까지 실행
+    
+    Args:
+        args: 파싱된 인자
+        preset: 프리셋 데이터
+        preset_name: 프리셋 이름
+        env_vars: .env 환경 변수
+    
+    Returns:
+        Exit code (0 = success)
+    """
+    # 출력 형식 확인 (zstd/eStargz 레이어는 containerd 이미지 스토어와 docker 드라이버 buildx 빌더 필요)
+    if args.output_format != "docker":
+        print_info(f"Output format: {args.output_format} - {OUTPUT_FORMATS[args.output_format]['description']}")
+        output_errors = check_output_format(args.output_format)
+        for message in output_errors:
+            if args.dry_run:
+                print_warning(message)
+            else:
+                print_error(message)
+        if output_errors and not args.dry_run:
+            return 1
+    
+    # 빌드 모드 결정
+    # 현재는 온라인 모드만 지원
+    build_mode = "online"
+    if args.build_mode in ["offline", "auto"]:
+        print_warning(f"Build mode '{args.build_mode}' is not yet supported, using 'online' mode")
+    
+    # 빌드 모드 정보 출력
+    if not args.non_interactive:
+        print_build_mode_info(build_mode, preset_name)
+    
+    # 빌드 확인 (베이스 이미지 pull, .deb 미러 등 오래 걸리는 작업 전에 확인)
+    image_tag = generate_image_tag(preset_name)
+    
+    if not args.non_interactive and not args.dry_run:
+        if not confirm_build(preset_name, image_tag):
+            print("Build cancelled")
+            return 0
+    
+    # 사전 점검: 베이스 이미지 pull, 아티팩트 확인, Xaiva Media git 동기화,
+    # 빌드 컨텍스트 준비를 동시에 실행 (하나라도 실패하면 나머지 취소)
+    try:
+        preflight = run_preflight(
+            preset,
+            preset_name,
+            env_vars,
+            non_interactive=args.non_interactive,
+            override_branch=args.xaiva_branch,
+            dry_run=args.dry_run
+        )
+    except PreflightError as e:
+        print_error(f"Preflight failed: {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("\n\nBuild cancelled by user")
+        return 130
+    
+    # Xaiva Media 브랜치 불일치 시 대화형 전환
+    if not preflight["branch_ok"]:
+        if not check_and_switch_xaiva_branch(preset, preset_name, args.non_interactive, args.xaiva_branch):
+            print_error("Xaiva Media branch check failed")
+            return 1
+    
+    # Artifacts 경고 확인
+    warnings = preflight["warnings"]
+    if warnings:
+        print_warning("Artifacts check:")
+        for warning in warnings:
+            print(f"  - {warning}")
+        
+        if not args.non_interactive:
+            choice = input("\nContinue anyway? (y/n) [n]: ").strip().lower()
+            if choice != 'y':
+                print("Build cancelled")
+                return 0
+    
+    # APT .deb 미러 (선택)
+    if args.sync_debs:
+        apt_source = env_vars.get("APT_MIRROR_SOURCE")
+        if mirror_debs(preset, preset_name, dry_run=args.dry_run, apt_source=apt_source) != 0:
+            print_error("APT package mirroring failed")
+            return 1
+    
+    if check_deb_cache(preset, preset_name):
+        print_info(f"Using local .deb repository: artifacts/{preset_name}/debs/")
+    else:
+        print_info("System packages will be downloaded (run with --sync-debs to cache them locally)")
+    
+    # 빌드 실행
+    exit_code = build_docker_image(
+        preset=preset,
+        preset_name=preset_name,
+        build_mode=build_mode,
+        env_vars=env_vars,
+        dry_run=args.dry_run,
+        resume=args.resume,
+        checkpoints=not args.no_checkpoints,
+        output_format=args.output_format,
+        optimize_startup=args.optimize_startup
+    )
+    
+    if exit_code == 0:
+        print_success(f"Build completed successfully!")
+        print(f"\nImage tag: {image_tag}")
+        print(f"\nRun with:")
+        print(f"  docker run --rm -it --gpus all {image_tag}")
+    else:
+        print_error(f"Build failed with exit code {exit_code}")
+    
+    return exit_code
+
+
 def main():
     """메인 함수"""
     
@@ -290,8 +437,23 @@ Examples:
   python3 scripts/build.py --preset ubuntu22.04-cuda11.8-torch2.1 --xaiva-branch develop
       Build with specific Xaiva Media branch
   
+  python3 scripts/build.py --preset ubuntu22.04-cuda11.8-torch2.1 --sync-debs
+      Mirror apt packages to artifacts/<preset>/debs/ before building
+  
+  python3 scripts/build.py --preset ubuntu22.04-cuda11.8-torch2.1 --resume
+      Resume a failed build from the last completed stage checkpoint
+  
+  python3 scripts/build.py --preset ubuntu22.04-cuda11.8-torch2.1 --output-format zstd
+      Build with zstd-compressed layers and report size/decompression time vs gzip
+  
+  python3 scripts/build.py --preset ubuntu22.04-cuda11.8-torch2.1 --optimize-startup
+      Precompile bytecode and refresh ld.so.cache, then report import times before/after
+  
   python3 scripts/build.py --list-presets
       List available presets and exit
+  
+  python3 scripts/build.py gc --budget 200G --protect ubuntu22.04-cuda11.8-torch2.1
+      Remove least recently used images, checkpoints and caches down to 200 GiB
         """
     )
     
@@ -334,11 +496,76 @@ Examples:
         help="Override Xaiva Media branch (overrides preset setting)"
     )
     
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume a failed build from the last valid stage checkpoint"
+    )
+    
+    parser.add_argument(
+        "--no-checkpoints",
+        action="store_true",
+        help="Build in a single docker build without tagging stage checkpoints"
+    )
+    
+    parser.add_argument(
+        "--output-format",
+        type=str,
+        choices=list(OUTPUT_FORMATS.keys()),
+        default="docker",
+        help="Final image layer compression (zstd/estargz require the containerd image store)"
+    )
+    
+    parser.add_argument(
+        "--optimize-startup",
+        action="store_true",
+        help="Add the startup stage (precompiled bytecode, ld.so.cache) and report import times"
+    )
+    
+    parser.add_argument(
+        "--sync-debs",
+        action="store_true",
+        help="Mirror apt .deb packages to artifacts/<preset>/debs/ before building"
+    )
+    
+    # 서브커맨드 (생략 시 빌드)
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    
+    gc_parser = subparsers.add_parser(
+        "gc",
+        help="Remove least recently used images, checkpoints and caches to fit a disk budget"
+    )
+    
+    gc_parser.add_argument(
+        "--budget",
+        type=str,
+        help="Disk budget for images, build cache and artifact caches (e.g. 200G, default: GC_BUDGET in .env)"
+    )
+    
+    gc_parser.add_argument(
+        "--protect",
+        action="append",
+        default=[],
+        metavar="PRESET",
+        help="Preset whose images and caches are never removed (repeatable, also GC_PROTECT in .env)"
+    )
+    
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Show what would be removed without removing anything"
+    )
+    
     args = parser.parse_args()
     
     # 헤더 출력
     print_header("XaivaKit - Build Driver")
     
+    # gc 서브커맨드
+    if args.command == "gc":
+        sys.exit(run_gc_command(args))
+    
     # 프리셋 로드
     presets = load_presets()
     
@@ -349,6 +576,10 @@ Examples:
     
     print_success(f"Loaded {len(presets)} preset(s)")
     
+    if args.resume and args.no_checkpoints:
+        print_error("--resume cannot be used with --no-checkpoints")
+        sys.exit(1)
+    
     # --list-presets 처리
     if args.list_presets:
         print_section("Available Presets")
@@ -388,62 +619,17 @@ Examples:
     
     print_success("Preset is valid")
     
-    # Xaiva Media 브랜치 체크 및 전환
-    if not check_and_switch_xaiva_branch(preset, preset_name, args.non_interactive, args.xaiva_branch):
-        print_error("Xaiva Media branch check failed")
-        sys.exit(1)
-    
-    # Artifacts 체크
-    warnings = check_preset_artifacts(preset_name)
-    if warnings:
-        print_warning("Artifacts check:")
-        for warning in warnings:
-            print(f"  - {warning}")
-        
-        if not args.non_interactive:
-            choice = input("\nContinue anyway? (y/n) [n]: ").strip().lower()
-            if choice != 'y':
-                print("Build cancelled")
-                sys.exit(0)
-    
-    
-    # 빌드 모드 결정
-    # 현재는 온라인 모드만 지원
-    build_mode = "online"
-    if args.build_mode in ["offline", "auto"]:
-        print_warning(f"Build mode '{args.build_mode}' is not yet supported, using 'online' mode")
-    
-    # 빌드 모드 정보 출력
-    if not args.non_interactive:
-        print_build_mode_info(build_mode, preset_name)
-    
     # 환경 변수 로드
     env_vars = load_env_file()
     
-    # 빌드 확인
-    image_tag = generate_image_tag(preset_name)
-    
-    if not args.non_interactive and not args.dry_run:
-        if not confirm_build(preset_name, image_tag):
-            print("Build cancelled")
-            sys.exit(0)
-    
-    # 빌드 실행
-    exit_code = build_docker_image(
-        preset=preset,
-        preset_name=preset_name,
-        build_mode=build_mode,
-        env_vars=env_vars,
-        dry_run=args.dry_run
-    )
-    
-    if exit_code == 0:
-        print_success(f"Build completed successfully!")
-        print(f"\nImage tag: {image_tag}")
-        print(f"\nRun with:")
-        print(f"  docker run --rm -it --gpus all {image_tag}")
+    # 빌드 잠금 - with 블록 동안 이 프리셋은 gc 대상에서 제외되고 빌드 캐시 정리도 보류됨
+    if args.dry_run:
+        exit_code = run_build(args, preset, preset_name, env_vars)
     else:
-        print_error(f"Build failed with exit code {exit_code}")
+        with acquire_build_lock(preset_name):
+            record_usage(preset_name)
+            exit_code = run_build(args, preset, preset_name, env_vars)
+            record_usage(preset_name)
     
     sys.exit(exit_code)
 
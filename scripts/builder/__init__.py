@@ -6,6 +6,10 @@ XaivaKit Builder Module
 
 from .preset import load_presets, validate_preset, check_preset_artifacts
 from .docker import build_docker_image, generate_image_tag
+from .apt import mirror_debs, check_deb_cache
+from .output import OUTPUT_FORMATS, check_containerd_image_store, check_output_format
+from .preflight import run_preflight, resolve_xaiva_source, PreflightError
+from .gc import run_gc, parse_size, acquire_build_lock, record_usage
 from .ui import select_preset, confirm_build
 from .utils import print_header, print_section, print_error, print_warning, print_success, print_info
 
@@ -17,6 +21,22 @@ __all__ = [
     # docker
     'build_docker_image',
     'generate_image_tag',
+    # apt
+    'mirror_debs',
+    'check_deb_cache',
+    # output
+    'OUTPUT_FORMATS',
+    'check_containerd_image_store',
+    'check_output_format',
+    # preflight
+    'run_preflight',
+    'resolve_xaiva_source',
+    'PreflightError',
+    # gc
+    'run_gc',
+    'parse_size',
+    'acquire_build_lock',
+    'record_usage',
     # ui
     'select_preset',
     'confirm_build',
@@ -0,0 +1,263 @@
+"""
+APT 패키지 관리 모듈
+
+프리셋의 apt 패키지 세트를 해석하고, .deb 파일을 artifacts/<preset>/debs/ 에
+로컬 APT 저장소 형태로 미러링합니다.
+"""
+
+import json
+import os
+import shlex
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .utils import DOCKER, print_section, print_error, print_success, print_warning
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ARTIFACTS_DIR = PROJECT_ROOT / "artifacts"
+
+# 미러 디렉터리 구성 파일
+DEBS_MANIFEST = "manifest.json"
+DEBS_INDEX = "Packages"
+
+# 기본 APT 패키지 세트 (프리셋 apt_packages 에서 그룹 단위로 오버라이드 가능)
+# {python_version} 은 프리셋의 python.version 으로 치환됨
+DEFAULT_APT_PACKAGES: Dict[str, List[str]] = {
+    # 빌드 도구
+    "build_tools": [
+        "autoconf", "automake", "build-essential", "cmake", "git-core", "git-lfs",
+        "libtool", "meson", "ninja-build", "nasm", "yasm", "pkg-config", "texinfo",
+        "wget", "curl", "unzip",
+    ],
+    # FFmpeg 의존성
+    "ffmpeg": [
+        "libass-dev", "libfreetype6-dev", "libgnutls28-dev", "libmp3lame-dev",
+        "libsdl2-dev", "libva-dev", "libvdpau-dev", "libvorbis-dev", "libxcb1-dev",
+        "libxcb-shm0-dev", "libxcb-xfixes0-dev", "zlib1g-dev", "libssl-dev", "openssl",
+    ],
+    # OpenCV 의존성
+    "opencv": [
+        "libtbb-dev", "libatlas-base-dev", "gfortran", "libeigen3-dev", "libv4l-dev",
+        "v4l-utils", "libjpeg-dev", "libtiff5-dev", "libpng-dev", "libwebp-dev",
+        "libopenjp2-7-dev",
+    ],
+    # Python 및 개발 도구
+    "python": [
+        "python{python_version}", "python{python_version}-dev", "python3-pip",
+        "vim", "gdb", "lftp", "libnuma-dev", "jq", "tzdata", "ntp", "redis-server",
+    ],
+    # 런타임 라이브러리 및 개발 도구 (dev 이미지)
+    "dev_runtime": [
+        "libass9", "libfreetype6", "libgnutls30", "libmp3lame0", "libva2", "libvdpau1",
+        "libvorbis0a", "libxcb1", "libxcb-shm0", "libxcb-xfixes0",
+        "libjpeg8", "libtiff5", "libpng16-16", "libwebp7", "libopenjp2-7", "libtbb2",
+        "libnuma1", "gdb", "valgrind", "strace", "htop", "tmux",
+    ],
+}
+
+# 미러 디렉터리의 컨테이너 내 마운트 경로
+DEBS_MOUNT = "/debs"
+
+# 미러링 컨테이너에서 실행할 스크립트
+# 베이스 이미지에 이미 설치된 패키지는 다운로드되지 않으므로 반드시 프리셋의 base_image 에서 실행
+# apt_source 가 주어지면 base_image 의 sources.list 대신 해당 저장소 한 줄만 사용
+MIRROR_SCRIPT = """set -e
+export DEBIAN_FRONTEND=noninteractive
+DEBS_DIR="${{DEBS_DIR:-{mount}}}"
+APT_OPTS=""
+APT_SOURCE={apt_source}
+if [ -n "${{APT_SOURCE}}" ]; then
+    SOURCE_LIST="$(mktemp)"
+    echo "${{APT_SOURCE}}" > "${{SOURCE_LIST}}"
+    APT_OPTS="-o Dir::Etc::SourceList=${{SOURCE_LIST}} -o Dir::Etc::SourceParts=-"
+fi
+eval "$(apt-config shell ARCHIVES Dir::Cache::archives/d)"
+apt-get ${{APT_OPTS}} update
+rm -f "${{ARCHIVES}}"*.deb
+apt-get ${{APT_OPTS}} install -y --no-install-recommends --download-only {packages}
+rm -f "${{DEBS_DIR}}"/*.deb "${{DEBS_DIR}}/{index}"
+find "${{ARCHIVES}}" -maxdepth 1 -name '*.deb' -exec cp {{}} "${{DEBS_DIR}}/" \\;
+command -v dpkg-scanpackages > /dev/null || apt-get ${{APT_OPTS}} install -y --no-install-recommends dpkg-dev > /dev/null
+cd "${{DEBS_DIR}}" && dpkg-scanpackages --multiversion . /dev/null > {index}
+chown -R {uid}:{gid} "${{DEBS_DIR}}"
+"""
+
+
+def get_debs_dir(preset_name: str) -> Path:
+    """
+    프리셋의 .deb 미러 디렉터리 경로를 반환합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+
+    Returns:
+        artifacts/<preset>/debs 경로
+    """
+    return ARTIFACTS_DIR / preset_name / "debs"
+
+
+def validate_apt_packages(apt_packages: Any) -> List[str]:
+    """
+    프리셋의 apt_packages 섹션을 검증합니다.
+
+    Args:
+        apt_packages: 프리셋의 apt_packages 값
+
+    Returns:
+        에러 메시지 리스트 (빈 리스트면 유효함)
+    """
+    if not isinstance(apt_packages, dict):
+        return ["Field apt_packages must be dict"]
+
+    errors = []
+    for group, packages in apt_packages.items():
+        if not isinstance(packages, list) or not all(isinstance(p, str) and p for p in packages):
+            errors.append(f"Field apt_packages.{group} must be a list of package names")
+
+    return errors
+
+
+def get_apt_packages(preset: Dict[str, Any]) -> List[str]:
+    """
+    프리셋에서 설치할 APT 패키지 목록을 생성합니다.
+
+    기본 패키지 세트에 프리셋의 apt_packages 그룹을 덮어쓴 뒤,
+    중복을 제거하여 하나의 목록으로 합칩니다.
+
+    Args:
+        preset: 프리셋 데이터
+
+    Returns:
+        APT 패키지 이름 리스트
+    """
+    groups = dict(DEFAULT_APT_PACKAGES)
+    groups.update(preset.get("apt_packages", {}))
+
+    python_version = preset["python"]["version"]
+    packages = []
+
+    for group_packages in groups.values():
+        for package in group_packages:
+            package = package.format(python_version=python_version)
+            if package not in packages:
+                packages.append(package)
+
+    return packages
+
+
+def check_deb_cache(preset: Dict[str, Any], preset_name: str) -> bool:
+    """
+    로컬 .deb 미러가 현재 프리셋과 일치하는지 확인합니다.
+
+    Args:
+        preset: 프리셋 데이터
+        preset_name: 프리셋 이름
+
+    Returns:
+        미러를 사용할 수 있으면 True
+    """
+    debs_dir = get_debs_dir(preset_name)
+    manifest_path = debs_dir / DEBS_MANIFEST
+
+    if not (debs_dir / DEBS_INDEX).is_file() or not manifest_path.is_file():
+        return False
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return False
+
+    return (
+        manifest.get("base_image") == preset["base_image"]
+        and manifest.get("packages") == get_apt_packages(preset)
+    )
+
+
+def mirror_debs(
+    preset: Dict[str, Any],
+    preset_name: str,
+    dry_run: bool = False,
+    apt_source: Optional[str] = None,
+    docker: Optional[str] = None
+) -> int:
+    """
+    프리셋의 APT 패키지를 artifacts/<preset>/debs/ 에 로컬 저장소로 미러링합니다.
+
+    base_image 컨테이너에서 의존성을 해석하여 .deb 파일을 내려받고
+    dpkg-scanpackages 로 Packages 인덱스를 생성합니다.
+
+    Args:
+        preset: 프리셋 데이터
+        preset_name: 프리셋 이름
+        dry_run: True일 경우 명령어만 출력하고 실행하지 않음
+        apt_source: base_image 의 sources.list 대신 사용할 APT 소스 한 줄
+                    (예: "deb [trusted=yes] http://mirror.local/ubuntu ./", 기본: base_image 설정 사용)
+        docker: docker CLI 경로 (기본: XAIVA_KIT_DOCKER 또는 "docker")
+
+    Returns:
+        Exit code (0 = success)
+    """
+    debs_dir = get_debs_dir(preset_name)
+    packages = get_apt_packages(preset)
+
+    script = MIRROR_SCRIPT.format(
+        packages=" ".join(shlex.quote(p) for p in packages),
+        index=DEBS_INDEX,
+        mount=DEBS_MOUNT,
+        apt_source=shlex.quote(apt_source or ""),
+        uid=os.getuid(),
+        gid=os.getgid(),
+    )
+
+    cmd = [
+        docker or DOCKER, "run", "--rm",
+        "-v", f"{debs_dir}:{DEBS_MOUNT}",
+        "-e", f"DEBS_DIR={DEBS_MOUNT}",
+        preset["base_image"],
+        "bash", "-c", script,
+    ]
+
+    print_section("Mirroring APT Packages")
+    print(f"  Base image: {preset['base_image']}")
+    print(f"  Packages:   {len(packages)}")
+    if apt_source:
+        print(f"  Source:     {apt_source}")
+    print(f"  Target:     {debs_dir}")
+
+    if dry_run:
+        print("  " + " ".join(cmd[:-1]) + " <mirror-script>")
+        print_success("Dry run mode - command not executed")
+        return 0
+
+    debs_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    except KeyboardInterrupt:
+        print("\n\nMirroring cancelled by user")
+        return 130
+    except Exception as e:
+        print_error(f"Failed to mirror APT packages: {e}")
+        return 1
+
+    if result.returncode != 0:
+        print_error(f"APT mirroring failed with exit code {result.returncode}")
+        return result.returncode
+
+    manifest = {
+        "base_image": preset["base_image"],
+        "packages": packages,
+    }
+    with open(debs_dir / DEBS_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    deb_count = len(list(debs_dir.glob("*.deb")))
+    if deb_count == 0:
+        print_warning("No .deb files were downloaded (all packages already in base image?)")
+
+    print_success(f"Mirrored {deb_count} .deb file(s) to {debs_dir}")
+    return 0
@@ -0,0 +1,395 @@
+"""
+빌드 체크포인트 모듈
+
+중간 빌드 스테이지(codecs → ffmpeg → opencv → xaiva)를 입력 fingerprint가 포함된
+이미지 태그로 저장하고, 빌드 상태 파일을 관리하여 실패한 빌드를
+마지막으로 성공한 스테이지부터 재개할 수 있도록 합니다.
+"""
+
+import hashlib
+import json
+import re
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List
+
+from .utils import DOCKER
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DOCKERFILE_PATH = PROJECT_ROOT / "docker" / "Dockerfile"
+BUILD_SCRIPTS_DIR = PROJECT_ROOT / "docker" / "build-scripts"
+ARTIFACTS_DIR = PROJECT_ROOT / "artifacts"
+BUILD_STATE_DIR = PROJECT_ROOT / ".build-state"
+
+# 체크포인트 이미지 저장소 이름
+CHECKPOINT_REPOSITORY = "xaiva-kit-checkpoint"
+
+# Dockerfile 스테이지 시작 줄 (FROM <image> AS <name>)
+STAGE_PATTERN = re.compile(r"^FROM\s+\S+\s+AS\s+(\S+)\s*$", re.IGNORECASE | re.MULTILINE)
+
+# 첫 FROM 이전의 전역 ARG 구간 이름
+DOCKERFILE_PREAMBLE = "<preamble>"
+
+# 체크포인트 스테이지 정의 (빌드 순서)
+#   - stage_arg: 다음 스테이지의 FROM 을 지정하는 Dockerfile ARG
+#   - dockerfile_sections: 스테이지 결과를 결정하는 Dockerfile 구간 (이전 체크포인트 이후의 스테이지)
+#   - scripts: 스테이지에서 실행하는 빌드 스크립트
+#   - build_args: 스테이지 결과에 영향을 주는 build args
+#   - files: 스테이지에서 COPY 하는 프리셋 파일 (artifacts/<preset>/ 기준)
+CHECKPOINT_STAGES: List[Dict[str, Any]] = [
+    {
+        "name": "codecs",
+        "stage_arg": "CODECS_STAGE",
+        "dockerfile_sections": [DOCKERFILE_PREAMBLE, "base", "debs", "deps", "codecs"],
+        "scripts": ["build-codecs.sh"],
+        "build_args": [
+            "BASE_IMAGE", "PRESET_NAME", "BUILD_MODE", "CUDA_ARCH",
+            "PYTHON_VERSION", "PYTHON_VERSION_WITHOUT_DOT",
+            "PYTORCH_VERSION", "TORCHVISION_VERSION", "TORCHAUDIO_VERSION", "PYTORCH_INDEX_URL",
+            "APT_PACKAGES",
+        ],
+        "files": ["requirements-base.txt"],
+    },
+    {
+        "name": "ffmpeg",
+        "stage_arg": "FFMPEG_STAGE",
+        "dockerfile_sections": ["ffmpeg"],
+        "scripts": ["build-ffmpeg.sh"],
+        "build_args": ["FFMPEG_VERSION", "OPT_PROFILE", "OPT_CFLAGS", "OPT_LDFLAGS", "OPT_LTO", "OPT_PGO"],
+        "files": [],
+    },
+    {
+        "name": "opencv",
+        "stage_arg": "OPENCV_STAGE",
+        "dockerfile_sections": ["opencv"],
+        "scripts": ["build-opencv.sh", "cmake-build-helpers.sh"],
+        "build_args": [
+            "OPENCV_VERSION", "OPT_PROFILE", "OPT_CFLAGS", "OPT_LDFLAGS", "OPT_LTO",
+            "BUILD_GENERATOR", "OPENCV_UNITY_BUILD", "UNITY_BATCH_SIZE", "MEASURE_REBUILDS",
+        ],
+        "files": [],
+    },
+    {
+        "name": "xaiva",
+        "stage_arg": "XAIVA_STAGE",
+        "dockerfile_sections": ["xaiva"],
+        "scripts": ["build-xaiva-media.sh", "cmake-build-helpers.sh", "report-cuda-fatbin.sh"],
+        "build_args": [
+            "XAIVA_SOURCE_PATH", "OPT_PROFILE", "OPT_CFLAGS", "OPT_LDFLAGS", "OPT_LTO",
+            "BUILD_GENERATOR", "XAIVA_UNITY_BUILD", "UNITY_BATCH_SIZE", "MEASURE_REBUILDS",
+        ],
+        "files": [],
+    },
+]
+
+
+def _hash_file(digest: Any, path: Path) -> None:
+    """파일 내용을 digest 에 추가 (파일이 없으면 경로만 기록)"""
+    digest.update(str(path.name).encode())
+    if path.is_file():
+        digest.update(path.read_bytes())
+    else:
+        digest.update(b"<missing>")
+
+
+def _dockerfile_sections(path: Path) -> Dict[str, str]:
+    """
+    Dockerfile 을 스테이지별 구간으로 나눕니다.
+
+    각 구간은 "FROM ... AS <name>" 줄부터 다음 FROM 직전까지이며,
+    첫 FROM 이전의 전역 ARG 는 DOCKERFILE_PREAMBLE 구간으로 반환합니다.
+    다음 스테이지의 머리 주석이 앞 구간에 포함되지 않도록 주석/빈 줄은 제외합니다.
+
+    Args:
+        path: Dockerfile 경로
+
+    Returns:
+        {스테이지 이름: 구간 텍스트} 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    if not path.is_file():
+        return {}
+
+    text = "".join(
+        line for line in path.read_text(encoding="utf-8").splitlines(keepends=True)
+        if line.strip() and not line.lstrip().startswith("#")
+    )
+    matches = list(STAGE_PATTERN.finditer(text))
+    if not matches:
+        return {DOCKERFILE_PREAMBLE: text}
+
+    sections = {DOCKERFILE_PREAMBLE: text[:matches[0].start()]}
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        end = next_match.start() if next_match else len(text)
+        sections[match.group(1)] = text[match.start():end]
+
+    return sections
+
+
+def _hash_source_tree(source_path: Path) -> str:
+    """
+    Xaiva Media 소스 트리의 상태를 해시합니다.
+
+    Git 저장소이면 HEAD 커밋, 작업 트리 변경분, 추적되지 않은 파일의 내용을 사용하고,
+    아니면 파일 목록/크기/수정 시각을 사용합니다.
+    COPY ${XAIVA_SOURCE_PATH}/ 는 .gitignore 와 무관하게 디렉터리 전체를 보내므로
+    (.dockerignore 없음) .gitignore 로 제외된 파일(빌드 디렉터리 등)의 내용도 해시합니다.
+
+    Args:
+        source_path: 소스 디렉터리 경로
+
+    Returns:
+        소스 상태 해시
+    """
+    digest = hashlib.sha256()
+
+    if (source_path / ".git").exists():
+        for git_cmd in (
+            ["git", "rev-parse", "HEAD"],
+            ["git", "status", "--porcelain", "--untracked-files=all"],
+            ["git", "diff", "HEAD"],
+        ):
+            result = subprocess.run(git_cmd, cwd=source_path, capture_output=True)
+            digest.update(result.stdout)
+
+        # git diff 에 나타나지 않는 새 파일/무시된 파일은 내용까지 해시
+        # (중첩 저장소는 디렉터리 하나로 나열되므로 .git 을 제외한 파일을 모두 해시)
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--others"],
+            cwd=source_path, capture_output=True
+        )
+        for name in sorted(result.stdout.decode(errors="surrogateescape").split("\0")):
+            if not name:
+                continue
+            path = source_path / name
+            files = [path]
+            if path.is_dir():
+                files = sorted(p for p in path.rglob("*") if p.is_file() and ".git" not in p.relative_to(path).parts)
+            for file_path in files:
+                digest.update(f"{file_path.relative_to(source_path)}\0".encode(errors="surrogateescape"))
+                _hash_file(digest, file_path)
+        return digest.hexdigest()
+
+    if source_path.is_dir():
+        for path in sorted(source_path.rglob("*")):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.relative_to(source_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+def compute_stage_fingerprints(build_args: Dict[str, str], preset_name: str) -> Dict[str, str]:
+    """
+    각 체크포인트 스테이지의 입력 fingerprint 를 계산합니다.
+
+    fingerprint 는 누적 방식으로, 이전 스테이지의 fingerprint 가 다음 스테이지에 포함됩니다.
+    따라서 앞 스테이지의 입력이 바뀌면 이후 모든 체크포인트가 무효화됩니다.
+    Dockerfile 은 스테이지 자신의 구간만 해시하므로, 뒤쪽 스테이지(dev 등)를 수정해도
+    앞쪽 체크포인트는 유지됩니다.
+
+    Args:
+        build_args: Docker build args
+        preset_name: 프리셋 이름
+
+    Returns:
+        {스테이지 이름: fingerprint (12자리)} 딕셔너리
+    """
+    fingerprints = {}
+    sections = _dockerfile_sections(DOCKERFILE_PATH)
+    previous = ""
+
+    for stage in CHECKPOINT_STAGES:
+        digest = hashlib.sha256(previous.encode())
+
+        for section in stage["dockerfile_sections"]:
+            digest.update(f"{section}\0".encode())
+            digest.update(sections.get(section, "<missing>").encode())
+
+        for arg in stage["build_args"]:
+            digest.update(f"{arg}={build_args.get(arg, '')}\n".encode())
+
+        for script in stage["scripts"]:
+            _hash_file(digest, BUILD_SCRIPTS_DIR / script)
+
+        for file_name in stage["files"]:
+            _hash_file(digest, ARTIFACTS_DIR / preset_name / file_name)
+
+        if stage["name"] == "xaiva":
+            source_path = PROJECT_ROOT / build_args.get("XAIVA_SOURCE_PATH", "xaiva-media")
+            digest.update(_hash_source_tree(source_path).encode())
+
+        previous = digest.hexdigest()
+        fingerprints[stage["name"]] = previous[:12]
+
+    return fingerprints
+
+
+def checkpoint_tag(preset_name: str, stage_name: str, fingerprint: str) -> str:
+    """
+    체크포인트 이미지 태그를 생성합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+        stage_name: 스테이지 이름
+        fingerprint: 스테이지 fingerprint
+
+    Returns:
+        체크포인트 이미지 태그 (예: xaiva-kit-checkpoint:<preset>-ffmpeg-<fingerprint>)
+    """
+    return f"{CHECKPOINT_REPOSITORY}:{preset_name}-{stage_name}-{fingerprint}"
+
+
+def get_build_state_path(preset_name: str) -> Path:
+    """
+    프리셋의 빌드 상태 파일 경로를 반환합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+
+    Returns:
+        .build-state/<preset>.json 경로
+    """
+    return BUILD_STATE_DIR / f"{preset_name}.json"
+
+
+def load_build_state(preset_name: str) -> Dict[str, Any]:
+    """
+    빌드 상태 파일을 로드합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+
+    Returns:
+        빌드 상태 딕셔너리 (파일이 없거나 손상된 경우 빈 상태)
+    """
+    state_path = get_build_state_path(preset_name)
+
+    if state_path.is_file():
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if isinstance(state.get("stages"), dict):
+                return state
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    return {"preset": preset_name, "stages": {}}
+
+
+def save_build_state(preset_name: str, state: Dict[str, Any]) -> None:
+    """
+    빌드 상태 파일을 저장합니다 (임시 파일 작성 후 교체).
+
+    Args:
+        preset_name: 프리셋 이름
+        state: 빌드 상태 딕셔너리
+    """
+    state_path = get_build_state_path(preset_name)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state["updated_at"] = datetime.now().isoformat(timespec="seconds")
+
+    tmp_path = state_path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    tmp_path.replace(state_path)
+
+
+def record_stage(state: Dict[str, Any], stage_name: str, fingerprint: str, tag: str, started_at: float) -> None:
+    """
+    완료된 스테이지를 빌드 상태에 기록합니다.
+
+    Args:
+        state: 빌드 상태 딕셔너리
+        stage_name: 스테이지 이름
+        fingerprint: 스테이지 fingerprint
+        tag: 체크포인트 이미지 태그
+        started_at: 스테이지 시작 시각 (time.time())
+    """
+    state["stages"][stage_name] = {
+        "fingerprint": fingerprint,
+        "tag": tag,
+        "completed_at": datetime.now().isoformat(timespec="seconds"),
+        "duration_sec": round(time.time() - started_at, 1),
+    }
+
+
+def image_exists(image_tag: str) -> bool:
+    """
+    로컬에 이미지가 존재하는지 확인합니다.
+
+    Args:
+        image_tag: Docker 이미지 태그
+
+    Returns:
+        존재하면 True
+    """
+    result = subprocess.run(
+        [DOCKER, "image", "inspect", image_tag],
+        capture_output=True
+    )
+    return result.returncode == 0
+
+
+def find_resume_point(state: Dict[str, Any], fingerprints: Dict[str, str]) -> int:
+    """
+    재개할 수 있는 마지막 유효 체크포인트의 인덱스를 찾습니다.
+
+    fingerprint 가 누적 방식이므로, 뒤쪽 스테이지의 체크포인트가 유효하면
+    앞쪽 스테이지 체크포인트 이미지가 없어도 그 지점부터 재개할 수 있습니다.
+
+    Args:
+        state: 빌드 상태 딕셔너리
+        fingerprints: compute_stage_fingerprints() 결과
+
+    Returns:
+        CHECKPOINT_STAGES 인덱스 (유효한 체크포인트가 없으면 -1)
+    """
+    for index in range(len(CHECKPOINT_STAGES) - 1, -1, -1):
+        stage_name = CHECKPOINT_STAGES[index]["name"]
+        entry = state["stages"].get(stage_name)
+
+        if not entry or entry.get("fingerprint") != fingerprints[stage_name]:
+            continue
+
+        if image_exists(entry["tag"]):
+            return index
+
+    return -1
+
+
+def prune_stale_checkpoints(preset_name: str, stage_name: str, keep_tag: str) -> List[str]:
+    """
+    같은 프리셋/스테이지의 오래된 체크포인트 태그를 삭제합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+        stage_name: 스테이지 이름
+        keep_tag: 유지할 (현재) 체크포인트 태그
+
+    Returns:
+        삭제한 태그 리스트
+    """
+    result = subprocess.run(
+        [DOCKER, "images", "--format", "{{.Repository}}:{{.Tag}}", CHECKPOINT_REPOSITORY],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return []
+
+    prefix = f"{CHECKPOINT_REPOSITORY}:{preset_name}-{stage_name}-"
+    stale = [
+        tag for tag in result.stdout.split()
+        if tag.startswith(prefix) and len(tag) == len(keep_tag) and tag != keep_tag
+    ]
+
+    removed = []
+    for tag in stale:
+        if subprocess.run([DOCKER, "rmi", tag], capture_output=True).returncode == 0:
+            removed.append(tag)
+
+    return removed
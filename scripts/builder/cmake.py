@@ -0,0 +1,292 @@
+"""
+CMake 빌드 시스템 모듈
+
+프리셋의 cmake 섹션(generator, unity build)을 해석하여 OpenCV/Xaiva Media 빌드
+스크립트에 전달할 build args를 생성하고, 이미지에 기록된 빌드 시간과
+.ninja_log 를 읽어 타겟별 컴파일 시간 리포트를 작성합니다.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .utils import print_section, print_warning
+from .output import REPORTS_DIR
+
+
+# CMake generator (프리셋 값 → cmake -G 이름)
+CMAKE_GENERATORS: Dict[str, str] = {
+    "make": "Unix Makefiles",
+    "ninja": "Ninja",
+}
+DEFAULT_GENERATOR = "make"
+
+# cmake 로 빌드하는 컴포넌트 (unity build 적용 대상)
+CMAKE_COMPONENTS = ["opencv", "xaiva"]
+
+# unity build 시 하나의 소스로 합치는 파일 수 (CMAKE_UNITY_BUILD_BATCH_SIZE)
+DEFAULT_UNITY_BATCH_SIZE = 8
+
+# 이미지 내 빌드 리포트 디렉터리 (cmake-build-helpers.sh 에서 생성)
+#   <component>/build-times.json: configure/build/no-op/incremental 시간
+#   <component>/ninja_log: 전체 빌드의 .ninja_log (Ninja generator 사용 시)
+BUILD_REPORTS_DIR = "/usr/local/xaiva_media/build-reports"
+
+# .ninja_log 출력 경로에서 CMake 타겟 이름 추출 (예: .../CMakeFiles/opencv_core.dir/src/foo.cpp.o)
+TARGET_PATTERN = re.compile(r"CMakeFiles/([^/]+)\.dir/")
+
+# 리포트에 출력할 타겟 수
+TOP_TARGETS = 10
+
+
+def validate_cmake(cmake: Any) -> List[str]:
+    """
+    프리셋의 cmake 섹션을 검증합니다.
+
+    Args:
+        cmake: 프리셋의 cmake 값
+
+    Returns:
+        에러 메시지 리스트 (빈 리스트면 유효함)
+    """
+    if not isinstance(cmake, dict):
+        return ["Field cmake must be dict"]
+
+    errors = []
+
+    generator = cmake.get("generator", DEFAULT_GENERATOR)
+    if not isinstance(generator, str):
+        errors.append("Field cmake.generator must be string")
+    elif generator not in CMAKE_GENERATORS:
+        errors.append(
+            f"Unknown cmake.generator: {generator} "
+            f"(available: {', '.join(CMAKE_GENERATORS.keys())})"
+        )
+
+    unity_build = cmake.get("unity_build", [])
+    if not isinstance(unity_build, list) or not all(
+        isinstance(c, str) and c in CMAKE_COMPONENTS for c in unity_build
+    ):
+        errors.append(f"Field cmake.unity_build must be a list of: {', '.join(CMAKE_COMPONENTS)}")
+
+    batch_size = cmake.get("unity_batch_size", DEFAULT_UNITY_BATCH_SIZE)
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+        errors.append("Field cmake.unity_batch_size must be a positive integer")
+
+    if "measure_rebuilds" in cmake and not isinstance(cmake["measure_rebuilds"], bool):
+        errors.append("Field cmake.measure_rebuilds must be bool")
+
+    return errors
+
+
+def get_cmake_build_args(preset: Dict[str, Any]) -> Dict[str, str]:
+    """
+    프리셋의 cmake 섹션으로부터 Docker build args를 생성합니다.
+
+    Args:
+        preset: 프리셋 데이터
+
+    Returns:
+        BUILD_GENERATOR, <COMPONENT>_UNITY_BUILD 등 build args 딕셔너리
+    """
+    cmake = preset.get("cmake", {})
+    unity_build = cmake.get("unity_build", [])
+
+    build_args = {
+        "BUILD_GENERATOR": CMAKE_GENERATORS[cmake.get("generator", DEFAULT_GENERATOR)],
+        "UNITY_BATCH_SIZE": str(cmake.get("unity_batch_size", DEFAULT_UNITY_BATCH_SIZE)),
+        "MEASURE_REBUILDS": "1" if cmake.get("measure_rebuilds", False) else "0",
+    }
+    for component in CMAKE_COMPONENTS:
+        build_args[f"{component.upper()}_UNITY_BUILD"] = "1" if component in unity_build else "0"
+
+    return build_args
+
+
+def parse_ninja_log(text: str) -> List[Dict[str, Any]]:
+    """
+    .ninja_log(v5)에서 마지막 빌드의 엣지 목록을 추출합니다.
+
+    ninja 는 빌드마다 시작 시각을 0 으로 다시 기록하므로, 종료 시각이 감소하는
+    지점을 새 빌드의 시작으로 봅니다. 출력이 여러 개인 엣지는 한 번만 집계합니다.
+
+    Args:
+        text: .ninja_log 내용
+
+    Returns:
+        엣지 리스트 ({"output", "start_ms", "end_ms"})
+    """
+    edges: List[Dict[str, Any]] = []
+    seen = set()
+    last_end = -1
+
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+
+        fields = line.split("\t")
+        if len(fields) != 5 or not fields[0].isdigit() or not fields[1].isdigit():
+            continue
+
+        start, end, output, command_hash = int(fields[0]), int(fields[1]), fields[3], fields[4]
+        if end < last_end:
+            edges = []
+            seen = set()
+        last_end = end
+
+        key = (start, end, command_hash)
+        if key in seen:
+            continue
+        seen.add(key)
+        edges.append({"output": output, "start_ms": start, "end_ms": end})
+
+    return edges
+
+
+def summarize_ninja_log(edges: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    엣지 목록을 CMake 타겟별 컴파일 시간으로 집계합니다.
+
+    Args:
+        edges: parse_ninja_log() 결과
+
+    Returns:
+        빌드 요약 (엣지 수, wall/CPU 시간, 타겟별 시간 내림차순)
+    """
+    targets: Dict[str, Dict[str, Any]] = {}
+
+    for edge in edges:
+        match = TARGET_PATTERN.search(edge["output"])
+        # CMakeFiles 밖의 출력(링크 결과물 등)은 파일 이름으로 집계
+        name = match.group(1) if match else Path(edge["output"]).name
+        entry = targets.setdefault(name, {"target": name, "edges": 0, "cpu_ms": 0, "start_ms": None, "end_ms": 0})
+        entry["edges"] += 1
+        entry["cpu_ms"] += edge["end_ms"] - edge["start_ms"]
+        entry["start_ms"] = edge["start_ms"] if entry["start_ms"] is None else min(entry["start_ms"], edge["start_ms"])
+        entry["end_ms"] = max(entry["end_ms"], edge["end_ms"])
+
+    if not edges:
+        return {"edges": 0, "wall_sec": 0.0, "cpu_sec": 0.0, "targets": []}
+
+    wall_ms = max(e["end_ms"] for e in edges) - min(e["start_ms"] for e in edges)
+    cpu_ms = sum(e["end_ms"] - e["start_ms"] for e in edges)
+
+    return {
+        "edges": len(edges),
+        "wall_sec": round(wall_ms / 1000, 1),
+        "cpu_sec": round(cpu_ms / 1000, 1),
+        "targets": [
+            {
+                "target": entry["target"],
+                "edges": entry["edges"],
+                "cpu_sec": round(entry["cpu_ms"] / 1000, 1),
+                "span_sec": round((entry["end_ms"] - entry["start_ms"]) / 1000, 1),
+            }
+            for entry in sorted(targets.values(), key=lambda t: t["cpu_ms"], reverse=True)
+        ],
+    }
+
+
+def _load_component(times_text: Optional[str], ninja_log_text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """이미지에서 읽은 컴포넌트 빌드 시간/.ninja_log 를 리포트 항목으로 변환"""
+    if times_text is None:
+        return None
+
+    try:
+        component = json.loads(times_text)
+    except ValueError:
+        return None
+
+    if ninja_log_text is not None:
+        component["ninja"] = summarize_ninja_log(parse_ninja_log(ninja_log_text))
+
+    return component
+
+
+def _seconds(value: Optional[float]) -> str:
+    """초 단위 시간 문자열 (측정하지 않았으면 '-')"""
+    return "-" if value is None else f"{value:.1f}s"
+
+
+def report_build_times(
+    preset_name: str,
+    component_files: Dict[str, Tuple[Optional[str], Optional[str]]],
+    stages: Dict[str, Any]
+) -> Optional[Path]:
+    """
+    컴포넌트별 빌드 시간과 타겟별 컴파일 시간을 출력하고 빌드 리포트로 저장합니다.
+
+    이전 리포트가 있으면 컴포넌트별 빌드 시간을 이전 설정(generator/unity build)과 비교합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+        component_files: 컴포넌트별 (build-times.json 내용, ninja_log 내용), 읽기 실패 시 None
+        stages: 빌드 상태 파일의 스테이지 기록 (체크포인트 빌드가 아니면 빈 딕셔너리)
+
+    Returns:
+        리포트 파일 경로 (빌드 시간 기록이 없으면 None)
+    """
+    components = {}
+    for name, (times_text, ninja_log_text) in component_files.items():
+        component = _load_component(times_text, ninja_log_text)
+        if component is not None:
+            components[name] = component
+
+    if not components:
+        print_warning(f"Build time records not found in image: {BUILD_REPORTS_DIR}")
+        return None
+
+    report_path = REPORTS_DIR / f"{preset_name}-build-report.json"
+    previous: Dict[str, Any] = {}
+    if report_path.is_file():
+        try:
+            previous = json.loads(report_path.read_text(encoding="utf-8")).get("components", {})
+        except ValueError:
+            previous = {}
+
+    print_section("CMake Build Report")
+
+    for name, component in components.items():
+        unity = f"unity x{component.get('unity_batch_size')}" if component.get("unity_build") else "no unity"
+        print(f"  {name}: {component.get('generator')}, {unity}, {component.get('jobs')} jobs")
+
+        line = (
+            f"    configure {_seconds(component.get('configure_sec'))}, "
+            f"build {_seconds(component.get('build_sec'))}, "
+            f"no-op {_seconds(component.get('noop_sec'))}, "
+            f"incremental {_seconds(component.get('incremental_sec'))}"
+        )
+        old = previous.get(name, {})
+        if old.get("build_sec") and component.get("build_sec") is not None:
+            old_unity = "unity" if old.get("unity_build") else "no unity"
+            change = (component["build_sec"] - old["build_sec"]) / old["build_sec"] * 100
+            line += f"  (build {change:+.1f}% vs {old['build_sec']:.1f}s, {old.get('generator')}, {old_unity})"
+        print(line)
+
+        ninja = component.get("ninja")
+        if ninja and ninja["edges"]:
+            parallelism = ninja["cpu_sec"] / ninja["wall_sec"] if ninja["wall_sec"] else 0
+            print(f"    {ninja['edges']} edges, {ninja['cpu_sec']:.1f}s CPU, parallelism {parallelism:.1f}x")
+            for target in ninja["targets"][:TOP_TARGETS]:
+                print(f"      {target['target']:<40} {target['cpu_sec']:>9.1f}s  ({target['edges']} edges)")
+        print()
+
+    if stages:
+        durations = ", ".join(
+            f"{name} {stage['duration_sec']:.0f}s" for name, stage in stages.items() if "duration_sec" in stage
+        )
+        print(f"  Stage durations: {durations}")
+
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "preset": preset_name,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "stages": {name: stage.get("duration_sec") for name, stage in stages.items()},
+            "components": components,
+        }, f, indent=2)
+
+    print(f"  Report: {report_path}")
+    return report_path
@@ -0,0 +1,117 @@
+"""
+CUDA 아키텍처 모듈
+
+프리셋의 cuda.arch 설정(단일 값 또는 리스트)을 해석하고,
+빌드된 이미지의 CUDA fat binary 구성(SASS/PTX)을 분석합니다.
+"""
+
+from typing import Dict, Any, List
+
+
+# 이미지 내 fat binary 리포트 경로 (report-cuda-fatbin.sh 에서 생성)
+FATBIN_REPORT_PATH = "/usr/local/xaiva_media/cuda-fatbin-report.tsv"
+
+# 아키텍처를 알 수 없는 디바이스 코드 항목 (report-cuda-fatbin.sh 에서 arch 파싱 실패 시)
+UNKNOWN_ARCH = "unknown"
+
+
+def get_cuda_archs(preset: Dict[str, Any]) -> List[str]:
+    """
+    프리셋의 cuda.arch 값을 정렬된 아키텍처 리스트로 변환합니다.
+
+    Args:
+        preset: 프리셋 데이터
+
+    Returns:
+        중복이 제거되고 오름차순 정렬된 아키텍처 리스트 (예: ["70", "86"])
+    """
+    arch = preset["cuda"]["arch"]
+    archs = [arch] if isinstance(arch, str) else list(arch)
+    return sorted(set(archs), key=int)
+
+
+def get_ptx_arch(archs: List[str]) -> str:
+    """
+    PTX 를 포함하는 최상위 아키텍처를 반환합니다.
+
+    Args:
+        archs: 빌드 대상 아키텍처 리스트 (정렬 여부와 무관)
+
+    Returns:
+        숫자 값이 가장 큰 아키텍처 (예: ["86", "70"] → "86")
+    """
+    return max(archs, key=int)
+
+
+def validate_cuda_arch(arch: Any) -> List[str]:
+    """
+    cuda.arch 값을 검증합니다.
+
+    Args:
+        arch: 프리셋의 cuda.arch 값 (문자열 또는 문자열 리스트)
+
+    Returns:
+        에러 메시지 리스트 (빈 리스트면 유효함)
+    """
+    if isinstance(arch, str):
+        archs = [arch]
+    elif isinstance(arch, list):
+        if not arch:
+            return ["Field cuda.arch must not be empty"]
+        archs = arch
+    else:
+        return ["Field cuda.arch must be str or list"]
+
+    errors = []
+    for value in archs:
+        if not isinstance(value, str) or not value.isdigit():
+            errors.append(f"Invalid CUDA architecture in cuda.arch: {value!r} (e.g. \"86\")")
+
+    return errors
+
+
+def parse_fatbin_report(report: str) -> Dict[str, Dict[str, int]]:
+    """
+    report-cuda-fatbin.sh 가 생성한 TSV 리포트를 파싱합니다.
+
+    Args:
+        report: 리포트 파일 내용 (kind<TAB>arch<TAB>bytes)
+
+    Returns:
+        {arch: {"sass": bytes, "ptx": bytes}} 딕셔너리
+    """
+    result: Dict[str, Dict[str, int]] = {}
+
+    for line in report.splitlines():
+        fields = line.strip().split("\t")
+        if len(fields) != 3 or fields[0] == "kind" or not fields[2].isdigit():
+            continue
+
+        kind, arch, size = fields
+        entry = result.setdefault(arch, {"sass": 0, "ptx": 0})
+        entry[kind] = entry.get(kind, 0) + int(size)
+
+    return result
+
+
+def calculate_fatbin_overhead(fatbin: Dict[str, Dict[str, int]], archs: List[str]) -> int:
+    """
+    단일 아키텍처 이미지 대비 추가된 디바이스 코드 크기를 계산합니다.
+
+    최상위 아키텍처의 SASS + PTX 를 단일 아키텍처 빌드의 기준으로 보고,
+    나머지 아키텍처의 SASS/PTX 를 오버헤드로 계산합니다.
+    아키텍처를 알 수 없는 항목(UNKNOWN_ARCH)은 어느 쪽인지 판단할 수 없으므로 제외합니다.
+
+    Args:
+        fatbin: parse_fatbin_report() 결과
+        archs: 빌드 대상 아키텍처 리스트
+
+    Returns:
+        오버헤드 (bytes)
+    """
+    primary = int(get_ptx_arch(archs))
+    return sum(
+        entry["sass"] + entry["ptx"]
+        for arch, entry in fatbin.items()
+        if arch.isdigit() and int(arch) != primary
+    )
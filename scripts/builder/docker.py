@@ -4,11 +4,36 @@ Docker 빌드 모듈
 Docker 이미지 빌드 관련 기능을 제공합니다.
 """
 
+import os
 import subprocess
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-from .utils import print_section, print_error, print_success
+from .utils import DOCKER, print_section, print_error, print_success, print_warning, print_info, format_size
+from .optimization import get_optimization_build_args
+from .cmake import CMAKE_COMPONENTS, BUILD_REPORTS_DIR, get_cmake_build_args, report_build_times
+from .cuda import (
+    get_cuda_archs, get_ptx_arch, parse_fatbin_report, calculate_fatbin_overhead,
+    FATBIN_REPORT_PATH, UNKNOWN_ARCH,
+)
+from .apt import get_apt_packages, check_deb_cache
+from .output import get_output_args, verify_image_layers
+from .startup import (
+    STARTUP_TARGET, STARTUP_BASELINE_TARGET, STARTUP_MANIFEST_PATH,
+    is_startup_enabled, get_startup_modules, has_gpu_runtime, measure_startup, report_startup,
+)
+from .checkpoint import (
+    CHECKPOINT_STAGES,
+    compute_stage_fingerprints,
+    checkpoint_tag,
+    load_build_state,
+    save_build_state,
+    record_stage,
+    find_resume_point,
+    prune_stale_checkpoints,
+)
 
 
 # 프로젝트 경로 설정
@@ -34,7 +59,11 @@ def build_docker_image(
     preset_name: str,
     build_mode: str,
     env_vars: Dict[str, str],
-    dry_run: bool = False
+    dry_run: bool = False,
+    resume: bool = False,
+    checkpoints: bool = True,
+    output_format: str = "docker",
+    optimize_startup: bool = False
 ) -> int:
     """
     Docker 이미지를 빌드합니다.
@@ -45,11 +74,20 @@ def build_docker_image(
         build_mode: 빌드 모드 (online/offline/auto)
         env_vars: 환경 변수
         dry_run: True일 경우 명령어만 출력하고 실행하지 않음
+        resume: 마지막 유효 체크포인트부터 빌드 재개
+        checkpoints: 중간 스테이지 체크포인트 사용 여부 (False면 단일 docker build)
+        output_format: 최종 이미지 출력 형식 (docker/gzip/zstd/estargz)
+        optimize_startup: 시작 시간 최적화 스테이지(startup) 사용 여부 (프리셋 startup.enabled 와 OR)
     
     Returns:
         Exit code (0 = success)
     """
     image_tag = generate_image_tag(preset_name)
+    output_args = get_output_args(output_format, image_tag)
+    
+    # 최종 타겟 (시작 시간 최적화 시 dev 위에 startup 스테이지 추가)
+    optimize_startup = optimize_startup or is_startup_enabled(preset)
+    final_target = STARTUP_TARGET if optimize_startup else "dev"
     
     # Build arguments 준비
     build_args = {
@@ -58,7 +96,8 @@ def build_docker_image(
         "BUILD_MODE": build_mode,
         "PYTHON_VERSION": preset["python"]["version"],
         "PYTHON_VERSION_WITHOUT_DOT": preset["python"]["version_without_dot"],
-        "CUDA_ARCH": preset["cuda"]["arch"],
+        # 다중 아키텍처는 CMake 리스트 형식으로 전달 (예: "70;86")
+        "CUDA_ARCH": ";".join(get_cuda_archs(preset)),
     }
     
     # PyTorch 버전 관리
@@ -95,17 +134,101 @@ def build_docker_image(
             if "path" in xaiva_source:
                 build_args["XAIVA_SOURCE_PATH"] = xaiva_source["path"]
     
+    # 컴파일러 최적화 프로파일
+    build_args.update(get_optimization_build_args(preset))
+    
+    # CMake generator/unity build (OpenCV, Xaiva Media)
+    build_args.update(get_cmake_build_args(preset))
+    
+    # APT 패키지 (단일 레이어 설치, 로컬 .deb 미러가 유효하면 오프라인 설치)
+    build_args["APT_PACKAGES"] = " ".join(get_apt_packages(preset))
+    build_args["APT_LOCAL_REPO"] = "1" if check_deb_cache(preset, preset_name) else "0"
+    
     # .env에서 추가 build args (필요시 - 환경변수가 우선)
     if "XAIVA_MEDIA_SOURCE_PATH" in env_vars:
         build_args["XAIVA_SOURCE_PATH"] = env_vars["XAIVA_MEDIA_SOURCE_PATH"]
     
-    # Docker build 명령어 생성 (항상 dev 타겟 사용)
-    cmd = [
-        "docker", "build",
-        "-f", str(DOCKERFILE_PATH),
-        "-t", image_tag,
-        "--target", "dev",
-    ]
+    if checkpoints:
+        returncode = _build_with_checkpoints(
+            image_tag, preset_name, build_args, resume, dry_run, output_args, final_target
+        )
+    else:
+        # Docker build 명령어 생성 (dev 또는 startup 타겟)
+        cmd = _build_command(image_tag, final_target, build_args, output_args)
+        
+        # 명령어 출력
+        print_section("Docker Build Command")
+        print("  " + " ".join(cmd))
+        
+        if dry_run:
+            print_success("Dry run mode - command not executed")
+            return 0
+        
+        # 실행
+        print_section("Building Docker Image")
+        print(f"  This may take a while...")
+        print()
+        
+        returncode = _run_docker_build(cmd)
+    
+    if returncode == 0 and not dry_run:
+        report_cuda_fatbin(image_tag, get_cuda_archs(preset))
+        
+        # 컴포넌트별 빌드 시간 및 타겟별 컴파일 시간 (.ninja_log)
+        report_build_times(
+            preset_name,
+            {
+                component: (
+                    read_image_file(image_tag, f"{BUILD_REPORTS_DIR}/{component}/build-times.json"),
+                    read_image_file(image_tag, f"{BUILD_REPORTS_DIR}/{component}/ninja_log"),
+                )
+                for component in CMAKE_COMPONENTS
+            },
+            load_build_state(preset_name).get("stages", {}) if checkpoints else {}
+        )
+        
+        if optimize_startup:
+            _report_startup(image_tag, preset, preset_name, build_args, checkpoints)
+        
+        # 레이어 압축 크기/압축 해제 시간 검증 (gzip 대비)
+        if output_args:
+            verify_image_layers(image_tag, preset_name, output_format)
+    
+    return returncode
+
+
+def _build_command(
+    image_tag: Optional[str],
+    target: str,
+    build_args: Dict[str, str],
+    output_args: Optional[List[str]] = None,
+    iidfile: Optional[str] = None
+) -> List[str]:
+    """
+    docker build 명령어를 생성합니다.
+    
+    Args:
+        image_tag: 결과 이미지 태그 (None 이면 태그 없이 빌드)
+        target: Dockerfile 타겟 스테이지
+        build_args: Docker build args
+        output_args: buildx --output 인자 (지정 시 docker buildx build 사용)
+        iidfile: 결과 이미지 ID 를 기록할 파일 경로
+    
+    Returns:
+        명령어 리스트
+    """
+    if output_args:
+        # 레이어 압축 형식 지정은 buildx image exporter 로 처리
+        cmd = [DOCKER, "buildx", "build", "-f", str(DOCKERFILE_PATH)] + output_args
+    else:
+        cmd = [DOCKER, "build", "-f", str(DOCKERFILE_PATH)]
+        if image_tag:
+            cmd.extend(["-t", image_tag])
+    
+    if iidfile:
+        cmd.extend(["--iidfile", iidfile])
+    
+    cmd.extend(["--target", target])
     
     # Build arguments 추가
     for key, value in build_args.items():
@@ -114,21 +237,23 @@ def build_docker_image(
     # Build context는 프로젝트 루트
     cmd.append(str(PROJECT_ROOT))
     
-    # 명령어 출력
-    print_section("Docker Build Command")
-    print("  " + " ".join(cmd))
+    return cmd
+
+
+def _run_docker_build(cmd: List[str]) -> int:
+    """
+    docker build 명령어를 실행합니다.
     
-    if dry_run:
-        print_success("Dry run mode - command not executed")
-        return 0
+    Dockerfile 의 RUN --mount 는 BuildKit 에서만 동작하므로 DOCKER_BUILDKIT=1 로 실행합니다.
     
-    # 실행
-    print_section("Building Docker Image")
-    print(f"  This may take a while...")
-    print()
+    Args:
+        cmd: 명령어 리스트
     
+    Returns:
+        Exit code (0 = success)
+    """
     try:
-        result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=dict(os.environ, DOCKER_BUILDKIT="1"))
         return result.returncode
     
     except KeyboardInterrupt:
@@ -137,4 +262,261 @@ def build_docker_image(
     
     except Exception as e:
         print_error(f"Failed to run docker build: {e}")
-        return 1
\ No newline at end of file
+        return 1
+
+
+def _build_with_checkpoints(
+    image_tag: str,
+    preset_name: str,
+    build_args: Dict[str, str],
+    resume: bool,
+    dry_run: bool,
+    output_args: Optional[List[str]] = None,
+    final_target: str = "dev"
+) -> int:
+    """
+    중간 스테이지를 체크포인트 이미지로 태깅하면서 단계별로 빌드합니다.
+    
+    각 스테이지는 이전 스테이지의 체크포인트 이미지를 베이스로 빌드되므로,
+    Docker 레이어 캐시가 없어도 --resume 시 마지막 유효 체크포인트부터 재개할 수 있습니다.
+    
+    Args:
+        image_tag: 최종 이미지 태그
+        preset_name: 프리셋 이름
+        build_args: Docker build args
+        resume: 마지막 유효 체크포인트부터 재개할지 여부
+        dry_run: True일 경우 명령어만 출력하고 실행하지 않음
+        output_args: 최종 이미지의 buildx --output 인자 (체크포인트 스테이지에는 적용하지 않음)
+        final_target: 최종 이미지 Dockerfile 타겟 (dev 또는 startup)
+    
+    Returns:
+        Exit code (0 = success)
+    """
+    build_args = dict(build_args)
+    fingerprints = compute_stage_fingerprints(build_args, preset_name)
+    state = load_build_state(preset_name)
+    state["preset"] = preset_name
+    
+    start_index = 0
+    if resume:
+        resume_index = find_resume_point(state, fingerprints)
+        if resume_index >= 0:
+            stage = CHECKPOINT_STAGES[resume_index]
+            tag = state["stages"][stage["name"]]["tag"]
+            build_args[stage["stage_arg"]] = tag
+            start_index = resume_index + 1
+            print_info(f"Resuming after stage '{stage['name']}' from checkpoint: {tag}")
+        else:
+            print_warning("No valid checkpoint found, building from the beginning")
+    
+    # 빌드 계획 출력
+    print_section("Build Plan")
+    for index, stage in enumerate(CHECKPOINT_STAGES):
+        action = "reuse checkpoint" if index < start_index else "build"
+        print(f"  {index + 1}. {stage['name']:<8} [{fingerprints[stage['name']]}] {action}")
+    print(f"  {len(CHECKPOINT_STAGES) + 1}. {final_target:<8} -> {image_tag}")
+    
+    if dry_run:
+        print_section("Docker Build Commands")
+        for stage in CHECKPOINT_STAGES[start_index:]:
+            tag = checkpoint_tag(preset_name, stage["name"], fingerprints[stage["name"]])
+            print("  " + " ".join(_build_command(tag, stage["name"], build_args)))
+            build_args[stage["stage_arg"]] = tag
+        print("  " + " ".join(_build_command(image_tag, final_target, build_args, output_args)))
+        print_success("Dry run mode - command not executed")
+        return 0
+    
+    # 다시 빌드할 스테이지의 이전 기록 제거
+    for stage in CHECKPOINT_STAGES[start_index:]:
+        state["stages"].pop(stage["name"], None)
+    state["status"] = "running"
+    state.pop("failed_stage", None)
+    save_build_state(preset_name, state)
+    
+    print_section("Building Docker Image")
+    print(f"  This may take a while...")
+    
+    for index in range(start_index, len(CHECKPOINT_STAGES)):
+        stage = CHECKPOINT_STAGES[index]
+        stage_name = stage["name"]
+        tag = checkpoint_tag(preset_name, stage_name, fingerprints[stage_name])
+        
+        print_section(f"Stage {index + 1}/{len(CHECKPOINT_STAGES)}: {stage_name}")
+        print()
+        
+        started_at = time.time()
+        returncode = _run_docker_build(_build_command(tag, stage_name, build_args))
+        
+        if returncode != 0:
+            state["status"] = "failed"
+            state["failed_stage"] = stage_name
+            save_build_state(preset_name, state)
+            print_error(f"Stage '{stage_name}' failed")
+            print("  Re-run with --resume to continue from the last completed checkpoint")
+            return returncode
+        
+        record_stage(state, stage_name, fingerprints[stage_name], tag, started_at)
+        save_build_state(preset_name, state)
+        print_success(f"Checkpoint saved: {tag}")
+        
+        for removed in prune_stale_checkpoints(preset_name, stage_name, tag):
+            print(f"  Pruned stale checkpoint: {removed}")
+        
+        build_args[stage["stage_arg"]] = tag
+    
+    # 최종 이미지 빌드
+    print_section(f"Final stage: {final_target}")
+    print()
+    returncode = _run_docker_build(_build_command(image_tag, final_target, build_args, output_args))
+    
+    if returncode == 0:
+        state["status"] = "success"
+    else:
+        state["status"] = "failed"
+        state["failed_stage"] = final_target
+        print("  Re-run with --resume to continue from the last completed checkpoint")
+    save_build_state(preset_name, state)
+    
+    return returncode
+
+
+def _report_startup(
+    image_tag: str,
+    preset: Dict[str, Any],
+    preset_name: str,
+    build_args: Dict[str, str],
+    checkpoints: bool
+) -> None:
+    """
+    최적화 전(dev)/후(startup) 이미지의 새 컨테이너에서 시작 시간을 측정하여 출력합니다.
+    
+    dev 타겟은 방금 빌드한 startup 이미지의 캐시로 태그 없이 다시 빌드하며,
+    측정 후 (다른 태그가 없으면) 삭제합니다. GPU 런타임이 있으면 --gpus all 로 측정합니다.
+    
+    Args:
+        image_tag: startup 이미지 태그
+        preset: 프리셋 데이터
+        preset_name: 프리셋 이름
+        build_args: Docker build args
+        checkpoints: 체크포인트 빌드 여부 (체크포인트 이미지를 스테이지 베이스로 사용)
+    """
+    build_args = dict(build_args)
+    if checkpoints:
+        stages = load_build_state(preset_name).get("stages", {})
+        for stage in CHECKPOINT_STAGES:
+            if stage["name"] in stages:
+                build_args[stage["stage_arg"]] = stages[stage["name"]]["tag"]
+    
+    print_section("Measuring Startup")
+    with tempfile.TemporaryDirectory() as tmp:
+        iidfile = os.path.join(tmp, "iid")
+        cmd = _build_command(None, STARTUP_BASELINE_TARGET, build_args, iidfile=iidfile)
+        if _run_docker_build(cmd) != 0 or not os.path.isfile(iidfile):
+            print_warning(f"Failed to build '{STARTUP_BASELINE_TARGET}' target for startup baseline")
+            return
+        with open(iidfile, 'r', encoding='utf-8') as f:
+            baseline = f.read().strip()
+    
+    modules = get_startup_modules(preset)
+    gpus = has_gpu_runtime()
+    if not gpus:
+        print_warning("No NVIDIA runtime found, measuring startup without GPU")
+    
+    before = measure_startup(baseline, modules, "before", gpus)
+    after = measure_startup(image_tag, modules, "after", gpus)
+    
+    # 같은 이미지를 가리키는 태그가 있으면 (예: 이전 dev 빌드) 남겨 둠
+    tags = subprocess.run(
+        [DOCKER, "image", "inspect", "--format", "{{len .RepoTags}}", baseline],
+        capture_output=True,
+        text=True
+    )
+    if tags.returncode == 0 and tags.stdout.strip() == "0":
+        subprocess.run([DOCKER, "rmi", baseline], capture_output=True)
+    
+    report_startup(read_image_file(image_tag, STARTUP_MANIFEST_PATH), before, after, gpus)
+
+
+def read_image_file(image_tag: str, path: str) -> Optional[str]:
+    """
+    이미지 내부 파일 내용을 읽습니다.
+    
+    Args:
+        image_tag: Docker 이미지 태그
+        path: 이미지 내부 파일 경로
+    
+    Returns:
+        파일 내용 (읽기 실패 시 None)
+    """
+    result = subprocess.run(
+        [DOCKER, "run", "--rm", "--entrypoint", "cat", image_tag, path],
+        capture_output=True,
+        text=True
+    )
+    
+    if result.returncode != 0:
+        return None
+    
+    return result.stdout
+
+
+def get_image_size(image_tag: str) -> Optional[int]:
+    """
+    이미지 크기를 조회합니다.
+    
+    Args:
+        image_tag: Docker 이미지 태그
+    
+    Returns:
+        이미지 크기 (bytes, 조회 실패 시 None)
+    """
+    result = subprocess.run(
+        [DOCKER, "image", "inspect", "--format", "{{.Size}}", image_tag],
+        capture_output=True,
+        text=True
+    )
+    
+    if result.returncode != 0 or not result.stdout.strip().isdigit():
+        return None
+    
+    return int(result.stdout.strip())
+
+
+def report_cuda_fatbin(image_tag: str, archs: List[str]) -> None:
+    """
+    이미지에 포함된 CUDA 디바이스 코드(SASS/PTX) 구성과 다중 아키텍처 오버헤드를 출력합니다.
+    
+    Args:
+        image_tag: Docker 이미지 태그
+        archs: 빌드 대상 아키텍처 리스트
+    """
+    report = read_image_file(image_tag, FATBIN_REPORT_PATH)
+    if report is None:
+        print_warning(f"CUDA fat binary report not found in image: {FATBIN_REPORT_PATH}")
+        return
+    
+    fatbin = parse_fatbin_report(report)
+    ptx_arch = get_ptx_arch(archs)
+    unknown = fatbin.pop(UNKNOWN_ARCH, None)
+    
+    print_section("CUDA Fat Binary Report")
+    print(f"  Target architectures: {', '.join(archs)} (PTX: {ptx_arch})")
+    for arch in sorted(fatbin, key=lambda a: int(a) if a.isdigit() else 0):
+        entry = fatbin[arch]
+        print(f"  sm_{arch:<8} SASS {format_size(entry['sass']):>10}   PTX {format_size(entry['ptx']):>10}")
+    
+    total = sum(entry["sass"] + entry["ptx"] for entry in fatbin.values())
+    print(f"  Total device code: {format_size(total)}")
+    
+    # 아키텍처를 알 수 없는 항목은 합계/오버헤드에서 제외하고 따로 표시
+    if unknown:
+        print(f"  Unknown architecture (excluded): SASS {format_size(unknown['sass'])}, "
+              f"PTX {format_size(unknown['ptx'])}")
+    
+    if len(archs) > 1:
+        overhead = calculate_fatbin_overhead(fatbin, archs)
+        image_size = get_image_size(image_tag)
+        line = f"  Multi-arch overhead vs sm_{ptx_arch} only: {format_size(overhead)}"
+        if image_size:
+            line += f" ({overhead / image_size * 100:.1f}% of {format_size(image_size)} image)"
+        print(line)
\ No newline at end of file
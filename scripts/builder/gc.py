@@ -0,0 +1,674 @@
+"""
+가비지 컬렉션 모듈
+
+빌드가 남기는 최종 이미지(xaiva-kit:<preset>), 체크포인트 이미지, dangling 이미지,
+BuildKit 빌드 캐시, artifacts/<preset>/debs 캐시를 디스크 예산(budget) 안으로 정리합니다.
+
+- 예산 대상: xaiva-kit 이미지(최종/체크포인트/dangling), BuildKit 빌드 캐시(전역), artifacts/*/debs
+- 이미지 사용량은 docker system df 의 중복 제거된 크기로 측정 (공유 레이어는 한 번만 계산)
+- 프리셋별 마지막 사용 시각(.build-state/usage.json)을 기준으로 LRU 순서로 삭제
+- 보호된 프리셋과 빌드 중인 프리셋은 삭제하지 않음
+  (빌드는 .build-state/locks/ 의 builds.lock, <preset>.lock 에 공유 잠금을 잡고, gc 는 배타 잠금을 시도)
+- docker 실행 파일은 XAIVA_KIT_DOCKER 환경 변수로 대체 가능 (tests/fake_docker.py)
+"""
+
+import fcntl
+import json
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, IO, Iterator
+
+from .utils import DOCKER, print_section, print_error, print_success, print_warning, print_info, format_size
+from .apt import get_debs_dir
+from .checkpoint import BUILD_STATE_DIR, CHECKPOINT_REPOSITORY, CHECKPOINT_STAGES
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ARTIFACTS_DIR = PROJECT_ROOT / "artifacts"
+
+# 사용 기록 및 잠금 파일
+USAGE_PATH = BUILD_STATE_DIR / "usage.json"
+LOCKS_DIR = BUILD_STATE_DIR / "locks"
+
+# 모든 빌드가 공유 잠금을 잡는 전역 잠금 (gc 는 빌드 캐시 정리 시 배타 잠금)
+BUILDS_LOCK = "builds"
+
+# 빌드 이미지 라벨 (Dockerfile dev 스테이지)
+PRESET_LABEL = "xaiva-kit.preset"
+
+# 최종 이미지 저장소 이름 (docker.generate_image_tag 참고)
+IMAGE_REPOSITORY = "xaiva-kit"
+
+# 같은 프리셋 안에서의 삭제 순서 (다시 만들기 쉬운 것부터)
+EVICTION_ORDER = {"checkpoint": 0, "artifacts": 1, "image": 2}
+
+# 크기 단위 (대소문자 무시, "i" 접미사는 항상 1024 단위)
+SIZE_PATTERN = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([kmgt]?)(i?)b?\s*$", re.IGNORECASE)
+SIZE_EXPONENTS = {"": 0, "k": 1, "m": 2, "g": 3, "t": 4}
+
+
+def parse_size(text: str, base: int = 1024) -> int:
+    """
+    크기 문자열을 바이트로 변환합니다.
+
+    Args:
+        text: 크기 문자열 (예: "200G", "1.5TB", "512MiB", "0B")
+        base: 단위 배수 (1024: 예산 지정, 1000: docker CLI 출력)
+
+    Returns:
+        바이트 수
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    match = SIZE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r} (e.g. 200G, 1.5T)")
+
+    value, unit, binary = match.groups()
+    multiplier = 1024 if binary else base
+    return int(float(value) * multiplier ** SIZE_EXPONENTS[unit.lower()])
+
+
+def _lock_path(name: str) -> Path:
+    return LOCKS_DIR / f"{name}.lock"
+
+
+def _try_lock(name: str, mode: int) -> Optional[IO]:
+    """잠금 시도 (이미 잠겨 있으면 None)"""
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
+    lock_file = open(_lock_path(name), "a")
+    try:
+        fcntl.flock(lock_file, mode | fcntl.LOCK_NB)
+        return lock_file
+    except BlockingIOError:
+        lock_file.close()
+        return None
+
+
+def _is_locked(name: str) -> bool:
+    """
+    다른 프로세스가 잠금을 잡고 있는지 확인합니다 (dry run 용).
+
+    잠금 파일을 만들지 않고, 배타 잠금을 즉시 해제하는 non-blocking 확인만 합니다.
+    """
+    try:
+        lock_file = open(_lock_path(name), "r")
+    except OSError:
+        return False
+
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return False
+    except BlockingIOError:
+        return True
+    finally:
+        lock_file.close()
+
+
+def _wait_lock(name: str, message: str) -> IO:
+    """공유 잠금 획득 (gc 가 배타 잠금 중이면 메시지 출력 후 대기)"""
+    lock_file = _try_lock(name, fcntl.LOCK_SH)
+    if lock_file is None:
+        print_info(message)
+        lock_file = open(_lock_path(name), "a")
+        fcntl.flock(lock_file, fcntl.LOCK_SH)
+    return lock_file
+
+
+@contextmanager
+def acquire_build_lock(preset_name: str) -> Iterator[None]:
+    """
+    빌드 중인 프리셋에 공유 잠금을 잡습니다.
+
+    with 블록 안에서는 gc 가 이 프리셋의 이미지/체크포인트/캐시를 삭제하지 않고,
+    BuildKit 빌드 캐시 정리(전역)도 하지 않습니다.
+    gc 가 이 프리셋을 정리하는 중이면 끝날 때까지 기다립니다.
+
+    Args:
+        preset_name: 프리셋 이름
+    """
+    builds_lock = _wait_lock(BUILDS_LOCK, "Waiting for gc to finish pruning the build cache...")
+    try:
+        preset_lock = _wait_lock(preset_name, f"Waiting for gc to finish with preset '{preset_name}'...")
+        try:
+            yield
+        finally:
+            preset_lock.close()
+    finally:
+        builds_lock.close()
+
+
+def _load_usage_file() -> Dict[str, Any]:
+    """usage.json 로드 (없거나 손상된 경우 빈 기록)"""
+    try:
+        with open(USAGE_PATH, 'r', encoding='utf-8') as f:
+            usage = json.load(f)
+        if isinstance(usage.get("presets"), dict):
+            return usage
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"presets": {}}
+
+
+def load_usage() -> Dict[str, float]:
+    """
+    프리셋별 마지막 사용 시각을 로드합니다.
+
+    Returns:
+        {프리셋 이름: epoch 초} 딕셔너리
+    """
+    usage = {}
+    for name, entry in _load_usage_file()["presets"].items():
+        try:
+            usage[name] = float(entry["last_used"])
+        except (KeyError, TypeError, ValueError):
+            pass
+    return usage
+
+
+def record_usage(preset_name: str) -> None:
+    """
+    프리셋의 마지막 사용 시각을 현재 시각으로 기록합니다.
+
+    동시에 실행되는 빌드끼리 기록이 유실되지 않도록 usage 잠금 안에서 갱신합니다.
+
+    Args:
+        preset_name: 프리셋 이름
+    """
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
+    lock_file = open(_lock_path("usage"), "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        usage = _load_usage_file()
+        usage["presets"][preset_name] = {
+            "last_used": time.time(),
+            "last_used_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+        tmp_path = USAGE_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(usage, f, indent=2)
+        tmp_path.replace(USAGE_PATH)
+    finally:
+        lock_file.close()
+
+
+def _docker_lines(args: List[str]) -> List[str]:
+    """docker 명령 실행 후 출력 줄 리스트 반환 (실패 시 빈 리스트)"""
+    try:
+        result = subprocess.run([DOCKER] + args, capture_output=True, text=True)
+    except OSError:
+        return []
+    if result.returncode != 0:
+        return []
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def _directory_size(path: Path) -> int:
+    """디렉터리 전체 크기 (bytes)"""
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file() and not p.is_symlink())
+
+
+def _parse_created(value: str) -> float:
+    """docker Created 시각(RFC 3339)을 epoch 초로 변환 (실패 시 0)"""
+    try:
+        # 소수점 이하 나노초는 datetime 이 처리하지 못하므로 제거
+        value = re.sub(r"\.\d+", "", value).replace("Z", "+00:00")
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _checkpoint_preset(tag: str) -> Optional[str]:
+    """체크포인트 태그(<repo>:<preset>-<stage>-<fp>)에서 프리셋 이름 추출"""
+    _, _, name = tag.partition(":")
+    parts = name.rsplit("-", 2)
+    if len(parts) != 3 or parts[1] not in {stage["name"] for stage in CHECKPOINT_STAGES}:
+        return None
+    return parts[0]
+
+
+def _docker_size(text: str) -> Optional[int]:
+    """docker CLI 크기 문자열을 bytes 로 변환 (N/A 등 알 수 없으면 None)"""
+    try:
+        return parse_size(text, base=1000)
+    except ValueError:
+        return None
+
+
+def system_df() -> Dict[str, Any]:
+    """
+    docker system df 로 실제 디스크 사용량을 조회합니다.
+
+    Returns:
+        {"images": bytes, "build_cache": bytes, "unique": {이미지 ID: bytes}}
+            - images: 모든 이미지의 레이어 크기 (공유 레이어는 한 번만 계산)
+            - build_cache: BuildKit 빌드 캐시 전체
+            - unique: 이미지별 고유 레이어 크기 (이미지를 삭제하면 회수되는 공간)
+    """
+    df: Dict[str, Any] = {"images": 0, "build_cache": 0, "unique": {}}
+
+    for line in _docker_lines(["system", "df", "--format", "{{.Type}}\t{{.Size}}"]):
+        kind, _, size = line.partition("\t")
+        key = {"Images": "images", "Build Cache": "build_cache"}.get(kind)
+        if key:
+            df[key] = _docker_size(size) or 0
+
+    try:
+        verbose = json.loads("\n".join(_docker_lines(["system", "df", "-v", "--format", "{{json .}}"])) or "{}")
+    except ValueError:
+        verbose = {}
+
+    for image in verbose.get("Images") or []:
+        unique = _docker_size(image.get("UniqueSize", ""))
+        if unique is None:
+            # 공유 크기를 알 수 없으면 전체 크기를 고유 크기로 간주
+            unique = _docker_size(image.get("Size", "")) or 0
+        df["unique"][image.get("ID", "")] = unique
+
+    return df
+
+
+def _same_image(a: str, b: str) -> bool:
+    """이미지 ID 비교 (sha256: 접두사/축약 ID 허용)"""
+    a, b = a.split(":")[-1], b.split(":")[-1]
+    return bool(a and b) and (a.startswith(b) or b.startswith(a))
+
+
+def _unique_size(df: Dict[str, Any], image_id: str) -> int:
+    """system_df() 결과에서 이미지의 고유 크기 조회"""
+    for key, size in df["unique"].items():
+        if _same_image(key, image_id):
+            return size
+    return 0
+
+
+def list_images(df: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    xaiva-kit 가 관리하는 이미지 목록을 조회합니다.
+
+    최종 이미지(xaiva-kit:<preset>), 체크포인트 이미지, 이전 빌드의 dangling 이미지
+    (label xaiva-kit.preset)만 포함하며, 같은 이미지 ID 는 한 번만 나타납니다.
+
+    Args:
+        df: system_df() 결과 (None 이면 새로 조회)
+
+    Returns:
+        이미지 딕셔너리 리스트
+            - id: 이미지 ID
+            - tags: 태그 리스트 (dangling 이미지는 빈 리스트)
+            - preset: 프리셋 이름 (알 수 없으면 None)
+            - size: 크기 (bytes, 공유 레이어 포함)
+            - unique: 고유 레이어 크기 (bytes, 삭제 시 회수되는 공간)
+            - created: 생성 시각 (epoch 초)
+    """
+    tags_by_id: Dict[str, List[str]] = {}
+    for repository in (IMAGE_REPOSITORY, CHECKPOINT_REPOSITORY):
+        for line in _docker_lines([
+            "images", "--no-trunc", "--format", "{{.ID}}\t{{.Repository}}:{{.Tag}}", repository
+        ]):
+            image_id, _, tag = line.partition("\t")
+            tags = tags_by_id.setdefault(image_id, [])
+            if not tag.endswith(":<none>"):
+                tags.append(tag)
+
+    for image_id in _docker_lines([
+        "images", "--no-trunc", "--filter", "dangling=true", "--filter", f"label={PRESET_LABEL}",
+        "--format", "{{.ID}}"
+    ]):
+        tags_by_id.setdefault(image_id, [])
+
+    if not tags_by_id:
+        return []
+
+    if df is None:
+        df = system_df()
+
+    details = _docker_lines([
+        "image", "inspect", "--format",
+        "{{.Id}}\t{{.Size}}\t{{.Created}}\t{{index .Config.Labels \"" + PRESET_LABEL + "\"}}",
+    ] + list(tags_by_id))
+
+    images = []
+    for line in details:
+        image_id, size, created, label = (line.split("\t") + ["", "", ""])[:4]
+        tags = tags_by_id.get(image_id, [])
+
+        preset_name = label if label and label != "<no value>" else None
+        for tag in tags:
+            if tag.startswith(f"{CHECKPOINT_REPOSITORY}:"):
+                preset_name = _checkpoint_preset(tag) or preset_name
+            else:
+                preset_name = tag.partition(":")[2]
+
+        images.append({
+            "id": image_id,
+            "tags": tags,
+            "preset": preset_name,
+            "size": int(size) if size.isdigit() else 0,
+            "unique": _unique_size(df, image_id),
+            "created": _parse_created(created),
+        })
+
+    return images
+
+
+def _artifact_dirs() -> List[Path]:
+    """프리셋별 .deb 미러 디렉터리 목록"""
+    if not ARTIFACTS_DIR.is_dir():
+        return []
+    return [
+        get_debs_dir(preset_dir.name)
+        for preset_dir in sorted(ARTIFACTS_DIR.iterdir())
+        if get_debs_dir(preset_dir.name).is_dir()
+    ]
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def collect_candidates(images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    LRU 정리 대상 목록을 수집합니다 (dangling 이미지 제외).
+
+    같은 프리셋 안에서는 지금 삭제해도 공간이 회수되지 않는 대상(고유 크기 0, 예: 최종 이미지가
+    레이어를 공유하는 체크포인트)을 뒤로 보내고, EVICTION_ORDER, 고유 크기 순으로 정렬합니다.
+
+    Args:
+        images: list_images() 결과
+
+    Returns:
+        대상 딕셔너리 리스트 (마지막 사용 시각, 프리셋, EVICTION_ORDER 순)
+            - kind: image / checkpoint / artifacts
+            - preset: 프리셋 이름
+            - name: 이미지 태그 또는 디렉터리 경로
+            - size: 삭제 시 회수되는 크기 (bytes, 이미지는 고유 레이어 크기)
+            - last_used: 마지막 사용 시각 (epoch 초)
+    """
+    usage = load_usage()
+    candidates = []
+
+    for image in images:
+        for tag in image["tags"]:
+            if tag.startswith(f"{CHECKPOINT_REPOSITORY}:"):
+                kind, preset_name = "checkpoint", _checkpoint_preset(tag)
+            else:
+                kind, preset_name = "image", tag.partition(":")[2]
+            if not preset_name:
+                continue
+
+            candidates.append({
+                "kind": kind,
+                "preset": preset_name,
+                "name": tag,
+                # 같은 이미지에 태그가 여러 개면 마지막 태그를 지울 때만 공간이 회수됨
+                "size": image["unique"] if len(image["tags"]) == 1 else 0,
+                "last_used": usage.get(preset_name, image["created"]),
+            })
+
+    for debs_dir in _artifact_dirs():
+        preset_name = debs_dir.parent.name
+        candidates.append({
+            "kind": "artifacts",
+            "preset": preset_name,
+            "name": _display_path(debs_dir),
+            "path": debs_dir,
+            "size": _directory_size(debs_dir),
+            "last_used": usage.get(preset_name, debs_dir.stat().st_mtime),
+        })
+
+    candidates.sort(key=lambda c: (
+        c["last_used"], c["preset"], c["size"] == 0, EVICTION_ORDER[c["kind"]], -c["size"]
+    ))
+    return candidates
+
+
+def measure_usage(
+    images: Optional[List[Dict[str, Any]]] = None,
+    df: Optional[Dict[str, Any]] = None
+) -> Dict[str, int]:
+    """
+    예산 대상 디스크 사용량을 측정합니다.
+
+    이미지 사용량은 docker system df 의 전체 이미지 크기(공유 레이어는 한 번만 계산)에서
+    xaiva-kit 와 무관한 이미지의 고유 레이어를 뺀 값입니다. 베이스 이미지처럼 다른 이미지와
+    공유하는 레이어는 포함됩니다.
+
+    Args:
+        images: list_images() 결과 (None 이면 새로 조회)
+        df: system_df() 결과 (None 이면 새로 조회)
+
+    Returns:
+        {"images": bytes, "build_cache": bytes, "artifacts": bytes}
+            - images: xaiva-kit 관리 이미지가 차지하는 실제 디스크 사용량
+            - build_cache: BuildKit 빌드 캐시 전체 (docker system df, 다른 프로젝트 캐시 포함)
+            - artifacts: artifacts/*/debs 합계
+    """
+    if df is None:
+        df = system_df()
+    if images is None:
+        images = list_images(df)
+
+    other_unique = sum(
+        size for image_id, size in df["unique"].items()
+        if not any(_same_image(image_id, image["id"]) for image in images)
+    )
+
+    return {
+        "images": max(0, df["images"] - other_unique) if images else 0,
+        "build_cache": df["build_cache"],
+        "artifacts": sum(_directory_size(d) for d in _artifact_dirs()),
+    }
+
+
+def _evict(candidate: Dict[str, Any]) -> bool:
+    """대상 삭제 (이미지는 컨테이너가 사용 중이면 삭제되지 않음)"""
+    if candidate["kind"] == "artifacts":
+        shutil.rmtree(candidate["path"], ignore_errors=True)
+        return True
+
+    try:
+        result = subprocess.run([DOCKER, "rmi", candidate["name"]], capture_output=True, text=True)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _print_usage(title: str, usage: Dict[str, int], budget: int) -> None:
+    total = sum(usage.values())
+    print(f"  {title}: {format_size(total)} / budget {format_size(budget)} "
+          f"(images {format_size(usage['images'])}, build cache {format_size(usage['build_cache'])}, "
+          f"artifacts {format_size(usage['artifacts'])})")
+
+
+def run_gc(budget: int, protect: Optional[List[str]] = None, dry_run: bool = False) -> int:
+    """
+    디스크 사용량이 예산 이하가 될 때까지 오래된 이미지/캐시를 정리합니다.
+
+    예산 대상은 xaiva-kit 이미지(최종/체크포인트/dangling), BuildKit 빌드 캐시,
+    artifacts/*/debs 입니다. 다른 프로젝트의 이미지는 포함하지 않습니다.
+
+    순서:
+        1. 이전 빌드의 dangling 이미지 삭제
+        2. 예산 초과 시 LRU 순서로 체크포인트 → .deb 캐시 → 최종 이미지 삭제
+           (지금 삭제해도 회수되지 않는 대상은 같은 프리셋 안에서 뒤로 미루고,
+           삭제할 때마다 docker system df 로 다시 측정)
+        3. 그래도 초과하면 BuildKit 빌드 캐시를 남은 예산만큼만 유지 (BuildKit 자체 LRU)
+           빌드 캐시는 프리셋 구분이 없으므로 실행 중인 빌드가 있거나,
+           캐시를 비워도 예산을 맞출 수 없으면 정리하지 않음
+
+    1, 2 단계에서 보호된 프리셋과 빌드 중인 프리셋은 건너뜁니다.
+    dry run 은 잠금 파일을 만들거나 잠금을 유지하지 않습니다.
+
+    Args:
+        budget: 디스크 예산 (bytes)
+        protect: 삭제하지 않을 프리셋 이름 리스트
+        dry_run: True일 경우 삭제 계획만 출력
+
+    Returns:
+        Exit code (0 = success, 예산 초과가 남아도 0)
+    """
+    protect = set(protect or [])
+
+    if dry_run:
+        gc_lock = None
+        if _is_locked("gc"):
+            print_error("Another gc is already running")
+            return 1
+    else:
+        gc_lock = _try_lock("gc", fcntl.LOCK_EX)
+        if gc_lock is None:
+            print_error("Another gc is already running")
+            return 1
+
+    # 프리셋별 정리 가능 여부 (실제 실행 시 배타 잠금은 gc 종료 시까지 유지하여 도중에 빌드가 시작되지 않도록 함)
+    preset_locks: Dict[str, Optional[IO]] = {}
+    allowed: Dict[str, bool] = {}
+
+    def can_remove(preset_name: Optional[str]) -> bool:
+        if preset_name is None:
+            return True
+        if preset_name in protect:
+            return False
+        if preset_name not in allowed:
+            if dry_run:
+                allowed[preset_name] = not _is_locked(preset_name)
+            else:
+                preset_locks[preset_name] = _try_lock(preset_name, fcntl.LOCK_EX)
+                allowed[preset_name] = preset_locks[preset_name] is not None
+            if not allowed[preset_name]:
+                print(f"  skip  {preset_name}: build in progress")
+        return allowed[preset_name]
+
+    try:
+        print_section("Garbage Collection")
+        if protect:
+            print(f"  Protected presets: {', '.join(sorted(protect))}")
+
+        df = system_df()
+        images = list_images(df)
+        before = measure_usage(images, df)
+        usage = dict(before)
+        _print_usage("Usage", before, budget)
+        evicted: List[Dict[str, Any]] = []
+        tried = set()
+
+        def remove(candidate: Dict[str, Any]) -> None:
+            nonlocal images
+            tried.add(candidate["name"])
+            last_used = datetime.fromtimestamp(candidate["last_used"]).strftime("%Y-%m-%d %H:%M")
+            line = f"{candidate['kind']:<10} {candidate['name']}  ({format_size(candidate['size'])}, last used {last_used})"
+            key = "artifacts" if candidate["kind"] == "artifacts" else "images"
+
+            if dry_run:
+                # 고유 크기 기준 추정 (다른 대상 삭제 후 고유해지는 공유 레이어는 포함하지 않음)
+                print(f"  would remove  {line}")
+                usage[key] -= candidate["size"]
+                evicted.append(candidate)
+            elif _evict(candidate):
+                # 회수량은 삭제 전후의 실제 docker system df 차이
+                current = sum(usage.values())
+                df_after = system_df()
+                images = list_images(df_after)
+                usage.update(measure_usage(images, df_after))
+                print(f"  removed  {line}, freed {format_size(max(0, current - sum(usage.values())))}")
+                evicted.append(candidate)
+            else:
+                print(f"  failed   {line} (in use by a container?)")
+
+        # 1. dangling 이미지 (태그가 새 빌드로 옮겨간 이전 빌드)
+        dangling = [image for image in images if not image["tags"]]
+        if dangling:
+            print_section("Dangling images from previous builds")
+            for image in dangling:
+                if not can_remove(image["preset"]):
+                    continue
+                remove({
+                    "kind": "dangling",
+                    "preset": image["preset"],
+                    "name": image["id"],
+                    "size": image["unique"],
+                    "last_used": image["created"],
+                })
+
+        # 2. LRU 순서로 이미지/체크포인트/.deb 캐시 삭제
+        #    삭제할 때마다 고유 크기가 바뀌므로 (공유 레이어가 고유해짐) 대상 목록을 다시 계산
+        #    dry run 은 처음 목록을 그대로 사용
+        candidates = collect_candidates(images)
+        if sum(usage.values()) > budget and candidates:
+            print_section("Evicting (least recently used first)")
+
+        while sum(usage.values()) > budget:
+            if not dry_run:
+                candidates = collect_candidates(images)
+            candidate = next(
+                (c for c in candidates if c["name"] not in tried and can_remove(c["preset"])),
+                None
+            )
+            if candidate is None:
+                break
+            remove(candidate)
+
+        # 3. BuildKit 빌드 캐시 (전역 - 남은 예산만큼 유지)
+        other = usage["images"] + usage["artifacts"]
+        if other + usage["build_cache"] > budget and usage["build_cache"] > 0:
+            keep = budget - other
+            if keep <= 0:
+                print("  build cache: kept (images and artifacts alone exceed the budget)")
+            elif dry_run:
+                if _is_locked(BUILDS_LOCK):
+                    print("  build cache: kept (build in progress)")
+                else:
+                    print(f"  build cache: would keep {format_size(keep)} of {format_size(usage['build_cache'])}")
+                    usage["build_cache"] = keep
+            else:
+                # 정리하는 동안 새 빌드가 시작되지 않도록 전역 배타 잠금 유지
+                builds_lock = _try_lock(BUILDS_LOCK, fcntl.LOCK_EX)
+                if builds_lock is None:
+                    print("  build cache: kept (build in progress)")
+                else:
+                    try:
+                        print(f"  build cache: keep {format_size(keep)} of {format_size(usage['build_cache'])}")
+                        _docker_lines(["builder", "prune", "--force", "--keep-storage", str(keep)])
+                    finally:
+                        builds_lock.close()
+                    usage.update(measure_usage())
+
+        # 결과 리포트
+        print_section("Result")
+        if dry_run:
+            print(f"  Estimated reclaimable: {format_size(max(0, sum(before.values()) - sum(usage.values())))}, "
+                  f"{len(evicted)} item(s) (unique layers only; shared layers may be freed as well)")
+            print_success("Dry run mode - nothing removed")
+        else:
+            _print_usage("Usage", usage, budget)
+            reclaimed = {key: before[key] - usage[key] for key in before}
+            print(f"  Reclaimed: {format_size(max(0, sum(reclaimed.values())))} "
+                  f"(images {format_size(max(0, reclaimed['images']))}, "
+                  f"build cache {format_size(max(0, reclaimed['build_cache']))}, "
+                  f"artifacts {format_size(max(0, reclaimed['artifacts']))}), "
+                  f"{len(evicted)} item(s) removed")
+
+        if sum(usage.values()) > budget:
+            print_warning("Still over budget (remaining usage is protected, in use, or shared build cache)")
+
+        return 0
+
+    finally:
+        for lock_file in preset_locks.values():
+            if lock_file is not None:
+                lock_file.close()
+        if gc_lock is not None:
+            gc_lock.close()
@@ -0,0 +1,356 @@
+"""
+이미지 출력 형식 모듈
+
+최종 이미지의 레이어 압축 형식(gzip/zstd/eStargz)을 선택하고,
+빌드된 이미지 레이어의 압축 크기와 압축 해제 시간을 gzip 기준과 비교합니다.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .utils import DOCKER, print_section, print_warning, format_size
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+REPORTS_DIR = PROJECT_ROOT / ".build-state" / "reports"
+
+# 레이어 검증용 임시 디렉터리 위치 (docker save 결과 전체가 저장되므로 여유 공간이 큰 경로 지정)
+# XAIVA_KIT_TMPDIR 이 없으면 시스템 기본 임시 디렉터리 (TMPDIR) 사용
+LAYERS_TMP_DIR = os.environ.get("XAIVA_KIT_TMPDIR")
+
+# 출력 형식 정의
+#   - compression: BuildKit image exporter 의 compression 값 (None 이면 기본 docker build)
+#   - description: 설명
+OUTPUT_FORMATS: Dict[str, Dict[str, Any]] = {
+    "docker": {
+        "compression": None,
+        "description": "기본 docker build (push 시 gzip)",
+    },
+    "gzip": {
+        "compression": "gzip",
+        "description": "OCI 이미지, gzip 레이어",
+    },
+    "zstd": {
+        "compression": "zstd",
+        "description": "OCI 이미지, zstd 레이어 (빠른 pull/압축 해제)",
+    },
+    "estargz": {
+        "compression": "estargz",
+        "description": "OCI 이미지, eStargz 레이어 (stargz-snapshotter 로 lazy pull)",
+    },
+}
+
+# 레이어 mediaType 접미사별 압축 형식
+LAYER_COMPRESSIONS = {
+    "+zstd": "zstd",
+    "+gzip": "gzip",
+    ".gzip": "gzip",
+    ".zstd": "zstd",
+}
+
+
+def get_output_args(output_format: str, image_tag: str) -> List[str]:
+    """
+    출력 형식에 해당하는 docker buildx --output 인자를 생성합니다.
+
+    Args:
+        output_format: 출력 형식 (OUTPUT_FORMATS 키)
+        image_tag: 결과 이미지 태그
+
+    Returns:
+        --output 인자 리스트 (docker 형식이면 빈 리스트)
+    """
+    compression = OUTPUT_FORMATS[output_format]["compression"]
+    if compression is None:
+        return []
+
+    spec = [
+        "type=image",
+        f"name={image_tag}",
+        f"compression={compression}",
+        "force-compression=true",
+        "oci-mediatypes=true",
+    ]
+
+    return ["--output", ",".join(spec)]
+
+
+def check_containerd_image_store() -> bool:
+    """
+    Docker 데몬이 containerd 이미지 스토어를 사용하는지 확인합니다.
+
+    zstd/eStargz 레이어는 containerd 이미지 스토어에서만 압축된 상태로 보존되며,
+    이후 docker push 시에도 그대로 업로드됩니다.
+
+    Returns:
+        containerd 이미지 스토어를 사용하면 True
+    """
+    try:
+        result = subprocess.run(
+            [DOCKER, "info", "--format", "{{json .DriverStatus}}"],
+            capture_output=True,
+            text=True
+        )
+    except OSError:
+        return False
+
+    return result.returncode == 0 and "io.containerd.snapshotter" in result.stdout
+
+
+def get_buildx_driver() -> Optional[str]:
+    """
+    현재 buildx 빌더의 드라이버를 조회합니다.
+
+    docker 드라이버만 빌드 결과를 로컬 이미지 스토어에 바로 저장합니다.
+    docker-container/remote 드라이버는 --output type=image 결과를 빌더 안에만 남기므로
+    다음 체크포인트 스테이지의 FROM, docker run 기반 리포트/레이어 검증이 이미지를 찾지 못합니다.
+
+    Returns:
+        드라이버 이름 (예: "docker", "docker-container"), 조회 실패 시 None
+    """
+    try:
+        result = subprocess.run([DOCKER, "buildx", "inspect"], capture_output=True, text=True)
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "Driver":
+            return value.strip()
+    return None
+
+
+def check_output_format(output_format: str) -> List[str]:
+    """
+    출력 형식을 현재 Docker 환경에서 사용할 수 있는지 확인합니다.
+
+    docker 외 형식은 containerd 이미지 스토어와 docker 드라이버 buildx 빌더가 필요합니다.
+
+    Args:
+        output_format: 출력 형식 (OUTPUT_FORMATS 키)
+
+    Returns:
+        에러 메시지 리스트 (빈 리스트면 사용 가능)
+    """
+    if OUTPUT_FORMATS[output_format]["compression"] is None:
+        return []
+
+    errors = []
+    if not check_containerd_image_store():
+        errors.append(
+            f"Output format '{output_format}' requires the containerd image store "
+            "(enable \"features\": {\"containerd-snapshotter\": true} in /etc/docker/daemon.json)"
+        )
+
+    driver = get_buildx_driver()
+    if driver != "docker":
+        errors.append(
+            f"Output format '{output_format}' requires a buildx builder with the docker driver "
+            f"(current: {driver or 'unknown'}, switch with: docker buildx use default)"
+        )
+
+    return errors
+
+
+def _detect_compression(media_type: str) -> Optional[str]:
+    """레이어 mediaType 에서 압축 형식 추출 (압축되지 않은 레이어는 None)"""
+    for suffix, compression in LAYER_COMPRESSIONS.items():
+        if media_type.endswith(suffix):
+            return compression
+    return None
+
+
+def _time_command(cmd: List[str], stdin_path: Path, stdout_path: Optional[Path] = None) -> Optional[float]:
+    """명령어 실행 시간 측정 (실패 시 None)"""
+    with open(stdin_path, "rb") as stdin:
+        stdout = open(stdout_path, "wb") if stdout_path else subprocess.DEVNULL
+        try:
+            started = time.perf_counter()
+            result = subprocess.run(cmd, stdin=stdin, stdout=stdout)
+            elapsed = time.perf_counter() - started
+        finally:
+            if stdout_path:
+                stdout.close()
+
+    return elapsed if result.returncode == 0 else None
+
+
+def _load_manifest(tar: tarfile.TarFile, members: Dict[str, tarfile.TarInfo]) -> Dict[str, Any]:
+    """
+    docker save 결과(OCI 레이아웃 tar)에서 이미지 manifest 를 찾습니다.
+    (멀티 플랫폼 index 인 경우 linux/amd64 또는 첫 번째 manifest 사용)
+    """
+    def read_json(name: str) -> Dict[str, Any]:
+        with tar.extractfile(members[name]) as f:
+            return json.load(f)
+
+    document = read_json("index.json")
+
+    while "manifests" in document:
+        manifests = document["manifests"]
+        chosen = next(
+            (m for m in manifests if m.get("platform", {}).get("architecture") == "amd64"),
+            manifests[0]
+        )
+        document = read_json(_blob_name(chosen["digest"]))
+
+    return document
+
+
+def _blob_name(digest: str) -> str:
+    """digest 에 해당하는 OCI 레이아웃 내 blob 경로"""
+    algorithm, value = digest.split(":", 1)
+    return f"blobs/{algorithm}/{value}"
+
+
+def verify_image_layers(image_tag: str, preset_name: str, output_format: str) -> List[Dict[str, Any]]:
+    """
+    이미지 레이어의 압축 크기와 압축 해제 시간을 gzip 기준과 비교하여 출력합니다.
+
+    docker save 결과(OCI 레이아웃)의 각 레이어를 압축 해제한 뒤 gzip -6 으로
+    재압축하여 기준값으로 사용합니다. 결과는 .build-state/reports/ 에 저장됩니다.
+
+    Args:
+        image_tag: Docker 이미지 태그
+        preset_name: 프리셋 이름
+        output_format: 출력 형식
+
+    Returns:
+        레이어별 측정 결과 리스트
+    """
+    if shutil.which("gzip") is None:
+        print_warning("gzip not found, skipping layer verification")
+        return []
+
+    results = []
+
+    if LAYERS_TMP_DIR:
+        Path(LAYERS_TMP_DIR).mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="xaiva-kit-layers-", dir=LAYERS_TMP_DIR))
+
+    try:
+        archive = tmp_dir / "image.tar"
+
+        save = subprocess.run([DOCKER, "save", "-o", str(archive), image_tag])
+        if save.returncode != 0:
+            print_warning(f"Failed to export image for verification: {image_tag}")
+            return []
+
+        with tarfile.open(archive) as tar:
+            members = {os.path.normpath(member.name): member for member in tar.getmembers()}
+            if "index.json" not in members:
+                print_warning("Image export is not an OCI layout, skipping layer verification")
+                return []
+
+            manifest = _load_manifest(tar, members)
+
+            for index, layer in enumerate(manifest.get("layers", []), 1):
+                # 레이어 blob 을 하나씩 꺼내어 측정 (디스크 사용량 최소화)
+                blob = tmp_dir / "layer.blob"
+                with tar.extractfile(members[_blob_name(layer["digest"])]) as src, open(blob, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+
+                compression = _detect_compression(layer["mediaType"])
+                decompress_cmd = {"gzip": ["gzip", "-dc"], "zstd": ["zstd", "-dc"]}.get(compression)
+                raw = tmp_dir / "layer.tar"
+                baseline = tmp_dir / "layer.tar.gz"
+                decompress_sec = None
+
+                entry = {
+                    "layer": index,
+                    "digest": layer["digest"],
+                    "media_type": layer["mediaType"],
+                    "compression": compression or "none",
+                    "compressed_bytes": layer["size"],
+                }
+
+                if decompress_cmd is None:
+                    blob.replace(raw)
+                elif shutil.which(decompress_cmd[0]) is None:
+                    print_warning(f"{decompress_cmd[0]} not found, skipping layer {index}")
+                    blob.unlink()
+                    continue
+                elif _time_command(decompress_cmd, blob, raw) is None:
+                    entry["error"] = f"{decompress_cmd[0]} decompression failed"
+                else:
+                    decompress_sec = _time_command(decompress_cmd, blob)
+
+                if "error" not in entry and _time_command(["gzip", "-6", "-c"], raw, baseline) is None:
+                    entry["error"] = "gzip baseline compression failed"
+
+                if "error" in entry:
+                    print_warning(f"Layer {index} verification failed: {entry['error']}")
+                else:
+                    entry.update({
+                        "uncompressed_bytes": raw.stat().st_size,
+                        "gzip_bytes": baseline.stat().st_size,
+                        "decompress_sec": decompress_sec,
+                        "gzip_decompress_sec": _time_command(["gzip", "-dc"], baseline),
+                    })
+                results.append(entry)
+
+                for path in (blob, raw, baseline):
+                    path.unlink(missing_ok=True)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    _print_layer_report(results, output_format)
+
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = REPORTS_DIR / f"{preset_name}-layers-{output_format}.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"image": image_tag, "output_format": output_format, "layers": results}, f, indent=2)
+    print(f"\n  Report saved: {report_path}")
+
+    return results
+
+
+def _print_layer_report(results: List[Dict[str, Any]], output_format: str) -> None:
+    """레이어 비교 결과 출력"""
+    def seconds(value: Optional[float]) -> str:
+        return f"{value:.2f}s" if value is not None else "n/a"
+
+    print_section(f"Layer Verification ({output_format} vs gzip)")
+    print(f"  {'#':>3}  {'digest':<12}  {'format':<7} {'size':>10} {'gzip':>10} {'ratio':>7}  {'decomp':>8} {'gzip':>8}")
+
+    for entry in results:
+        if "error" in entry:
+            print(
+                f"  {entry['layer']:>3}  {entry['digest'].split(':')[1][:12]:<12}  {entry['compression']:<7} "
+                f"{format_size(entry['compressed_bytes']):>10}  FAILED: {entry['error']}"
+            )
+            continue
+
+        ratio = entry["compressed_bytes"] / entry["gzip_bytes"] * 100 if entry["gzip_bytes"] else 0
+        print(
+            f"  {entry['layer']:>3}  {entry['digest'].split(':')[1][:12]:<12}  {entry['compression']:<7} "
+            f"{format_size(entry['compressed_bytes']):>10} {format_size(entry['gzip_bytes']):>10} {ratio:>6.1f}%  "
+            f"{seconds(entry['decompress_sec']):>8} {seconds(entry['gzip_decompress_sec']):>8}"
+        )
+
+    # 실패한 레이어는 합계에서 제외
+    measured = [entry for entry in results if "error" not in entry]
+    total = sum(entry["compressed_bytes"] for entry in measured)
+    total_gzip = sum(entry["gzip_bytes"] for entry in measured)
+    total_decompress = sum(entry["decompress_sec"] or 0 for entry in measured)
+    total_gzip_decompress = sum(entry["gzip_decompress_sec"] or 0 for entry in measured)
+
+    if len(measured) < len(results):
+        print_warning(f"{len(results) - len(measured)} layer(s) failed verification (excluded from totals)")
+    if total_gzip:
+        print(f"\n  Total size:       {format_size(total)} vs gzip {format_size(total_gzip)} "
+              f"({total / total_gzip * 100:.1f}%)")
+    if total_gzip_decompress:
+        print(f"  Total decompress: {total_decompress:.2f}s vs gzip {total_gzip_decompress:.2f}s "
+              f"({total_decompress / total_gzip_decompress * 100:.1f}%)")
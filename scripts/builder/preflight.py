@@ -0,0 +1,395 @@
+"""
+빌드 사전 점검(preflight) 모듈
+
+docker build 전에 필요한 독립적인 작업들을 asyncio 로 동시에 실행합니다.
+    - pull:      베이스 이미지 pull (가장 오래 걸리는 작업)
+    - artifacts: 프리셋 아티팩트 확인
+    - git:       Xaiva Media 저장소 fetch 및 브랜치 확인
+    - context:   빌드 컨텍스트 준비 (COPY 대상 확인, 크기 계산)
+
+하나라도 실패하면 나머지 작업(실행 중인 프로세스 포함)을 즉시 취소하며,
+진행 상황은 터미널에 실시간 상태 표시로 출력됩니다.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .utils import DOCKER, print_section, format_size
+from .preset import check_preset_artifacts
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ARTIFACTS_DIR = PROJECT_ROOT / "artifacts"
+
+# Dockerfile 에서 COPY 하는 프리셋 파일 (artifacts/<preset>/ 기준)
+REQUIRED_CONTEXT_FILES = ["requirements-base.txt", "requirements.txt", "requirements-extra.txt"]
+
+# 상태 표시 갱신 주기 (초)
+REFRESH_INTERVAL = 0.2
+
+SPINNER = "|/-\\"
+
+
+class PreflightError(Exception):
+    """사전 점검 작업 실패"""
+
+
+class StatusView:
+    """
+    사전 점검 작업별 상태를 출력합니다.
+
+    TTY 에서는 작업별 한 줄씩 제자리에서 갱신하고,
+    TTY 가 아니면(로그/CI) 상태(running/done/failed 등)가 바뀔 때만 한 줄씩 출력합니다.
+    """
+
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.states = {name: "pending" for name in names}
+        self.messages = {name: "" for name in names}
+        self.started = {name: time.monotonic() for name in names}
+        self.elapsed: Dict[str, float] = {}
+        self.interactive = sys.stdout.isatty()
+        self.frame = 0
+        self.drawn = False
+
+    def update(self, name: str, message: str, state: str = "running") -> None:
+        """작업 상태 갱신"""
+        changed = self.states[name] != state
+        self.states[name] = state
+        self.messages[name] = message
+
+        if state in ("done", "failed", "cancelled", "skipped"):
+            self.elapsed.setdefault(name, time.monotonic() - self.started[name])
+
+        if not self.interactive and changed:
+            print(f"  [{name}] {state}: {message}" if message else f"  [{name}] {state}")
+
+    def _line(self, name: str) -> str:
+        state = self.states[name]
+        icon = {
+            "pending": " ", "done": "✓", "failed": "✗", "cancelled": "-", "skipped": "·",
+        }.get(state, SPINNER[self.frame % len(SPINNER)])
+        seconds = self.elapsed.get(name, time.monotonic() - self.started[name])
+        return f"  {icon} {name:<10} {seconds:6.1f}s  {self.messages[name]}"
+
+    def render(self) -> None:
+        """TTY 상태 표시 다시 그리기"""
+        if not self.interactive:
+            return
+
+        if self.drawn:
+            sys.stdout.write(f"\033[{len(self.names)}F")
+        for name in self.names:
+            sys.stdout.write("\033[K" + self._line(name)[:200] + "\n")
+        sys.stdout.flush()
+
+        self.frame += 1
+        self.drawn = True
+
+
+def resolve_xaiva_source(preset: Dict[str, Any], override_branch: Optional[str] = None) -> Optional[Tuple[Path, str]]:
+    """
+    프리셋의 Xaiva Media 소스 경로와 대상 브랜치를 결정합니다.
+
+    Args:
+        preset: 프리셋 데이터
+        override_branch: CLI로 지정된 브랜치 (프리셋 설정 오버라이드)
+
+    Returns:
+        (소스 경로, 대상 브랜치), xaiva_media_source 설정이 없으면 None
+    """
+    xaiva_source = preset.get("build_options", {}).get("xaiva_media_source", {})
+    if not xaiva_source:
+        return None
+
+    # 브랜치 결정 (CLI 오버라이드 > 프리셋 설정 > 기본값)
+    target_branch = override_branch or xaiva_source.get("branch", "main")
+
+    # 절대 경로와 상대 경로(프로젝트 루트 기준) 처리
+    source_path = Path(xaiva_source.get("path", "xaiva-media"))
+    if not source_path.is_absolute():
+        source_path = PROJECT_ROOT / source_path
+
+    return source_path, target_branch
+
+
+async def _run(cmd: List[str], cwd: Optional[Path] = None, on_line=None) -> Tuple[int, str]:
+    """
+    하위 프로세스를 실행하고 출력을 한 줄씩 전달합니다.
+    작업이 취소되면 프로세스를 종료합니다.
+
+    Returns:
+        (exit code, 마지막 출력 줄)
+    """
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except OSError as e:
+        raise PreflightError(f"Failed to run {cmd[0]}: {e}")
+
+    last_line = ""
+    try:
+        async for raw in process.stdout:
+            line = raw.decode(errors="replace").strip()
+            if line:
+                last_line = line
+                if on_line:
+                    on_line(line)
+        return await process.wait(), last_line
+
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+        raise
+
+
+async def _pull_base_image(view: StatusView, base_image: str, dry_run: bool) -> Dict[str, Any]:
+    """베이스 이미지 pull (로컬에 있으면 생략)"""
+    name = "pull"
+
+    if dry_run:
+        view.update(name, f"{base_image} (dry run)", "skipped")
+        return {"pulled": False}
+
+    view.update(name, f"checking {base_image}")
+    returncode, _ = await _run([DOCKER, "image", "inspect", "--format", "{{.Id}}", base_image])
+    if returncode == 0:
+        view.update(name, f"{base_image} already present", "done")
+        return {"pulled": False}
+
+    layers: Dict[str, bool] = {}
+
+    def on_line(line: str) -> None:
+        layer_id, _, status = line.partition(": ")
+        if status in ("Pulling fs layer", "Waiting", "Downloading", "Verifying Checksum", "Download complete"):
+            layers.setdefault(layer_id, False)
+        elif status in ("Pull complete", "Already exists"):
+            layers[layer_id] = True
+        if layers:
+            done = sum(layers.values())
+            view.update(name, f"{base_image}: {done}/{len(layers)} layers")
+
+    view.update(name, f"pulling {base_image}")
+    returncode, last_line = await _run([DOCKER, "pull", base_image], on_line=on_line)
+    if returncode != 0:
+        raise PreflightError(f"docker pull failed: {last_line}")
+
+    view.update(name, f"{base_image} pulled", "done")
+    return {"pulled": True}
+
+
+async def _check_artifacts(view: StatusView, preset_name: str) -> Dict[str, Any]:
+    """프리셋 아티팩트 확인 (경고는 사전 점검 후 사용자에게 확인)"""
+    name = "artifacts"
+    view.update(name, f"checking artifacts/{preset_name}")
+
+    warnings = await asyncio.to_thread(check_preset_artifacts, preset_name)
+
+    view.update(name, f"{len(warnings)} warning(s)" if warnings else "ok", "done")
+    return {"warnings": warnings}
+
+
+async def _sync_xaiva(
+    view: StatusView,
+    preset: Dict[str, Any],
+    override_branch: Optional[str],
+    non_interactive: bool,
+    dry_run: bool
+) -> Dict[str, Any]:
+    """Xaiva Media 저장소 fetch 및 브랜치 확인 (브랜치 전환은 사전 점검 후 대화형으로 처리)"""
+    name = "git"
+    source = resolve_xaiva_source(preset, override_branch)
+
+    if source is None:
+        view.update(name, "no xaiva_media_source in preset", "skipped")
+        return {"branch_ok": True}
+
+    xaiva_path, target_branch = source
+
+    if not xaiva_path.exists():
+        raise PreflightError(f"Xaiva Media source not found: {xaiva_path}")
+    if not (xaiva_path / ".git").exists():
+        raise PreflightError(f"Not a git repository: {xaiva_path}")
+
+    if not dry_run:
+        view.update(name, "fetching origin")
+        returncode, last_line = await _run(["git", "fetch", "--quiet", "origin"], cwd=xaiva_path)
+        if returncode != 0:
+            # 오프라인 환경에서는 fetch 실패를 허용하고 로컬 상태로 진행
+            view.update(name, f"fetch failed, using local state ({last_line})")
+
+    returncode, current_branch = await _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=xaiva_path)
+    if returncode != 0:
+        raise PreflightError(f"Git command failed: {current_branch}")
+
+    if current_branch == target_branch:
+        view.update(name, f"on {target_branch}", "done")
+        return {"branch_ok": True}
+
+    if non_interactive:
+        raise PreflightError(
+            f"Xaiva Media branch mismatch (expected {target_branch}, current {current_branch}); "
+            "cannot switch branches in non-interactive mode"
+        )
+
+    view.update(name, f"branch mismatch: {current_branch} (expected {target_branch})", "done")
+    return {"branch_ok": False}
+
+
+def _directory_size(path: Path) -> int:
+    """디렉터리 전체 크기 (bytes)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                total += os.lstat(os.path.join(root, file_name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+async def _prepare_context(
+    view: StatusView,
+    preset_name: str,
+    xaiva_source_path: str
+) -> Dict[str, Any]:
+    """빌드 컨텍스트 준비: Dockerfile COPY 대상 확인, 크기 계산"""
+    name = "context"
+    view.update(name, "checking COPY sources")
+
+    preset_dir = ARTIFACTS_DIR / preset_name
+    missing = [
+        str(preset_dir / file_name)
+        for file_name in REQUIRED_CONTEXT_FILES
+        if not (preset_dir / file_name).is_file()
+    ]
+
+    # COPY ${XAIVA_SOURCE_PATH}/ 는 빌드 컨텍스트(프로젝트 루트) 내부 경로여야 함
+    xaiva_dir = PROJECT_ROOT / xaiva_source_path
+    if Path(xaiva_source_path).is_absolute() or not xaiva_dir.is_dir():
+        missing.append(f"{xaiva_dir} (must be a directory inside {PROJECT_ROOT})")
+
+    if missing:
+        raise PreflightError("Missing build context files: " + ", ".join(missing))
+
+    view.update(name, "measuring COPY sources")
+    sizes = await asyncio.gather(*(
+        asyncio.to_thread(_directory_size, path)
+        for path in (preset_dir, xaiva_dir, PROJECT_ROOT / "docker")
+    ))
+    context_size = sum(sizes)
+
+    view.update(name, f"COPY sources {format_size(context_size)}", "done")
+    return {"context_size": context_size}
+
+
+async def _run_preflight(
+    preset: Dict[str, Any],
+    preset_name: str,
+    env_vars: Dict[str, str],
+    non_interactive: bool,
+    override_branch: Optional[str],
+    dry_run: bool
+) -> Dict[str, Any]:
+    """사전 점검 작업을 동시에 실행하고, 하나라도 실패하면 나머지를 취소합니다."""
+    build_options = preset.get("build_options", {})
+    xaiva_source_path = env_vars.get(
+        "XAIVA_MEDIA_SOURCE_PATH",
+        build_options.get("xaiva_media_source", {}).get("path", "xaiva-media")
+    )
+
+    view = StatusView(["pull", "artifacts", "git", "context"])
+
+    tasks = {
+        asyncio.create_task(_pull_base_image(view, preset["base_image"], dry_run)): "pull",
+        asyncio.create_task(_check_artifacts(view, preset_name)): "artifacts",
+        asyncio.create_task(_sync_xaiva(view, preset, override_branch, non_interactive, dry_run)): "git",
+        asyncio.create_task(_prepare_context(view, preset_name, xaiva_source_path)): "context",
+    }
+
+    pending = set(tasks)
+    failure: Optional[Tuple[str, BaseException]] = None
+
+    try:
+        while pending and failure is None:
+            done, pending = await asyncio.wait(
+                pending, timeout=REFRESH_INTERVAL, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                if task.exception() is not None:
+                    failure = (tasks[task], task.exception())
+                    view.update(tasks[task], str(task.exception()), "failed")
+            view.render()
+    finally:
+        # fail-fast: 남은 작업 취소 (Ctrl+C 포함)
+        for task in pending:
+            task.cancel()
+            view.update(tasks[task], "cancelled", "cancelled")
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            view.render()
+
+    if failure is not None:
+        name, error = failure
+        raise PreflightError(f"{name}: {error}")
+
+    results: Dict[str, Any] = {}
+    for task in tasks:
+        results.update(task.result())
+    return results
+
+
+def run_preflight(
+    preset: Dict[str, Any],
+    preset_name: str,
+    env_vars: Dict[str, str],
+    non_interactive: bool = False,
+    override_branch: Optional[str] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    빌드 사전 점검을 실행합니다.
+
+    베이스 이미지 pull, 아티팩트 확인, Xaiva Media git 동기화, 빌드 컨텍스트 준비를
+    동시에 실행하며, 하나라도 실패하면 나머지 작업을 취소하고 PreflightError 를 발생시킵니다.
+
+    Args:
+        preset: 프리셋 데이터
+        preset_name: 프리셋 이름
+        env_vars: .env 환경 변수
+        non_interactive: 비대화형 모드 여부 (브랜치 불일치 시 실패)
+        override_branch: CLI로 지정된 Xaiva Media 브랜치
+        dry_run: True일 경우 pull/fetch 생략
+
+    Returns:
+        결과 딕셔너리
+            - warnings: 아티팩트 경고 리스트
+            - branch_ok: Xaiva Media 브랜치 일치 여부 (False면 대화형 전환 필요)
+            - pulled: 베이스 이미지를 새로 pull 했는지 여부
+            - context_size: COPY 대상 크기 (bytes)
+    """
+    print_section("Preflight")
+    started = time.monotonic()
+
+    results = asyncio.run(_run_preflight(
+        preset, preset_name, env_vars, non_interactive, override_branch, dry_run
+    ))
+
+    print(f"  Preflight completed in {time.monotonic() - started:.1f}s")
+    return results
@@ -10,6 +10,11 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from .utils import print_error, print_warning
+from .optimization import validate_optimization
+from .cuda import validate_cuda_arch
+from .apt import validate_apt_packages
+from .startup import validate_startup
+from .cmake import validate_cmake
 
 
 # 프로젝트 경로 설정
@@ -80,10 +85,34 @@ def validate_preset(preset: Dict[str, Any]) -> List[str]:
         elif not isinstance(preset[field], expected_type):
             errors.append(f"Field {field} must be {expected_type.__name__}")
     
+    # CUDA 아키텍처 (단일 값 또는 리스트)
+    cuda = preset.get("cuda")
+    if isinstance(cuda, dict):
+        if "arch" not in cuda:
+            errors.append("Missing required field: cuda.arch")
+        else:
+            errors.extend(validate_cuda_arch(cuda["arch"]))
+    
+    # 컴파일러 최적화 프로파일 (선택)
+    if "optimization" in preset:
+        errors.extend(validate_optimization(preset["optimization"]))
+    
     # TensorRT-CUDA 호환성 체크
     # 단순화된 프리셋에는 cuda.version이 없으므로 호환성 체크 생략
     # TensorRT는 항상 활성화되며, 버전은 base_image에서 관리됨
     
+    # APT 패키지 세트 (선택)
+    if "apt_packages" in preset:
+        errors.extend(validate_apt_packages(preset["apt_packages"]))
+    
+    # 시작 시간 최적화 (선택)
+    if "startup" in preset:
+        errors.extend(validate_startup(preset["startup"]))
+    
+    # CMake generator/unity build (선택)
+    if "cmake" in preset:
+        errors.extend(validate_cmake(preset["cmake"]))
+    
     return errors
 
 
@@ -0,0 +1,251 @@
+"""
+시작 시간 최적화 모듈
+
+선택적 startup 스테이지(바이트코드 사전 컴파일, ld.so.cache 재생성)의 설정을 해석하고,
+빌드 완료 후 dev 이미지(before)와 startup 이미지(after)의 새 컨테이너에서
+시작/임포트 시간을 측정하여 before/after 비교를 출력합니다.
+(빌드 컨테이너에는 GPU 가 없으므로 빌드 중에는 측정하지 않음)
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .utils import DOCKER, print_section, print_warning
+
+
+# 프로젝트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 시작/임포트 시간 측정 스크립트 (startup 이미지에는 /opt/xaiva-kit/ 에 포함)
+MEASURE_SCRIPT_PATH = PROJECT_ROOT / "docker" / "build-scripts" / "measure-startup.py"
+
+# 이미지 내 시작 시간 매니페스트 경로 (optimize-startup.sh 에서 생성)
+STARTUP_MANIFEST_PATH = "/usr/local/xaiva_media/startup-manifest.json"
+
+# 시작 시간 최적화 시 사용하는 Dockerfile 타겟
+STARTUP_TARGET = "startup"
+
+# 최적화 전(before) 측정에 사용하는 Dockerfile 타겟
+STARTUP_BASELINE_TARGET = "dev"
+
+# Xaiva Media Python 엔트리 포인트 (pybind11 모듈)
+XAIVA_ENTRY_POINTS = ["XaivaDecoder", "XaivaEncoder", "XaivaImageProcessor", "XaivaMuxer"]
+
+# 기본 측정 모듈 (프리셋 startup.modules 로 오버라이드 가능)
+DEFAULT_STARTUP_MODULES = ["numpy", "torch", "torchvision", "scipy", "skimage", "cv2"] + XAIVA_ENTRY_POINTS
+
+# 컨테이너 안에서 측정 스크립트를 stdin 으로 받아 실행하고 결과 매니페스트를 stdout 으로 출력
+# (dev 이미지에는 스크립트가 없고, 원격 docker 데몬에서도 동작하도록 bind mount 를 사용하지 않음)
+MEASURE_COMMAND = (
+    'python3 -B - measure --manifest /tmp/startup-manifest.json --phase "$0" "$@" >&2 '
+    '&& cat /tmp/startup-manifest.json'
+)
+
+
+def validate_startup(startup: Any) -> List[str]:
+    """
+    프리셋의 startup 섹션을 검증합니다.
+
+    Args:
+        startup: 프리셋의 startup 값
+
+    Returns:
+        에러 메시지 리스트 (빈 리스트면 유효함)
+    """
+    if not isinstance(startup, dict):
+        return ["Field startup must be dict"]
+
+    errors = []
+
+    if "enabled" in startup and not isinstance(startup["enabled"], bool):
+        errors.append("Field startup.enabled must be bool")
+
+    modules = startup.get("modules", DEFAULT_STARTUP_MODULES)
+    if not isinstance(modules, list) or not all(
+        isinstance(m, str) and m.replace(".", "").replace("_", "").isalnum() for m in modules
+    ):
+        errors.append("Field startup.modules must be a list of Python module names")
+
+    return errors
+
+
+def is_startup_enabled(preset: Dict[str, Any]) -> bool:
+    """
+    프리셋에서 시작 시간 최적화가 활성화되어 있는지 확인합니다.
+
+    Args:
+        preset: 프리셋 데이터
+
+    Returns:
+        활성화되어 있으면 True
+    """
+    return preset.get("startup", {}).get("enabled", False)
+
+
+def get_startup_modules(preset: Dict[str, Any]) -> List[str]:
+    """
+    시작 시간을 측정할 모듈 목록을 반환합니다.
+
+    Args:
+        preset: 프리셋 데이터
+
+    Returns:
+        모듈 이름 리스트
+    """
+    return preset.get("startup", {}).get("modules", DEFAULT_STARTUP_MODULES)
+
+
+def has_gpu_runtime() -> bool:
+    """
+    docker 데몬에 NVIDIA 런타임이 등록되어 있는지 확인합니다.
+
+    Returns:
+        --gpus 옵션으로 컨테이너를 실행할 수 있으면 True
+    """
+    try:
+        result = subprocess.run(
+            [DOCKER, "info", "--format", "{{json .Runtimes}}"],
+            capture_output=True,
+            text=True
+        )
+    except OSError:
+        return False
+
+    return result.returncode == 0 and "nvidia" in result.stdout
+
+
+def measure_startup(image: str, modules: List[str], phase: str, gpus: bool = False) -> Dict[str, Any]:
+    """
+    이미지의 새 컨테이너에서 시작/임포트 시간을 측정합니다.
+
+    Args:
+        image: 이미지 태그 또는 ID
+        modules: 측정할 모듈 목록
+        phase: 매니페스트 phase 이름 (before/after)
+        gpus: --gpus all 로 실행할지 여부
+
+    Returns:
+        phase 측정 결과 (interpreter, modules), 실패 시 {"error": 메시지}
+    """
+    cmd = [DOCKER, "run", "--rm", "-i"]
+    if gpus:
+        cmd.extend(["--gpus", "all"])
+    cmd.extend(["--entrypoint", "sh", image, "-c", MEASURE_COMMAND, phase] + list(modules))
+
+    try:
+        result = subprocess.run(
+            cmd,
+            input=MEASURE_SCRIPT_PATH.read_text(encoding="utf-8"),
+            capture_output=True,
+            text=True
+        )
+    except OSError as e:
+        return {"error": str(e)}
+
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+
+    try:
+        manifest = json.loads(result.stdout)
+        return dict(manifest["phases"][phase], python=manifest.get("python"))
+    except (ValueError, KeyError):
+        return {"error": "invalid manifest output"}
+
+
+def _format_change(before: Optional[float], after: Optional[float]) -> str:
+    """before/after 변화율 문자열"""
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def format_startup_report(manifest: Dict[str, Any]) -> List[str]:
+    """
+    시작 시간 매니페스트의 before/after 비교 표를 생성합니다.
+
+    Args:
+        manifest: 이미지 매니페스트(bytecode, ldconfig)에 측정 결과(phases, gpus)를 합친 데이터
+
+    Returns:
+        출력할 줄 리스트
+    """
+    before = manifest["phases"]["before"]
+    after = manifest["phases"]["after"]
+
+    python = after.get("python") or manifest.get("python", "?")
+    gpus = "with GPU" if manifest.get("gpus") else "without GPU"
+    lines = [f"  Python {python}, median wall time per fresh interpreter (new container, {gpus})"]
+
+    bytecode = manifest.get("bytecode", {})
+    if bytecode:
+        lines.append(
+            f"  Bytecode: {bytecode.get('pyc_files', '?')} .pyc ({bytecode.get('invalidation_mode', '?')}), "
+            f"{bytecode.get('compile_errors', 0)} uncompilable file(s), {bytecode.get('seconds', '?')}s"
+        )
+    ldconfig = manifest.get("ldconfig", {})
+    if ldconfig:
+        lines.append(f"  ld.so.cache: {ldconfig.get('entries', '?')} entries")
+
+    lines.append("")
+    lines.append(f"  {'module':<22} {'before':>10} {'after':>10} {'change':>8}  {'import (after)':>14}")
+
+    rows = [("(interpreter)", before.get("interpreter", {}), after.get("interpreter", {}))]
+    for module, entry in after.get("modules", {}).items():
+        rows.append((module, before.get("modules", {}).get(module, {}), entry))
+
+    for name, old, new in rows:
+        if "error" in new:
+            lines.append(f"  {name:<22} {'failed':>10}  ({new['error']})")
+            continue
+
+        marker = " *" if name in XAIVA_ENTRY_POINTS else ""
+        import_ms = f"{new['import_us'] / 1000:.1f} ms" if "import_us" in new else "-"
+        old_ms = f"{old['wall_ms']:.1f} ms" if "wall_ms" in old else "n/a"
+        lines.append(
+            f"  {name + marker:<22} {old_ms:>10} {new['wall_ms']:>7.1f} ms "
+            f"{_format_change(old.get('wall_ms'), new.get('wall_ms')):>8}  {import_ms:>14}"
+        )
+
+    lines.append("")
+    lines.append("  * Xaiva Media entry point")
+    lines.append(f"  Manifest: {STARTUP_MANIFEST_PATH}")
+    return lines
+
+
+def report_startup(
+    manifest_text: Optional[str],
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    gpus: bool
+) -> None:
+    """
+    빌드 후 측정한 before/after 시작 시간 비교를 출력합니다.
+
+    Args:
+        manifest_text: 이미지에서 읽은 매니페스트 내용 (없으면 None)
+        before: dev 이미지 측정 결과 (measure_startup)
+        after: startup 이미지 측정 결과 (measure_startup)
+        gpus: GPU 를 할당한 컨테이너에서 측정했는지 여부
+    """
+    manifest: Dict[str, Any] = {}
+    if manifest_text is None:
+        print_warning(f"Startup manifest not found in image: {STARTUP_MANIFEST_PATH}")
+    else:
+        try:
+            manifest = json.loads(manifest_text)
+        except ValueError:
+            print_warning("Startup manifest is invalid, reporting measurements only")
+
+    for phase, result in (("before", before), ("after", after)):
+        if "error" in result:
+            print_warning(f"Startup measurement ({phase}) failed: {result['error']}")
+            return
+
+    manifest.update(phases={"before": before, "after": after}, gpus=gpus)
+
+    print_section("Startup Report (before -> after)")
+    for line in format_startup_report(manifest):
+        print(line)
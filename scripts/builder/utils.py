@@ -4,9 +4,14 @@
 콘솔 출력 관련 유틸리티 함수들을 제공합니다.
 """
 
+import os
 import sys
 
 
+# docker CLI 실행 파일 (XAIVA_KIT_DOCKER 로 대체 가능, 예: 테스트용 fake docker 스크립트)
+DOCKER = os.environ.get("XAIVA_KIT_DOCKER", "docker")
+
+
 def print_header(text: str) -> None:
     """헤더 출력"""
     print(f"\n{'=' * 80}")
@@ -36,4 +41,13 @@ def print_success(text: str) -> None:
 
 def print_info(text: str) -> None:
     """정보 메시지 출력"""
-    print(f"\nℹ️  {text}")
\ No newline at end of file
+    print(f"\nℹ️  {text}")
+
+
+def format_size(num_bytes: float) -> str:
+    """바이트 크기를 사람이 읽기 쉬운 형식으로 변환 (예: 1.5 GB)"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+fake_docker.py - 테스트용 docker CLI 대체 스크립트
+
+XAIVA_KIT_DOCKER 로 지정하여 실제 docker 데몬 없이 gc/apt 동작을 검증합니다.
+상태는 FAKE_DOCKER_STATE 경로의 JSON 파일에 저장되며, 모든 호출은 "calls" 에 기록됩니다.
+
+상태 형식:
+    {
+        "images": [{"id", "repository", "tag", "size", "created", "labels", "in_use", "archive", "layers"}],
+        "layers": {layer: bytes},
+        "build_cache": bytes,
+        "image_store": "containerd" | "overlay2" (기본: containerd),
+        "buildx_driver": 빌더 드라이버 (기본: docker),
+        "runtimes": 컨테이너 런타임 목록 (기본: ["runc"]),
+        "pull": {"seconds": pull 소요 시간, "error": 실패 메시지} (pull 프로세스 PID 는 "pull_pids" 에 기록),
+        "calls": [[args...]]
+    }
+    (dangling 이미지는 repository/tag 가 null)
+    (layers 가 있으면 이미지 크기는 레이어 합계이고, 여러 이미지가 공유하는 레이어는
+     system df 에서 한 번만 계산됨. 없으면 size 크기의 고유 레이어 하나로 간주)
+
+지원 명령:
+    images [--no-trunc] [--filter dangling=true] [--filter label=K] [--format F] [REPOSITORY]
+    image inspect --format F IMAGE...
+    rmi IMAGE
+    pull IMAGE
+    save -o PATH IMAGE (이미지의 "archive" 파일을 PATH 로 복사)
+    system df --format F
+    system df -v --format "{{json .}}"
+    builder prune --force --keep-storage BYTES
+    info --format F (DriverStatus, Runtimes)
+    buildx inspect
+    run [--rm] [-i] [--gpus G] [--entrypoint E] [-v SRC:DST] [-e K=V] IMAGE CMD...
+        (E CMD 를 로컬에서 실행; 값이 마운트 경로(DST)인 -e 변수는 SRC 로 바꿔 전달)
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+
+STATE_PATH = os.environ["FAKE_DOCKER_STATE"]
+
+
+def load_state():
+    with open(STATE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state):
+    with open(STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def render(template, fields, labels=None):
+    """Go 템플릿의 {{.Field}}, {{index .Config.Labels "key"}} 만 치환"""
+    template = template.replace("\\t", "\t")
+    template = re.sub(
+        r'\{\{index \.Config\.Labels "([^"]+)"\}\}',
+        lambda m: (labels or {}).get(m.group(1), ""),
+        template,
+    )
+    return re.sub(r"\{\{\.(\w+)\}\}", lambda m: str(fields.get(m.group(1), "")), template)
+
+
+def option_values(args, name):
+    return [args[i + 1] for i, arg in enumerate(args[:-1]) if arg == name]
+
+
+def human_size(num_bytes):
+    """docker CLI 형식 (1000 단위)"""
+    for unit in ("B", "kB", "MB", "GB"):
+        if num_bytes < 1000:
+            return f"{num_bytes:.3g}{unit}"
+        num_bytes /= 1000
+    return f"{num_bytes:.3g}TB"
+
+
+def image_layers(state, image):
+    """이미지의 {레이어: 크기}"""
+    if "layers" not in image:
+        return {f"{image['id']}/layer": image["size"]}
+    return {layer: state["layers"][layer] for layer in image["layers"]}
+
+
+def find_image(images, name):
+    for image in images:
+        tag = f"{image['repository']}:{image['tag']}" if image["tag"] else None
+        if name in (image["id"], tag):
+            return image
+    return None
+
+
+def cmd_images(state, args):
+    filters = option_values(args, "--filter")
+    template = (option_values(args, "--format") or ["{{.ID}}"])[0]
+    positional = [a for i, a in enumerate(args) if not a.startswith("--") and args[i - 1] not in ("--filter", "--format")]
+
+    for image in state["images"]:
+        if "dangling=true" in filters and image["tag"] is not None:
+            continue
+        for item in filters:
+            if item.startswith("label=") and item[len("label="):] not in image.get("labels", {}):
+                break
+        else:
+            if positional and image["repository"] != positional[0]:
+                continue
+            print(render(template, {
+                "ID": image["id"],
+                "Repository": image["repository"] or "<none>",
+                "Tag": image["tag"] or "<none>",
+            }))
+    return 0
+
+
+def cmd_image_inspect(state, args):
+    template = option_values(args, "--format")[0]
+    names = [a for i, a in enumerate(args) if a != "--format" and args[i - 1] != "--format"]
+
+    lines = []
+    for name in names:
+        image = find_image(state["images"], name)
+        if image is None:
+            print(f"Error: No such image: {name}", file=sys.stderr)
+            return 1
+        lines.append(render(template, {
+            "Id": image["id"],
+            "Size": sum(image_layers(state, image).values()),
+            "Created": image["created"],
+        }, image.get("labels", {})))
+
+    print("\n".join(lines))
+    return 0
+
+
+def cmd_rmi(state, args):
+    image = find_image(state["images"], args[0])
+    if image is None:
+        print(f"Error: No such image: {args[0]}", file=sys.stderr)
+        return 1
+    if image.get("in_use"):
+        print(f"Error: conflict: unable to remove {args[0]} (image is being used)", file=sys.stderr)
+        return 1
+
+    state["images"].remove(image)
+    save_state(state)
+    return 0
+
+
+def cmd_save(state, args):
+    image = find_image(state["images"], args[-1])
+    if image is None or not image.get("archive"):
+        print(f"Error: No such image: {args[-1]}", file=sys.stderr)
+        return 1
+
+    shutil.copyfile(image["archive"], option_values(args, "-o")[0])
+    return 0
+
+
+def cmd_pull(state, args):
+    state.setdefault("pull_pids", []).append(os.getpid())
+    save_state(state)
+
+    pull = state.get("pull", {})
+    if pull.get("error"):
+        print(f"Error response from daemon: {pull['error']}")
+        return 1
+
+    print(f"{args[0]}: Pulling from fake")
+    print("layer1: Pulling fs layer", flush=True)
+    time.sleep(pull.get("seconds", 0))
+    print("layer1: Pull complete")
+    return 0
+
+
+def cmd_system_df(state, args):
+    users = {}
+    for image in state["images"]:
+        for layer, size in image_layers(state, image).items():
+            users.setdefault(layer, [size, 0])[1] += 1
+
+    if "-v" in args:
+        images = []
+        for image in state["images"]:
+            layers = image_layers(state, image)
+            shared = sum(size for layer, size in layers.items() if users[layer][1] > 1)
+            images.append({
+                "ID": image["id"],
+                "Repository": image["repository"] or "<none>",
+                "Tag": image["tag"] or "<none>",
+                "Size": human_size(sum(layers.values())),
+                "SharedSize": human_size(shared),
+                "UniqueSize": human_size(sum(layers.values()) - shared),
+            })
+        print(json.dumps({"Images": images, "Containers": [], "Volumes": [], "BuildCache": []}))
+        return 0
+
+    template = option_values(args, "--format")[0]
+    print(render(template, {"Type": "Images", "Size": human_size(sum(size for size, _ in users.values()))}))
+    print(render(template, {"Type": "Build Cache", "Size": human_size(state.get("build_cache", 0))}))
+    return 0
+
+
+def cmd_builder_prune(state, args):
+    keep = int(option_values(args, "--keep-storage")[0])
+    state["build_cache"] = min(state.get("build_cache", 0), keep)
+    save_state(state)
+    return 0
+
+
+def cmd_info(state, args):
+    if "Runtimes" in option_values(args, "--format")[0]:
+        print(json.dumps({name: {} for name in state.get("runtimes", ["runc"])}))
+        return 0
+    if state.get("image_store", "containerd") == "containerd":
+        print('[["driver-type","io.containerd.snapshotter.v1"]]')
+    else:
+        print('[["Backing Filesystem","extfs"]]')
+    return 0
+
+
+def cmd_buildx_inspect(state, args):
+    print("Name:          default")
+    print(f"Driver:        {state.get('buildx_driver', 'docker')}")
+    return 0
+
+
+def cmd_run(state, args):
+    mounts = {}
+    env = {}
+    entrypoint = []
+    rest = list(args)
+
+    while rest and rest[0].startswith("-"):
+        option = rest.pop(0)
+        if option == "--entrypoint":
+            entrypoint = [rest.pop(0)]
+        elif option == "--gpus":
+            rest.pop(0)
+        elif option == "-v":
+            source, target = rest.pop(0).split(":")[:2]
+            mounts[target] = source
+        elif option == "-e":
+            key, _, value = rest.pop(0).partition("=")
+            env[key] = value
+
+    env = {key: mounts.get(value, value) for key, value in env.items()}
+
+    # rest[0] 은 이미지 이름 (로컬 실행이므로 무시), stdin 은 그대로 전달
+    return subprocess.run(entrypoint + rest[1:], env=dict(os.environ, **env)).returncode
+
+
+def main():
+    args = sys.argv[1:]
+    state = load_state()
+    state.setdefault("calls", []).append(args)
+    save_state(state)
+
+    if args[:1] == ["images"]:
+        return cmd_images(state, args[1:])
+    if args[:2] == ["image", "inspect"]:
+        return cmd_image_inspect(state, args[2:])
+    if args[:1] == ["rmi"]:
+        return cmd_rmi(state, args[1:])
+    if args[:1] == ["pull"]:
+        return cmd_pull(state, args[1:])
+    if args[:1] == ["save"]:
+        return cmd_save(state, args[1:])
+    if args[:2] == ["system", "df"]:
+        return cmd_system_df(state, args[2:])
+    if args[:2] == ["builder", "prune"]:
+        return cmd_builder_prune(state, args[2:])
+    if args[:1] == ["info"]:
+        return cmd_info(state, args[1:])
+    if args[:2] == ["buildx", "inspect"]:
+        return cmd_buildx_inspect(state, args[2:])
+    if args[:1] == ["run"]:
+        return cmd_run(state, args[1:])
+
+    print(f"fake docker: unsupported command: {' '.join(args)}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
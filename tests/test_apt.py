@@ -0,0 +1,179 @@
+"""
+APT .deb 미러링 테스트 (tests/fake_docker.py + 로컬 HTTP APT 저장소 사용)
+
+fake docker 가 미러 스크립트를 로컬에서 실행하므로, 격리된 APT_CONFIG 로
+호스트 apt 상태를 건드리지 않고 임시 저장소에서 .deb 를 내려받습니다.
+apt-get / dpkg-deb / dpkg-scanpackages 가 없는 환경에서는 건너뜁니다.
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import contextlib
+import functools
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import apt  # noqa: E402
+
+
+FAKE_DOCKER = str(TESTS_DIR / "fake_docker.py")
+PACKAGE = "xaiva-kit-test-pkg"
+APT_TOOLS = ("apt-get", "apt-config", "dpkg-deb", "dpkg-scanpackages")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def build_repo(repo_dir: Path) -> None:
+    """테스트 패키지 하나로 구성된 flat APT 저장소 생성"""
+    package_dir = repo_dir / "src" / "DEBIAN"
+    package_dir.mkdir(parents=True)
+    (package_dir / "control").write_text(
+        f"Package: {PACKAGE}\n"
+        "Version: 1.0\n"
+        "Architecture: all\n"
+        "Maintainer: xaiva-kit <xaiva-kit@example.com>\n"
+        "Description: xaiva-kit apt mirror test package\n",
+        encoding="utf-8",
+    )
+    subprocess.run(
+        ["dpkg-deb", "--build", str(repo_dir / "src"), str(repo_dir / f"{PACKAGE}_1.0_all.deb")],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    shutil.rmtree(repo_dir / "src")
+    with open(repo_dir / "Packages", "w", encoding="utf-8") as f:
+        subprocess.run(
+            ["dpkg-scanpackages", "--multiversion", ".", "/dev/null"],
+            cwd=repo_dir, stdout=f, stderr=subprocess.DEVNULL, check=True,
+        )
+
+
+def isolated_apt_config(root: Path) -> Path:
+    """호스트 apt 상태/소스/잠금과 분리된 APT_CONFIG 파일 생성"""
+    for path in ("state/lists/partial", "cache/archives/partial", "etc"):
+        (root / path).mkdir(parents=True)
+    (root / "state" / "status").touch()
+    (root / "etc" / "sources.list").touch()
+
+    config = root / "apt.conf"
+    config.write_text(
+        f'Dir::State "{root}/state";\n'
+        f'Dir::State::status "{root}/state/status";\n'
+        f'Dir::Cache "{root}/cache";\n'
+        f'Dir::Etc::SourceList "{root}/etc/sources.list";\n'
+        'Dir::Etc::SourceParts "-";\n'
+        'Debug::NoLocking "true";\n',
+        encoding="utf-8",
+    )
+    return config
+
+
+class DockerfileDefaultsTest(unittest.TestCase):
+    """docker build 직접 실행 시의 APT_PACKAGES 기본값"""
+
+    def test_default_matches_default_groups(self):
+        dockerfile = (TESTS_DIR.parent / "docker" / "Dockerfile").read_text(encoding="utf-8")
+        match = re.search(r'^ARG APT_PACKAGES="([^"]*)"', dockerfile, re.MULTILINE)
+        self.assertIsNotNone(match)
+
+        preset = {"python": {"version": "${PYTHON_VERSION}"}}
+        self.assertEqual(match.group(1).replace("\\\n", " ").split(), apt.get_apt_packages(preset))
+
+    def test_shipped_presets_define_default_groups(self):
+        presets_dir = TESTS_DIR.parent / "presets"
+        for path in [presets_dir / "template" / "preset-template.json", *presets_dir.glob("*.json")]:
+            apt_packages = json.loads(path.read_text(encoding="utf-8")).get("apt_packages", {})
+            self.assertEqual(apt.validate_apt_packages(apt_packages), [], path.name)
+            self.assertLessEqual(set(apt.DEFAULT_APT_PACKAGES), set(apt_packages), path.name)
+
+
+@unittest.skipUnless(all(shutil.which(tool) for tool in APT_TOOLS), "apt/dpkg tools not available")
+class MirrorDebsTest(unittest.TestCase):
+    """로컬 HTTP 저장소에서 artifacts/<preset>/debs 로 미러링"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+        repo_dir = self.tmp / "repo"
+        repo_dir.mkdir()
+        build_repo(repo_dir)
+
+        handler = functools.partial(_QuietHandler, directory=str(repo_dir))
+        server = HTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.apt_source = f"deb [trusted=yes] http://127.0.0.1:{server.server_port} ./"
+
+        state_path = self.tmp / "docker-state.json"
+        state_path.write_text("{}", encoding="utf-8")
+
+        patches = [
+            mock.patch.object(apt, "ARTIFACTS_DIR", self.tmp / "artifacts"),
+            mock.patch.dict(os.environ, {
+                "FAKE_DOCKER_STATE": str(state_path),
+                "APT_CONFIG": str(isolated_apt_config(self.tmp / "apt")),
+            }),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        # 기본 패키지 그룹을 모두 비우고 테스트 패키지만 미러링
+        self.preset = {
+            "base_image": "ubuntu:22.04",
+            "python": {"version": "3.10"},
+            "apt_packages": dict({group: [] for group in apt.DEFAULT_APT_PACKAGES}, test=[PACKAGE]),
+        }
+
+    def mirror(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return apt.mirror_debs(self.preset, "test", docker=FAKE_DOCKER, **kwargs)
+
+    def test_mirror_from_local_repo(self):
+        self.assertEqual(self.mirror(apt_source=self.apt_source), 0)
+
+        debs_dir = apt.get_debs_dir("test")
+        self.assertEqual([p.name for p in debs_dir.glob("*.deb")], [f"{PACKAGE}_1.0_all.deb"])
+        self.assertIn(f"Package: {PACKAGE}", (debs_dir / apt.DEBS_INDEX).read_text(encoding="utf-8"))
+
+        manifest = json.loads((debs_dir / apt.DEBS_MANIFEST).read_text(encoding="utf-8"))
+        self.assertEqual(manifest["packages"], [PACKAGE])
+        self.assertTrue(apt.check_deb_cache(self.preset, "test"))
+
+        # 패키지 세트가 바뀌면 미러는 더 이상 유효하지 않음
+        self.preset["apt_packages"]["test"] = [PACKAGE, "other-package"]
+        self.assertFalse(apt.check_deb_cache(self.preset, "test"))
+
+    def test_missing_package_fails(self):
+        self.preset["apt_packages"]["test"] = ["xaiva-kit-no-such-package"]
+
+        self.assertNotEqual(self.mirror(apt_source=self.apt_source), 0)
+        self.assertFalse(apt.check_deb_cache(self.preset, "test"))
+
+    def test_dry_run_does_not_run_docker(self):
+        self.assertEqual(self.mirror(apt_source=self.apt_source, dry_run=True), 0)
+
+        state = json.loads(Path(os.environ["FAKE_DOCKER_STATE"]).read_text(encoding="utf-8"))
+        self.assertEqual(state, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+체크포인트 fingerprint 테스트
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import checkpoint  # noqa: E402
+
+
+class StageFingerprintTest(unittest.TestCase):
+    """Dockerfile 의 스테이지 구간만 해당 스테이지 fingerprint 에 반영"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+        self.dockerfile = self.tmp / "Dockerfile"
+        shutil.copy(checkpoint.DOCKERFILE_PATH, self.dockerfile)
+        patch = mock.patch.object(checkpoint, "DOCKERFILE_PATH", self.dockerfile)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        self.build_args = {"XAIVA_SOURCE_PATH": str(self.tmp / "xaiva-media")}
+
+    def edit_stage(self, stage_name, line):
+        """스테이지의 FROM 줄 바로 뒤에 한 줄 추가"""
+        lines = self.dockerfile.read_text(encoding="utf-8").splitlines(keepends=True)
+        index = next(i for i, text in enumerate(lines) if text.rstrip().endswith(f" AS {stage_name}"))
+        lines.insert(index + 1, line + "\n")
+        self.dockerfile.write_text("".join(lines), encoding="utf-8")
+
+    def changed_stages(self, edit):
+        before = checkpoint.compute_stage_fingerprints(self.build_args, "test")
+        edit()
+        after = checkpoint.compute_stage_fingerprints(self.build_args, "test")
+        return [name for name in before if before[name] != after[name]]
+
+    def test_sections_cover_checkpoint_stages(self):
+        sections = checkpoint._dockerfile_sections(self.dockerfile)
+        for stage in checkpoint.CHECKPOINT_STAGES:
+            for section in stage["dockerfile_sections"]:
+                self.assertIn(section, sections)
+
+    def test_later_stage_edit_keeps_checkpoints(self):
+        self.assertEqual(self.changed_stages(lambda: self.edit_stage("dev", "RUN true")), [])
+
+    def test_stage_edit_invalidates_stage_and_children(self):
+        self.assertEqual(
+            self.changed_stages(lambda: self.edit_stage("opencv", "RUN true")),
+            ["opencv", "xaiva"],
+        )
+
+    def test_deps_edit_invalidates_all(self):
+        self.assertEqual(
+            self.changed_stages(lambda: self.edit_stage("deps", "RUN true")),
+            [stage["name"] for stage in checkpoint.CHECKPOINT_STAGES],
+        )
+
+    def test_comment_edit_keeps_checkpoints(self):
+        self.assertEqual(self.changed_stages(lambda: self.edit_stage("ffmpeg", "# comment")), [])
+
+
+@unittest.skipUnless(shutil.which("git"), "git not available")
+class SourceTreeHashTest(unittest.TestCase):
+    """Git 소스 트리 해시는 COPY 로 전송되는 추적되지 않은/무시된 파일의 내용을 포함"""
+
+    def setUp(self):
+        self.repo = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.repo, ignore_errors=True)
+
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], cwd=self.repo, check=True)
+        (self.repo / "main.cpp").write_text("int main() { return 0; }\n", encoding="utf-8")
+        (self.repo / ".gitignore").write_text("build/\n", encoding="utf-8")
+        subprocess.run(git + ["add", "."], cwd=self.repo, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=self.repo, check=True)
+
+    def test_untracked_content_changes_hash(self):
+        (self.repo / "new.cpp").write_text("int a = 1;\n", encoding="utf-8")
+        before = checkpoint._hash_source_tree(self.repo)
+
+        (self.repo / "new.cpp").write_text("int a = 2;\n", encoding="utf-8")
+        self.assertNotEqual(checkpoint._hash_source_tree(self.repo), before)
+
+    def test_ignored_files_change_hash(self):
+        # .dockerignore 가 없으므로 .gitignore 로 제외된 파일도 빌드 컨텍스트로 전송됨
+        before = checkpoint._hash_source_tree(self.repo)
+
+        (self.repo / "build").mkdir()
+        (self.repo / "build" / "CMakeCache.txt").write_text("CMAKE_BUILD_TYPE:STRING=Debug\n", encoding="utf-8")
+        debug = checkpoint._hash_source_tree(self.repo)
+        self.assertNotEqual(debug, before)
+
+        (self.repo / "build" / "CMakeCache.txt").write_text("CMAKE_BUILD_TYPE:STRING=Release\n", encoding="utf-8")
+        self.assertNotEqual(checkpoint._hash_source_tree(self.repo), debug)
+
+    def test_nested_repository_content_changes_hash(self):
+        nested = self.repo / "third_party" / "lib"
+        nested.mkdir(parents=True)
+        subprocess.run(["git", "init", "-q"], cwd=nested, check=True)
+        (nested / "lib.cpp").write_text("int x = 1;\n", encoding="utf-8")
+        before = checkpoint._hash_source_tree(self.repo)
+
+        (nested / "lib.cpp").write_text("int x = 2;\n", encoding="utf-8")
+        self.assertNotEqual(checkpoint._hash_source_tree(self.repo), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
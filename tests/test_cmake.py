@@ -0,0 +1,54 @@
+"""
+cmake 프리셋 섹션 테스트
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import cmake  # noqa: E402
+
+
+class ValidateCmakeTest(unittest.TestCase):
+
+    def test_valid(self):
+        self.assertEqual(cmake.validate_cmake({}), [])
+        self.assertEqual(cmake.validate_cmake({
+            "generator": "ninja",
+            "unity_build": ["opencv", "xaiva"],
+            "unity_batch_size": 16,
+            "measure_rebuilds": True,
+        }), [])
+
+    def test_unhashable_values_are_errors(self):
+        # 리스트/딕셔너리 값은 TypeError 대신 에러 메시지로 보고
+        for section in (
+            {"generator": ["ninja"]},
+            {"generator": {"name": "ninja"}},
+            {"unity_build": [["xaiva"]]},
+            {"unity_build": [{"name": "xaiva"}]},
+        ):
+            self.assertEqual(len(cmake.validate_cmake(section)), 1, section)
+
+    def test_unknown_values(self):
+        self.assertEqual(len(cmake.validate_cmake({"generator": "xcode"})), 1)
+        self.assertEqual(len(cmake.validate_cmake({"unity_build": ["ffmpeg"]})), 1)
+        self.assertEqual(len(cmake.validate_cmake({"unity_batch_size": True})), 1)
+
+
+class CmakeBuildArgsTest(unittest.TestCase):
+
+    def test_rebuild_measurement_is_opt_in(self):
+        self.assertEqual(cmake.get_cmake_build_args({})["MEASURE_REBUILDS"], "0")
+        self.assertEqual(
+            cmake.get_cmake_build_args({"cmake": {"measure_rebuilds": True}})["MEASURE_REBUILDS"], "1"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+CUDA fat binary 리포트 테스트
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import cuda  # noqa: E402
+
+
+REPORT = "\n".join([
+    "kind\tarch\tbytes",
+    "ptx\t86\t300",
+    "sass\t100\t50",
+    "sass\t70\t1000",
+    "sass\t86\t2000",
+    "sass\tunknown\t400",
+])
+
+
+class FatbinOverheadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fatbin = cuda.parse_fatbin_report(REPORT)
+
+    def test_ptx_arch_is_numeric_max(self):
+        self.assertEqual(cuda.get_ptx_arch(["86", "100", "70"]), "100")
+        self.assertEqual(cuda.get_ptx_arch(["100", "86"]), "100")
+
+    def test_overhead_excludes_primary_and_unknown(self):
+        # 목록 순서와 무관하게 sm_100 이 기준, unknown 은 제외
+        self.assertEqual(cuda.calculate_fatbin_overhead(self.fatbin, ["100", "70", "86"]), 1000 + 2300)
+        self.assertEqual(cuda.calculate_fatbin_overhead(self.fatbin, ["86", "70"]), 1000 + 50)
+
+    def test_get_cuda_archs_sorts_numerically(self):
+        self.assertEqual(cuda.get_cuda_archs({"cuda": {"arch": ["100", "86", "70", "86"]}}), ["70", "86", "100"])
+
+
+if __name__ == "__main__":
+    unittest.main()
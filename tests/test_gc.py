@@ -0,0 +1,278 @@
+"""
+gc 서브커맨드 테스트 (tests/fake_docker.py 사용)
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import apt, gc  # noqa: E402
+
+
+GB = 1000 ** 3
+FAKE_DOCKER = str(TESTS_DIR / "fake_docker.py")
+
+
+def image(image_id, repository, tag, layers, labels=None, in_use=False):
+    return {
+        "id": f"sha256:{image_id}",
+        "repository": repository,
+        "tag": tag,
+        "layers": layers,
+        "created": "2026-01-01T00:00:00.123456789Z",
+        "labels": labels or {},
+        "in_use": in_use,
+    }
+
+
+class GcTestCase(unittest.TestCase):
+    """임시 디렉터리의 fake docker 상태, artifacts, .build-state 로 gc 실행"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state_path = self.tmp / "docker-state.json"
+        self.artifacts_dir = self.tmp / "artifacts"
+        self.locks_dir = self.tmp / ".build-state" / "locks"
+        self.usage_path = self.tmp / ".build-state" / "usage.json"
+
+        # 모든 이미지가 CUDA 베이스 레이어를 공유하고, 같은 프리셋의 이미지는 deps 레이어를 공유
+        #   distinct 레이어 합계 44GB, 무관한 이미지의 고유 레이어(redis) 1GB -> xaiva-kit 이미지 43GB
+        #   고유 크기: old 4, old 체크포인트 0 (최종/dangling 이미지와 공유), dangling 5, mid 10, new 10
+        self.write_state({
+            "layers": {
+                "cuda": 8 * GB, "redis": 1 * GB,
+                "old-deps": 6 * GB, "old-app": 4 * GB, "old-prev": 5 * GB,
+                "mid-deps": 6 * GB, "mid-app": 4 * GB,
+                "new-deps": 6 * GB, "new-app": 4 * GB,
+            },
+            "images": [
+                image("a1", "xaiva-kit", "old", ["cuda", "old-deps", "old-app"], {"xaiva-kit.preset": "old"}),
+                image("a2", "xaiva-kit-checkpoint", "old-opencv-abc123", ["cuda", "old-deps"]),
+                image("a3", None, None, ["cuda", "old-deps", "old-prev"], {"xaiva-kit.preset": "old"}),
+                image("b1", "xaiva-kit", "mid", ["cuda", "mid-deps", "mid-app"], {"xaiva-kit.preset": "mid"}),
+                image("c1", "xaiva-kit", "new", ["cuda", "new-deps", "new-app"], {"xaiva-kit.preset": "new"}),
+                # xaiva-kit 과 무관한 이미지는 예산에 포함되지 않아야 함 (공유 베이스 레이어 제외)
+                image("z1", "nvidia/cuda", "11.8.0-cudnn8-devel-ubuntu22.04", ["cuda"]),
+                image("z2", "redis", "7", ["redis"]),
+            ],
+            "build_cache": 20 * GB,
+        })
+
+        debs_dir = self.artifacts_dir / "mid" / "debs"
+        debs_dir.mkdir(parents=True)
+        (debs_dir / "libfoo.deb").write_bytes(b"x" * 1000)
+
+        self.usage_path.parent.mkdir(parents=True)
+        self.usage_path.write_text(json.dumps({"presets": {
+            "old": {"last_used": 100},
+            "mid": {"last_used": 200},
+            "new": {"last_used": 300},
+        }}))
+
+        os.environ["FAKE_DOCKER_STATE"] = str(self.state_path)
+        for patcher in (
+            mock.patch.object(gc, "DOCKER", FAKE_DOCKER),
+            mock.patch.object(gc, "ARTIFACTS_DIR", self.artifacts_dir),
+            mock.patch.object(apt, "ARTIFACTS_DIR", self.artifacts_dir),
+            mock.patch.object(gc, "LOCKS_DIR", self.locks_dir),
+            mock.patch.object(gc, "USAGE_PATH", self.usage_path),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write_state(self, state):
+        self.state_path.write_text(json.dumps(state))
+
+    def read_state(self):
+        return json.loads(self.state_path.read_text())
+
+    def remaining_tags(self):
+        return sorted(
+            f"{i['repository']}:{i['tag']}" if i["tag"] else i["id"]
+            for i in self.read_state()["images"]
+        )
+
+    def removed(self):
+        """rmi 호출 순서"""
+        return [call[1] for call in self.read_state().get("calls", []) if call[0] == "rmi"]
+
+    def run_gc(self, budget, **kwargs):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            returncode = gc.run_gc(budget, **kwargs)
+        self.output = output.getvalue()
+        return returncode
+
+
+class ParseSizeTest(unittest.TestCase):
+
+    def test_units(self):
+        self.assertEqual(gc.parse_size("200G"), 200 * 1024 ** 3)
+        self.assertEqual(gc.parse_size("1.5TB"), int(1.5 * 1024 ** 4))
+        self.assertEqual(gc.parse_size("512MiB", base=1000), 512 * 1024 ** 2)
+        self.assertEqual(gc.parse_size("46.6GB", base=1000), int(46.6 * GB))
+        self.assertEqual(gc.parse_size("0B"), 0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            gc.parse_size("lots")
+
+
+class MeasureUsageTest(GcTestCase):
+
+    def test_shared_layers_count_once(self):
+        usage = gc.measure_usage()
+        # 이미지 크기 합계(18+14+19+18+18 = 87GB)가 아니라 실제 디스크 사용량
+        self.assertEqual(usage["images"], 43 * GB)
+        self.assertEqual(usage["build_cache"], 20 * GB)
+        self.assertEqual(usage["artifacts"], 1000)
+
+    def test_unique_sizes(self):
+        unique = {tuple(image["tags"]) or (image["id"],): image["unique"] for image in gc.list_images()}
+        self.assertEqual(unique[("xaiva-kit:old",)], 4 * GB)
+        self.assertEqual(unique[("xaiva-kit-checkpoint:old-opencv-abc123",)], 0)
+        self.assertEqual(unique[("sha256:a3",)], 5 * GB)
+        self.assertEqual(unique[("xaiva-kit:mid",)], 10 * GB)
+
+
+class RunGcTest(GcTestCase):
+
+    def real_usage(self):
+        return sum(gc.measure_usage().values())
+
+    def test_lru_order(self):
+        # 63GB -> dangling(5) -> old 이미지(4) -> old 체크포인트(이제 deps 6GB 가 고유) = 48GB
+        self.assertEqual(self.run_gc(50 * GB), 0)
+
+        self.assertEqual(self.removed(), [
+            "sha256:a3",
+            "xaiva-kit:old",
+            "xaiva-kit-checkpoint:old-opencv-abc123",
+        ])
+        self.assertIn("xaiva-kit:mid", self.remaining_tags())
+        self.assertTrue((self.artifacts_dir / "mid" / "debs").is_dir())
+        self.assertEqual(self.read_state()["build_cache"], 20 * GB)
+        self.assertLessEqual(self.real_usage(), 50 * GB)
+        self.assertIn(f"Reclaimed: {gc.format_size(15 * GB)}", self.output)
+        self.assertIn(f"freed {gc.format_size(6 * GB)}", self.output)
+
+    def test_shared_checkpoint_is_not_counted_as_freed(self):
+        # old 이미지/체크포인트가 레이어를 공유하므로 체크포인트만 지워서는 회수되지 않음
+        self.run_gc(62 * GB)
+
+        self.assertEqual(self.removed(), ["sha256:a3"])
+        self.assertIn("xaiva-kit-checkpoint:old-opencv-abc123", self.remaining_tags())
+        self.assertLessEqual(self.real_usage(), 62 * GB)
+
+    def test_artifacts_before_image_within_preset(self):
+        # 48GB (old 삭제 후) -> mid .deb -> mid 이미지 = 38GB
+        self.run_gc(40 * GB)
+
+        self.assertFalse((self.artifacts_dir / "mid" / "debs").exists())
+        self.assertEqual(self.removed()[-1], "xaiva-kit:mid")
+        self.assertIn("xaiva-kit:new", self.remaining_tags())
+
+    def test_protect(self):
+        self.run_gc(50 * GB, protect=["old"])
+
+        self.assertNotIn("sha256:a3", self.removed())
+        self.assertEqual(self.removed(), ["xaiva-kit:mid", "xaiva-kit:new"])
+        self.assertIn("xaiva-kit:old", self.remaining_tags())
+        self.assertIn("xaiva-kit-checkpoint:old-opencv-abc123", self.remaining_tags())
+
+    def test_skips_preset_with_build_in_progress(self):
+        with gc.acquire_build_lock("old"):
+            self.run_gc(30 * GB)
+
+        self.assertIn("skip  old: build in progress", self.output)
+        self.assertEqual(self.removed(), ["xaiva-kit:mid", "xaiva-kit:new"])
+        # 빌드 중에는 전역 빌드 캐시를 정리하지 않음
+        self.assertEqual(self.read_state()["build_cache"], 20 * GB)
+        self.assertIn("build cache: kept (build in progress)", self.output)
+
+    def test_build_cache_keeps_remaining_budget(self):
+        # mid/new 삭제 후 old(23GB, 공유 베이스 포함)는 보호 -> 캐시는 30 - 23 = 7GB 만 유지
+        self.run_gc(30 * GB, protect=["old"])
+
+        self.assertEqual(self.read_state()["build_cache"], 7 * GB)
+        self.assertIn(["builder", "prune", "--force", "--keep-storage", str(7 * GB)], self.read_state()["calls"])
+        self.assertNotIn("Still over budget", self.output)
+        self.assertLessEqual(self.real_usage(), 30 * GB)
+
+    def test_build_cache_kept_when_budget_unreachable(self):
+        self.run_gc(20 * GB, protect=["old"])
+
+        self.assertEqual(self.read_state()["build_cache"], 20 * GB)
+        self.assertIn("build cache: kept", self.output)
+        self.assertIn("Still over budget", self.output)
+
+    def test_image_in_use_is_skipped(self):
+        state = self.read_state()
+        state["images"][1]["in_use"] = True
+        self.write_state(state)
+
+        self.run_gc(50 * GB)
+
+        # 삭제하지 못한 체크포인트 대신 다음 LRU 대상(mid .deb 캐시, mid 이미지)까지 정리
+        self.assertIn("failed   checkpoint", self.output)
+        self.assertIn("xaiva-kit-checkpoint:old-opencv-abc123", self.remaining_tags())
+        self.assertNotIn("xaiva-kit:old", self.remaining_tags())
+        self.assertFalse((self.artifacts_dir / "mid" / "debs").exists())
+        self.assertNotIn("xaiva-kit:mid", self.remaining_tags())
+        self.assertIn("xaiva-kit:new", self.remaining_tags())
+        self.assertLessEqual(self.real_usage(), 50 * GB)
+
+    def test_under_budget_removes_only_dangling(self):
+        self.run_gc(100 * GB)
+
+        self.assertEqual(self.removed(), ["sha256:a3"])
+
+    def test_dry_run(self):
+        self.assertEqual(self.run_gc(40 * GB, dry_run=True), 0)
+
+        calls = self.read_state()["calls"]
+        self.assertFalse([c for c in calls if c[0] == "rmi" or c[:2] == ["builder", "prune"]])
+        self.assertEqual(len(self.read_state()["images"]), 7)
+        self.assertTrue((self.artifacts_dir / "mid" / "debs").is_dir())
+        self.assertFalse(self.locks_dir.exists())
+        # 고유 크기로 추정: 63GB -> dangling(5), old(4 + 0), mid(.deb, 10) = 44GB, new(10) = 34GB
+        self.assertIn("would remove  image      xaiva-kit:old", self.output)
+        self.assertIn("would remove  checkpoint xaiva-kit-checkpoint:old-opencv-abc123", self.output)
+        self.assertIn("would remove  image      xaiva-kit:mid", self.output)
+        self.assertIn("would remove  image      xaiva-kit:new", self.output)
+        self.assertNotIn("build cache:", self.output)
+        self.assertIn("6 item(s)", self.output)
+
+    def test_dry_run_does_not_block_builds(self):
+        with gc.acquire_build_lock("old"):
+            self.run_gc(30 * GB, dry_run=True)
+            # dry run 후에도 빌드 잠금을 다시 잡을 수 있어야 함
+            with gc.acquire_build_lock("old"):
+                pass
+
+        self.assertIn("skip  old: build in progress", self.output)
+        self.assertIn("build cache: kept (build in progress)", self.output)
+
+    def test_concurrent_gc_is_rejected(self):
+        lock = gc._try_lock("gc", gc.fcntl.LOCK_EX)
+        try:
+            self.assertEqual(self.run_gc(30 * GB), 1)
+            self.assertEqual(self.run_gc(30 * GB, dry_run=True), 1)
+        finally:
+            lock.close()
+        self.assertEqual(self.removed(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
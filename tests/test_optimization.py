@@ -0,0 +1,39 @@
+"""
+optimization 프리셋 섹션 테스트
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import optimization  # noqa: E402
+
+
+class ValidateOptimizationTest(unittest.TestCase):
+
+    def test_valid(self):
+        self.assertEqual(optimization.validate_optimization({}), [])
+        self.assertEqual(optimization.validate_optimization({"profile": "lto", "march": "znver3"}), [])
+
+    def test_unhashable_values_are_errors(self):
+        # 리스트/딕셔너리 값은 TypeError 대신 에러 메시지로 보고
+        for section in (
+            {"profile": ["lto"]},
+            {"profile": {"name": "lto"}},
+            {"march": ["znver3"]},
+            {"march": None},
+        ):
+            self.assertEqual(len(optimization.validate_optimization(section)), 1, section)
+
+    def test_unknown_values(self):
+        self.assertEqual(len(optimization.validate_optimization({"profile": "fast"})), 1)
+        self.assertEqual(len(optimization.validate_optimization({"march": "-O3 -march=native"})), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
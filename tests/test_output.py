@@ -0,0 +1,166 @@
+"""
+이미지 출력 형식 테스트 (tests/fake_docker.py 의 save, info, buildx inspect 사용)
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import output  # noqa: E402
+
+
+FAKE_DOCKER = str(TESTS_DIR / "fake_docker.py")
+LAYER_GZIP = "application/vnd.oci.image.layer.v1.tar+gzip"
+
+
+def layer_tar(content: bytes) -> bytes:
+    """파일 하나로 구성된 레이어 tar"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        info = tarfile.TarInfo("data.bin")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def write_oci_archive(path: Path, layers: list) -> None:
+    """레이어 blob 리스트로 docker save 형식(OCI 레이아웃) tar 생성"""
+    blobs = {}
+
+    def add_blob(data: bytes) -> str:
+        digest = "sha256:" + hashlib.sha256(data).hexdigest()
+        blobs[digest] = data
+        return digest
+
+    manifest = json.dumps({
+        "layers": [
+            {"mediaType": LAYER_GZIP, "digest": add_blob(blob), "size": len(blob)}
+            for blob in layers
+        ],
+    }).encode()
+    index = json.dumps({"manifests": [{"digest": add_blob(manifest)}]}).encode()
+
+    with tarfile.open(path, "w") as tar:
+        for name, data in [("index.json", index)] + [
+            (f"blobs/sha256/{digest.split(':')[1]}", data) for digest, data in blobs.items()
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+@unittest.skipUnless(shutil.which("gzip"), "gzip not available")
+class VerifyImageLayersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.layers_tmp = self.tmp / "layers-tmp"
+
+        archive = self.tmp / "image.tar"
+        write_oci_archive(archive, [
+            gzip.compress(layer_tar(b"xaiva" * 1000)),
+            b"not a gzip stream",
+        ])
+
+        state_path = self.tmp / "docker-state.json"
+        state_path.write_text(json.dumps({"images": [{
+            "id": "sha256:a1", "repository": "xaiva-kit", "tag": "test",
+            "size": 0, "created": "", "labels": {}, "archive": str(archive),
+        }]}), encoding="utf-8")
+
+        patches = [
+            mock.patch.object(output, "DOCKER", FAKE_DOCKER),
+            mock.patch.object(output, "REPORTS_DIR", self.tmp / "reports"),
+            mock.patch.object(output, "LAYERS_TMP_DIR", str(self.layers_tmp)),
+            mock.patch.dict(os.environ, {"FAKE_DOCKER_STATE": str(state_path)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def verify(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            results = output.verify_image_layers("xaiva-kit:test", "test", "gzip")
+        return results, stdout.getvalue()
+
+    def test_failed_decompression_is_reported(self):
+        results, stdout = self.verify()
+
+        self.assertEqual(len(results), 2)
+        self.assertNotIn("error", results[0])
+        self.assertEqual(results[0]["uncompressed_bytes"], len(layer_tar(b"xaiva" * 1000)))
+        self.assertIsNotNone(results[0]["decompress_sec"])
+        self.assertIn("error", results[1])
+        self.assertNotIn("gzip_bytes", results[1])
+        self.assertIn("FAILED", stdout)
+
+        report = json.loads((self.tmp / "reports" / "test-layers-gzip.json").read_text(encoding="utf-8"))
+        self.assertEqual(report["layers"], results)
+
+    def test_temp_dir_is_removed(self):
+        self.verify()
+        self.assertEqual(list(self.layers_tmp.iterdir()), [])
+
+    def test_temp_dir_is_removed_on_error(self):
+        with mock.patch.object(output, "_load_manifest", side_effect=KeyError("index.json")):
+            with self.assertRaises(KeyError):
+                self.verify()
+        self.assertEqual(list(self.layers_tmp.iterdir()), [])
+
+
+class CheckOutputFormatTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.state_path = tmp / "docker-state.json"
+
+        patches = [
+            mock.patch.object(output, "DOCKER", FAKE_DOCKER),
+            mock.patch.dict(os.environ, {"FAKE_DOCKER_STATE": str(self.state_path)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def check(self, output_format, **state):
+        self.state_path.write_text(json.dumps(state), encoding="utf-8")
+        return output.check_output_format(output_format)
+
+    def test_docker_driver_with_containerd_store(self):
+        self.assertEqual(self.check("zstd"), [])
+
+    def test_non_docker_driver_is_rejected(self):
+        # docker-container 빌더의 결과는 로컬 이미지 스토어에 저장되지 않음
+        errors = self.check("zstd", buildx_driver="docker-container")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("docker-container", errors[0])
+
+    def test_classic_image_store_is_rejected(self):
+        errors = self.check("estargz", image_store="overlay2")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("containerd image store", errors[0])
+
+    def test_docker_format_needs_nothing(self):
+        self.assertEqual(self.check("docker", image_store="overlay2", buildx_driver="remote"), [])
+        self.assertEqual(json.loads(self.state_path.read_text(encoding="utf-8")).get("calls"), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+빌드 사전 점검 테스트 (tests/fake_docker.py 의 image inspect, pull 사용)
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import apt, preflight  # noqa: E402
+
+
+FAKE_DOCKER = str(TESTS_DIR / "fake_docker.py")
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class RunPreflightTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+        # 빌드 컨텍스트: artifacts/test/requirements*.txt, xaiva-media/, docker/
+        preset_dir = self.tmp / "artifacts" / "test"
+        preset_dir.mkdir(parents=True)
+        for file_name in preflight.REQUIRED_CONTEXT_FILES:
+            (preset_dir / file_name).write_text("", encoding="utf-8")
+        (self.tmp / "xaiva-media").mkdir()
+        (self.tmp / "docker").mkdir()
+
+        self.state_path = self.tmp / "docker-state.json"
+        self.write_state({"images": []})
+
+        patches = [
+            mock.patch.object(preflight, "DOCKER", FAKE_DOCKER),
+            mock.patch.object(preflight, "PROJECT_ROOT", self.tmp),
+            mock.patch.object(preflight, "ARTIFACTS_DIR", self.tmp / "artifacts"),
+            mock.patch.object(preflight, "check_preset_artifacts", return_value=[]),
+            mock.patch.object(apt, "ARTIFACTS_DIR", self.tmp / "artifacts"),
+            mock.patch.dict(os.environ, {"FAKE_DOCKER_STATE": str(self.state_path)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.preset = {"base_image": "nvidia/cuda:11.8.0-devel-ubuntu22.04"}
+
+    def write_state(self, state):
+        self.state_path.write_text(json.dumps(state), encoding="utf-8")
+
+    def read_state(self):
+        return json.loads(self.state_path.read_text(encoding="utf-8"))
+
+    def run_preflight(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            try:
+                return preflight.run_preflight(self.preset, "test", {}, non_interactive=True, **kwargs), stdout
+            except preflight.PreflightError as e:
+                return e, stdout
+
+    def test_success(self):
+        self.write_state({"images": [], "pull": {"seconds": 0}})
+        results, _ = self.run_preflight()
+
+        self.assertEqual(results["warnings"], [])
+        self.assertTrue(results["branch_ok"])
+        self.assertTrue(results["pulled"])
+        self.assertFalse(apt.get_debs_dir("test").exists())
+
+    def test_failure_cancels_pull_and_kills_process(self):
+        self.write_state({"images": [], "pull": {"seconds": 60}})
+
+        def fail_after_pull_started(preset_name):
+            # pull 프로세스가 시작된 뒤에 실패
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                with contextlib.suppress(ValueError):
+                    if self.read_state().get("pull_pids"):
+                        break
+                time.sleep(0.05)
+            raise RuntimeError("artifacts broken")
+
+        started = time.monotonic()
+        with mock.patch.object(preflight, "check_preset_artifacts", side_effect=fail_after_pull_started):
+            error, stdout = self.run_preflight()
+
+        self.assertIsInstance(error, preflight.PreflightError)
+        self.assertIn("artifacts: artifacts broken", str(error))
+        self.assertLess(time.monotonic() - started, 30)
+        self.assertIn("[pull] cancelled", stdout.getvalue())
+
+        pids = self.read_state()["pull_pids"]
+        self.assertEqual(len(pids), 1)
+        self.assertFalse(process_alive(pids[0]))
+
+    def test_pull_failure(self):
+        self.write_state({"images": [], "pull": {"error": "manifest unknown"}})
+        error, _ = self.run_preflight()
+
+        self.assertIsInstance(error, preflight.PreflightError)
+        self.assertIn("pull: docker pull failed", str(error))
+
+    def test_missing_context_cancels_pull(self):
+        self.write_state({"images": [], "pull": {"seconds": 60}})
+        shutil.rmtree(self.tmp / "xaiva-media")
+
+        error, stdout = self.run_preflight()
+
+        self.assertIsInstance(error, preflight.PreflightError)
+        self.assertIn("context: Missing build context files", str(error))
+        for pid in self.read_state().get("pull_pids", []):
+            self.assertFalse(process_alive(pid))
+
+    def test_dry_run_has_no_side_effects(self):
+        results, _ = self.run_preflight(dry_run=True)
+
+        self.assertFalse(results["pulled"])
+        self.assertFalse(apt.get_debs_dir("test").exists())
+        self.assertNotIn("calls", self.read_state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+시작 시간 최적화 테스트 (tests/fake_docker.py 의 run, info 사용)
+
+실행: python3 -m pytest tests/  또는  python3 -m unittest discover tests
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+
+from builder import startup  # noqa: E402
+
+
+FAKE_DOCKER = str(TESTS_DIR / "fake_docker.py")
+
+
+def load_measure_script():
+    """docker/build-scripts/measure-startup.py 를 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location("measure_startup", startup.MEASURE_SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ValidateStartupTest(unittest.TestCase):
+
+    def test_valid(self):
+        self.assertEqual(startup.validate_startup({}), [])
+        self.assertEqual(startup.validate_startup({
+            "enabled": True,
+            "modules": ["numpy", "torch.nn", "XaivaDecoder", "_ctypes"],
+        }), [])
+
+    def test_invalid(self):
+        self.assertEqual(len(startup.validate_startup([])), 1)
+        self.assertEqual(len(startup.validate_startup({"enabled": "yes"})), 1)
+        for modules in ("torch", ["torch; import os"], ["torch", 1], [""]):
+            self.assertEqual(len(startup.validate_startup({"modules": modules})), 1, modules)
+
+
+class ParseImporttimeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.measure = load_measure_script()
+
+    def test_cumulative_time_of_target_module(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:       300 |        450 |     numpy.core\n"
+            "import time:      1000 |       5200 | numpy\n"
+        )
+        self.assertEqual(self.measure.parse_importtime(stderr, "numpy"), (5200, 3))
+
+    def test_ignores_unrelated_lines(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "Traceback (most recent call last):\n"
+            "import time:   broken line\n"
+            "import time:        80 |         80 | encodings\n"
+        )
+        self.assertEqual(self.measure.parse_importtime(stderr, "torch"), (None, 1))
+        self.assertEqual(self.measure.parse_importtime(stderr, None), (None, 1))
+
+
+class FormatStartupReportTest(unittest.TestCase):
+
+    def manifest(self):
+        return {
+            "python": "3.10.12",
+            "gpus": True,
+            "bytecode": {"pyc_files": 1234, "invalidation_mode": "unchecked-hash", "compile_errors": 2, "seconds": 9.5},
+            "ldconfig": {"entries": 567},
+            "phases": {
+                "before": {
+                    "interpreter": {"wall_ms": 20.0},
+                    "modules": {"torch": {"wall_ms": 1000.0}, "XaivaDecoder": {"wall_ms": 300.0}},
+                },
+                "after": {
+                    "interpreter": {"wall_ms": 15.0},
+                    "modules": {
+                        "torch": {"wall_ms": 800.0, "import_us": 750000},
+                        "XaivaDecoder": {"wall_ms": 300.0},
+                        "cv2": {"error": "ModuleNotFoundError: No module named 'cv2'"},
+                    },
+                },
+            },
+        }
+
+    def row(self, lines, name):
+        return next(line for line in lines if line.split()[:1] == [name])
+
+    def test_rows(self):
+        lines = startup.format_startup_report(self.manifest())
+
+        self.assertIn("with GPU", lines[0])
+        self.assertIn("Python 3.10.12", lines[0])
+        self.assertIn("1234 .pyc (unchecked-hash), 2 uncompilable file(s), 9.5s", lines[1])
+        self.assertIn("567 entries", lines[2])
+
+        self.assertEqual(self.row(lines, "(interpreter)").split()[1:], ["20.0", "ms", "15.0", "ms", "-25.0%", "-"])
+        self.assertEqual(self.row(lines, "torch").split()[1:], ["1000.0", "ms", "800.0", "ms", "-20.0%", "750.0", "ms"])
+        self.assertIn("XaivaDecoder *", self.row(lines, "XaivaDecoder"))
+        self.assertIn("+0.0%", self.row(lines, "XaivaDecoder"))
+        self.assertIn("failed", self.row(lines, "cv2"))
+
+    def test_module_missing_before(self):
+        manifest = self.manifest()
+        del manifest["phases"]["before"]["modules"]["torch"]
+        manifest["gpus"] = False
+
+        lines = startup.format_startup_report(manifest)
+        self.assertIn("without GPU", lines[0])
+        self.assertEqual(self.row(lines, "torch").split()[1:4], ["n/a", "800.0", "ms"])
+        self.assertIn("n/a", self.row(lines, "torch").split()[4])
+
+
+class MeasureStartupTest(unittest.TestCase):
+    """fake docker 가 측정 스크립트를 로컬 python3 로 실행"""
+
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+
+        self.state_path = tmp / "docker-state.json"
+        self.state_path.write_text("{}", encoding="utf-8")
+
+        patches = [
+            mock.patch.object(startup, "DOCKER", FAKE_DOCKER),
+            mock.patch.object(startup, "MEASURE_COMMAND", startup.MEASURE_COMMAND.replace("/tmp/", f"{tmp}/")),
+            mock.patch.dict(os.environ, {"FAKE_DOCKER_STATE": str(self.state_path)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def calls(self):
+        return json.loads(self.state_path.read_text(encoding="utf-8"))["calls"]
+
+    def test_measures_in_new_container(self):
+        result = startup.measure_startup("xaiva-kit:test", ["json", "xaiva_kit_no_such_module"], "after", gpus=True)
+
+        self.assertEqual(result["python"], "{}.{}.{}".format(*sys.version_info[:3]))
+        self.assertGreater(result["interpreter"]["wall_ms"], 0)
+        self.assertIn("import_us", result["modules"]["json"])
+        self.assertIn("error", result["modules"]["xaiva_kit_no_such_module"])
+
+        call = self.calls()[-1]
+        self.assertEqual(call[:5], ["run", "--rm", "-i", "--gpus", "all"])
+        self.assertIn("xaiva-kit:test", call)
+
+    def test_failed_container_is_reported(self):
+        with mock.patch.object(startup, "MEASURE_COMMAND", "echo 'no python3' >&2; exit 127"):
+            result = startup.measure_startup("xaiva-kit:test", ["json"], "before")
+
+        self.assertEqual(result, {"error": "no python3"})
+        self.assertNotIn("--gpus", self.calls()[-1])
+
+    def test_gpu_runtime_detection(self):
+        self.assertFalse(startup.has_gpu_runtime())
+        self.state_path.write_text(json.dumps({"runtimes": ["runc", "nvidia"]}), encoding="utf-8")
+        self.assertTrue(startup.has_gpu_runtime())
+
+    def test_report_skips_failed_measurement(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            startup.report_startup("{}", {"error": "boom"}, {"interpreter": {"wall_ms": 1.0}}, False)
+        self.assertIn("before", stdout.getvalue())
+        self.assertNotIn("Startup Report", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()